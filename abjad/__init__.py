@@ -28,51 +28,79 @@ from abjad.tools.systemtools.AbjadConfiguration import AbjadConfiguration
 abjad_configuration = AbjadConfiguration()
 del AbjadConfiguration
 
-# import all tools packages
-from abjad.tools import *
-from abjad.tools.abctools import *
-from abjad.tools.agenttools import *
-from abjad.tools.datastructuretools import *
-from abjad.tools.datastructuretools import PatternList
+# import all tools packages lazily
+from abjad.tools.systemtools.ImportManager import ImportManager
+ImportManager.import_public_names_from_modules_into_namespace(
+    [
+        'abjad.tools',
+        'abjad.tools.abctools',
+        'abjad.tools.agenttools',
+        'abjad.tools.datastructuretools',
+        'abjad.tools.durationtools',
+        'abjad.tools.exceptiontools',
+        'abjad.tools.indicatortools',
+        'abjad.tools.lilypondfiletools',
+        'abjad.tools.lilypondnametools',
+        'abjad.tools.markuptools',
+        'abjad.tools.pitchtools',
+        'abjad.tools.schemetools',
+        'abjad.tools.scoretools',
+        'abjad.tools.selectiontools',
+        'abjad.tools.selectortools',
+        'abjad.tools.spannertools',
+        'abjad.tools.systemtools',
+        'abjad.tools.topleveltools',
+        ],
+    globals(),
+    lazy=True,
+    )
+ImportManager.import_public_names_from_modules_into_namespace(
+    ['abjad.tools.instrumenttools'],
+    globals(),
+    names=['Instrument'],
+    lazy=True,
+    )
+from abjad.tools.datastructuretools import Pattern
 index = Pattern.index
 index_all = Pattern.index_all
 index_every = Pattern.index_every
 index_first = Pattern.index_first
 index_last = Pattern.index_last
-from abjad.tools.durationtools import *
-from abjad.tools.exceptiontools import *
-from abjad.tools.indicatortools import *
-from abjad.tools.instrumenttools import Instrument
-from abjad.tools.lilypondfiletools import *
-from abjad.tools.lilypondnametools import *
-from abjad.tools.markuptools import *
-from abjad.tools.pitchtools import *
-from abjad.tools.schemetools import *
-from abjad.tools.scoretools import *
-from abjad.tools.selectiontools import *
-from abjad.tools.selectortools import *
-from abjad.tools.spannertools import *
-from abjad.tools.systemtools import *
-from abjad.tools.topleveltools import *
 
 # mathtools classes (but not functions)
 from abjad.tools.mathtools import Infinity
 Infinity = Infinity()
-from abjad.tools.mathtools import Enumerator
-from abjad.tools.mathtools import NonreducedFraction
-from abjad.tools.mathtools import NonreducedRatio
-from abjad.tools.mathtools import Ratio
-from abjad.tools.metertools import Meter
-from abjad.tools.metertools import MeterList
-from abjad.tools.metertools import MeterManager
-from abjad.tools.metertools import MetricAccentKernel
-from abjad.tools.metertools import OffsetCounter
+ImportManager.import_public_names_from_modules_into_namespace(
+    ['abjad.tools.mathtools'],
+    globals(),
+    names=['Enumerator', 'NonreducedFraction', 'NonreducedRatio', 'Ratio'],
+    lazy=True,
+    )
+ImportManager.import_public_names_from_modules_into_namespace(
+    ['abjad.tools.metertools'],
+    globals(),
+    names=[
+        'Meter',
+        'MeterList',
+        'MeterManager',
+        'MetricAccentKernel',
+        'OffsetCounter',
+        ],
+    lazy=True,
+    )
 
 # timespantools classes (but not functions)
-from abjad.tools.timespantools import AnnotatedTimespan
-from abjad.tools.timespantools import Timespan
-from abjad.tools.timespantools import TimespanInequality
-from abjad.tools.timespantools import TimespanList
+ImportManager.import_public_names_from_modules_into_namespace(
+    ['abjad.tools.timespantools'],
+    globals(),
+    names=[
+        'AnnotatedTimespan',
+        'Timespan',
+        'TimespanInequality',
+        'TimespanList',
+        ],
+    lazy=True,
+    )
 
 # rhythm-maker static methods
 from abjad.tools.rhythmmakertools import SilenceMask
@@ -91,7 +119,6 @@ sustain_last = SustainMask.sustain_last
 
 # import custom exceptions into the builtins module
 import os
-from abjad.tools.systemtools.ImportManager import ImportManager
 ImportManager.import_public_names_from_path_into_namespace(
     os.path.join(__path__[0], 'tools', 'exceptiontools'),
     __builtins__,
@@ -110,9 +137,17 @@ def f(argument):
     else:
         print(format(argument, 'lilypond'))
 
-from abjad import demos
-from abjad import ext
-from abjad import ly
+# import demos, extensions and LilyPond data lazily
+from abjad.tools.systemtools.ImportManager import ImportManager
+ImportManager._install_lazy_names(
+    globals(),
+    {
+        'demos': ('abjad.demos', None),
+        'ext': ('abjad.ext', None),
+        'ly': ('abjad.ly', None),
+        },
+    )
+del ImportManager
 
 # HOUSECLEANING HELPER: uncomment below and run tests;
 #                       checks for hasattr() calls against properties:
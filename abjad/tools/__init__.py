@@ -7,4 +7,5 @@ systemtools.ImportManager.import_structured_package(
     globals(),
     delete_systemtools=False,
     ignored_names=['abjadbooktools'],
+    lazy=True,
     )
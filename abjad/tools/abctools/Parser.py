@@ -3,7 +3,6 @@ import abc
 import logging
 import os
 import pickle
-import ply
 import traceback
 from abjad.tools.abctools.AbjadObject import AbjadObject
 
@@ -26,9 +25,13 @@ class Parser(AbjadObject):
         '_parser',
         )
 
+    _parser_tables = {}
+
     ### INITIALIZER ###
 
     def __init__(self, debug=False):
+        import ply.lex
+        import ply.yacc
 
         self._debug = bool(debug)
         self._lexer = None
@@ -46,6 +49,13 @@ class Parser(AbjadObject):
             self._logger = logging.getLogger()
             self._logger.addHandler(logging.NullHandler())
 
+        parser_tables = None
+        if not self.debug:
+            parser_tables = Parser._parser_tables.get(type(self))
+        if parser_tables is not None:
+            self._make_lexer_and_parser(*parser_tables)
+            return
+
         self._lexer = ply.lex.lex(
             debug=self.debug,
             debuglog=self.logger,
@@ -71,6 +81,18 @@ class Parser(AbjadObject):
             picklefile=self.pickle_path,
             )
 
+        if not self.debug:
+            productions = [
+                (_.str, _.name, _.len, _.func, _.file, _.line)
+                for _ in self._parser.productions
+                ]
+            Parser._parser_tables[type(self)] = (
+                self._lexer.clone(),
+                self._parser.action,
+                self._parser.goto,
+                productions,
+                )
+
     ### SPECIAL METHODS ###
 
     def __call__(self, input_string):
@@ -95,6 +117,35 @@ class Parser(AbjadObject):
 
         return result
 
+    ### PRIVATE METHODS ###
+
+    def _make_lexer_and_parser(self, lexer, action, goto, productions):
+        r'''Makes lexer and parser from parse tables already built for this
+        class of parser.
+
+        Skips grammar reflection, validation and table loading.
+        '''
+        import ply.yacc
+        lexer = lexer.clone(object=self.lexer_rules_object)
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        self._lexer = lexer
+        table = ply.yacc.LRTable()
+        table.lr_action = action
+        table.lr_goto = goto
+        table.lr_productions = [
+            ply.yacc.MiniProduction(*_) for _ in productions
+            ]
+        parser_rules_object = self.parser_rules_object
+        for production in table.lr_productions:
+            if production.func:
+                production.callable = getattr(
+                    parser_rules_object,
+                    production.func,
+                    )
+        error_function = getattr(parser_rules_object, 'p_error', None)
+        self._parser = ply.yacc.LRParser(table, error_function)
+
     ### PUBLIC METHODS ###
 
     def tokenize(self, input_string):
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import abjad
+import platform
+import pytest
+import time
+from abjad.tools import abctools
+from abjad.tools import lilypondparsertools
+from abjad.tools import rhythmtreetools
+
+
+def test_abctools_Parser__make_lexer_and_parser_01():
+    r'''Parsers built from cached parse tables parse like freshly built
+    parsers.
+    '''
+
+    string = r"\new Staff { c'4 ( d'4 ) \times 2/3 { e'8 f'8 g'8 } }"
+    class_ = lilypondparsertools.LilyPondParser
+    parser_tables = abctools.Parser._parser_tables.pop(class_, None)
+    try:
+        uncached_parser = class_()
+        parser = class_()
+        assert parser._parser.action is uncached_parser._parser.action
+        staff = parser(string)
+        assert format(staff) == format(uncached_parser(string))
+        parser_2 = lilypondparsertools.LilyPondParser()
+        assert parser_2._parser.action is parser._parser.action
+        assert parser_2._lexer is not parser._lexer
+        assert format(parser_2(string)) == format(staff)
+        assert format(parser(string)) == format(staff)
+    finally:
+        if parser_tables is not None:
+            abctools.Parser._parser_tables[class_] = parser_tables
+
+    parser = lilypondparsertools.ReducedLyParser()
+    parser_2 = lilypondparsertools.ReducedLyParser()
+    string = "c'4 r8. | 3/4 c'4 c'2 | 5/3 { c'4 d'8 }"
+    assert format(parser(string)) == format(parser_2(string))
+
+    parser = rhythmtreetools.RhythmTreeParser()
+    parser_2 = rhythmtreetools.RhythmTreeParser()
+    string = '(1 (1 (2 (1 1 1)) 2))'
+    assert parser(string)[0].rtm_format == parser_2(string)[0].rtm_format
+
+
+def test_abctools_Parser__make_lexer_and_parser_02():
+    r'''Parsing functions reuse parser instances.
+    '''
+
+    container = abjad.Container("abj: c'8 d'8 e'8")
+    assert len(container) == 3
+    container = abjad.Container("abj: | 2/4 c'4 d'4 |")
+    assert len(container) == 1
+    container = abjad.parse("abj: c'8 d'8 e'8")
+    assert len(container) == 3
+    tuplet = abjad.parse('rtm: (1 (1 1 1))')
+    assert len(tuplet) == 3
+    tuplet = abjad.parse('rtm: (1 (1 1 1 1 1))')
+    assert len(tuplet) == 5
+
+
+def test_abctools_Parser__make_lexer_and_parser_03():
+    r'''Parsers built from persisted parse tables parse like parsers built
+    from cached parse tables.
+    '''
+
+    string = "c'4 r8. | 3/4 c'4 c'2 | 5/3 { c'4 d'8 }"
+    class_ = lilypondparsertools.ReducedLyParser
+    parser_tables = abctools.Parser._parser_tables.pop(class_, None)
+    try:
+        uncached_parser = class_()
+        assert class_ in abctools.Parser._parser_tables
+        parser = class_()
+        assert parser._parser.action is uncached_parser._parser.action
+        assert format(parser(string)) == format(uncached_parser(string))
+    finally:
+        if parser_tables is not None:
+            abctools.Parser._parser_tables[class_] = parser_tables
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_abctools_Parser__make_lexer_and_parser_04():
+    r'''Benchmarks parser startup with and without cached parse tables.
+    '''
+
+    iterations = 10
+    class_ = lilypondparsertools.LilyPondParser
+    parser_tables = abctools.Parser._parser_tables.pop(class_, None)
+    try:
+        uncached_time = 0
+        for _ in range(iterations):
+            abctools.Parser._parser_tables.pop(class_, None)
+            start_time = time.time()
+            class_()
+            uncached_time += time.time() - start_time
+        start_time = time.time()
+        for _ in range(iterations):
+            class_()
+        cached_time = time.time() - start_time
+    finally:
+        if parser_tables is not None:
+            abctools.Parser._parser_tables[class_] = parser_tables
+    print('Parser startup without cached tables:', uncached_time)
+    print('Parser startup with cached tables:', cached_time)
@@ -21,7 +21,7 @@ class AbjadBookConsole(code.InteractiveConsole):
         ):
         import abjad
         if locals is None:
-            locals = abjad.__dict__.copy()
+            locals = abjad.systemtools.ImportManager.get_namespace(abjad)
         locals['__builtins__'] = __builtins__.copy()
         locals['__name__'] = '__main__'
         locals['__package__'] = None
@@ -50,8 +50,10 @@ class AbjadBookConsole(code.InteractiveConsole):
         restored. Otherwise Sphinx's autodoc extension will discover the
         abjad-book function proxies and not the originals.
         '''
+        from abjad.tools import systemtools
         topleveltools = self.locals['topleveltools']
-        self.cached_topleveltools_dict = topleveltools.__dict__.copy()
+        self.cached_topleveltools_dict = \
+            systemtools.ImportManager.get_namespace(topleveltools)
 
     def showsyntaxerror(self, filename=None):
         r'''Proxies Python's InteractiveConsole.showsyntaxerror().
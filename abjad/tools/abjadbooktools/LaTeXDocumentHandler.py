@@ -121,7 +121,7 @@ class LaTeXDocumentHandler(abctools.AbjadObject):
             verbose=verbose,
             )
         self._errored = False
-        namespace = abjad.__dict__.copy()
+        namespace = systemtools.ImportManager.get_namespace(abjad)
         namespace['abjad'] = abjad
         console = abjadbooktools.AbjadBookConsole(
             document_handler=self,
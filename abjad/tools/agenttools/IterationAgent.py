@@ -3,7 +3,6 @@ from __future__ import print_function
 import collections
 import inspect
 from abjad.tools import abctools
-from abjad.tools import durationtools
 from abjad.tools import mathtools
 from abjad.tools import scoretools
 from abjad.tools import spannertools
@@ -4123,79 +4122,18 @@ class IterationAgent(abctools.AbjadObject):
         from abjad.tools import selectiontools
         if self._expression:
             return self._update_expression(inspect.currentframe())
-        def _buffer_components_starting_with(component, buffer, stop_offsets):
-            buffer.append(component)
-            stop_offsets.append(component._get_timespan().stop_offset)
-            if isinstance(component, scoretools.Container):
-                if component.is_simultaneous:
-                    for x in component:
-                        _buffer_components_starting_with(
-                            x, buffer, stop_offsets)
-                else:
-                    if component:
-                        _buffer_components_starting_with(
-                            component[0], buffer, stop_offsets)
-        def _iterate_vertical_moments(argument):
-            #if not isinstance(argument, scoretools.Component):
-            #    raise TypeError
-            governors = (argument,)
-            current_offset, stop_offsets, buffer = \
-                durationtools.Offset(0), [], []
-            _buffer_components_starting_with(argument, buffer, stop_offsets)
-            while buffer:
-                vertical_moment = selectiontools.VerticalMoment()
-                offset = durationtools.Offset(current_offset)
-                components = list(buffer)
-                components.sort(key=lambda x: x._get_parentage().score_index)
-                vertical_moment._offset = offset
-                vertical_moment._governors = governors
-                vertical_moment._components = components
-                yield vertical_moment
-                current_offset, stop_offsets = min(stop_offsets), []
-                _update_buffer(current_offset, buffer, stop_offsets)
-        def _next_in_parent(component):
-            from abjad.tools import selectiontools
-            if not isinstance(component, scoretools.Component):
-                raise TypeError
-            selection = selectiontools.Selection(component)
-            parent, start, stop = \
-                selection._get_parent_and_start_stop_indices()
-            assert start == stop
-            if parent is None:
-                raise StopIteration
-            # can not advance within simultaneous parent
-            if parent.is_simultaneous:
-                raise StopIteration
-            try:
-                return parent[start + 1]
-            except IndexError:
-                raise StopIteration
-        def _update_buffer(current_offset, buffer, stop_offsets):
-            #print 'At %s with %s ...' % (current_offset, buffer)
-            for component in buffer[:]:
-                if component._get_timespan().stop_offset <= current_offset:
-                    buffer.remove(component)
-                    try:
-                        next_component = _next_in_parent(component)
-                        _buffer_components_starting_with(
-                            next_component, buffer, stop_offsets)
-                    except StopIteration:
-                        pass
-                else:
-                    stop_offsets.append(component._get_timespan().stop_offset)
+        class_ = selectiontools.VerticalMoment
         def _closure():
             if not reverse:
-                for x in _iterate_vertical_moments(self._client):
+                for x in class_._iterate_vertical_moments(self._client):
                     yield x
             else:
-                moments_in_governor = []
-                for component in self.by_class():
-                    offset = component._get_timespan().start_offset
-                    if offset not in moments_in_governor:
-                        moments_in_governor.append(offset)
-                moments_in_governor.sort()
-                for moment_in_governor in reversed(moments_in_governor):
-                    yield self._client._get_vertical_moment_at(moment_in_governor)
+                start_offsets = set(
+                    _._get_timespan().start_offset for _ in self.by_class())
+                vertical_moments = class_._make_vertical_moments(self._client)
+                for vertical_moment in reversed(vertical_moments):
+                    if vertical_moment.offset in start_offsets:
+                        yield vertical_moment
         return _closure()
 
     def depth_first(
@@ -46,12 +46,17 @@ class PersistenceAgent(abctools.AbjadObject):
         self,
         ly_file_path=None,
         illustrate_function=None,
+        processes=None,
         **keywords
         ):
         r'''Persists client as LilyPond file.
 
         Autogenerates file path when `ly_file_path` is none.
 
+        Streams LilyPond format to file piece by piece. Set `processes` to
+        an integer greater than 1 to format the contexts of large scores in
+        parallel.
+
         ..  container:: example
 
             ::
@@ -81,21 +86,38 @@ class PersistenceAgent(abctools.AbjadObject):
         else:
             ly_file_path = os.path.expanduser(ly_file_path)
         assert ly_file_path.endswith('.ly'), ly_file_path
-        timer = systemtools.Timer()
-        with timer:
-            lilypond_format = format(illustration, 'lilypond')
-        abjad_formatting_time = timer.elapsed_time
         directory = os.path.dirname(ly_file_path)
         systemtools.IOManager._ensure_directory_existence(directory)
-        with open(ly_file_path, 'w') as file_pointer:
-            file_pointer.write(lilypond_format)
+        manager = systemtools.LilyPondFormatManager
+        timer = systemtools.Timer()
+        try:
+            with timer, open(ly_file_path, 'w') as file_pointer:
+                manager.write_lilypond_format(
+                    illustration,
+                    file_pointer,
+                    processes=processes,
+                    )
+        except:
+            if os.path.exists(ly_file_path):
+                os.remove(ly_file_path)
+            raise
+        abjad_formatting_time = timer.elapsed_time
         return ly_file_path, abjad_formatting_time
 
-    def as_midi(self, midi_file_path=None, remove_ly=False, **keywords):
+    def as_midi(
+        self,
+        midi_file_path=None,
+        remove_ly=False,
+        render_cache=None,
+        **keywords
+        ):
         r'''Persists client as MIDI file.
 
         Autogenerates file path when `midi_file_path` is none.
 
+        Copies MIDI file from `render_cache` instead of running LilyPond when
+        `render_cache` holds output rendered from identical LilyPond source.
+
         ..  container:: example
 
             ::
@@ -126,18 +148,27 @@ class PersistenceAgent(abctools.AbjadObject):
             ly_file_path = None
         result = type(self)(illustration).as_ly(ly_file_path, **keywords)
         ly_file_path, abjad_formatting_time = result
-        timer = systemtools.Timer()
-        with timer:
-            systemtools.IOManager.run_lilypond(ly_file_path)
-        lilypond_rendering_time = timer.elapsed_time
         if os.name == 'nt':
             extension = 'mid'
         else:
             extension = 'midi'
-        midi_file_path = '{}.{}'.format(
-            os.path.splitext(ly_file_path)[0],
-            extension,
-            )
+        without_extension = os.path.splitext(ly_file_path)[0]
+        midi_file_path = '{}.{}'.format(without_extension, extension)
+        timer = systemtools.Timer()
+        with timer:
+            cached_file_paths = None
+            if render_cache is not None:
+                key = render_cache.get_key(ly_file_path, extension=extension)
+                cached_file_paths = render_cache.get(key, without_extension)
+            if cached_file_paths is None:
+                success = systemtools.IOManager.run_lilypond(ly_file_path)
+                if (
+                    success and
+                    render_cache is not None and
+                    os.path.isfile(midi_file_path)
+                    ):
+                    render_cache.put(key, without_extension, [midi_file_path])
+        lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
         return midi_file_path, abjad_formatting_time, lilypond_rendering_time
@@ -194,12 +225,16 @@ class PersistenceAgent(abctools.AbjadObject):
         pdf_file_path=None,
         illustrate_function=None,
         remove_ly=False,
+        render_cache=None,
         **keywords
         ):
         r'''Persists client as PDF.
 
         Autogenerates file path when `pdf_file_path` is none.
 
+        Copies PDF from `render_cache` instead of running LilyPond when
+        `render_cache` holds output rendered from identical LilyPond source.
+
         ..  container:: example
 
             ::
@@ -234,7 +269,16 @@ class PersistenceAgent(abctools.AbjadObject):
         pdf_file_path = '{}.pdf'.format(without_extension)
         timer = systemtools.Timer()
         with timer:
-            success = systemtools.IOManager.run_lilypond(ly_file_path)
+            cached_file_paths = None
+            if render_cache is not None:
+                key = render_cache.get_key(ly_file_path, extension='pdf')
+                cached_file_paths = render_cache.get(key, without_extension)
+            if cached_file_paths is None:
+                success = systemtools.IOManager.run_lilypond(ly_file_path)
+                if success and render_cache is not None:
+                    render_cache.put(key, without_extension, [pdf_file_path])
+            else:
+                success = True
         lilypond_rendering_time = timer.elapsed_time
         if remove_ly:
             os.remove(ly_file_path)
@@ -250,6 +294,7 @@ class PersistenceAgent(abctools.AbjadObject):
         png_file_path=None,
         remove_ly=False,
         illustrate_function=None,
+        render_cache=None,
         **keywords
         ):
         r'''Persists client as PNG.
@@ -288,6 +333,9 @@ class PersistenceAgent(abctools.AbjadObject):
 
         Autogenerates file path when `png_file_path` is none.
 
+        Copies PNGs from `render_cache` instead of running LilyPond when
+        `render_cache` holds output rendered from identical LilyPond source.
+
         Returns output path(s), elapsed formatting time and elapsed rendering
         time.
         '''
@@ -308,38 +356,57 @@ class PersistenceAgent(abctools.AbjadObject):
 
         ly_file_path, abjad_formatting_time = result
 
-        original_directory = os.path.split(ly_file_path)[0]
-        original_ly_file_path = ly_file_path
-        temporary_directory = tempfile.mkdtemp()
-        temporary_ly_file_path = os.path.join(
-            temporary_directory,
-            os.path.split(ly_file_path)[1],
-            )
-        shutil.copy(original_ly_file_path, temporary_ly_file_path)
-
-        timer = systemtools.Timer()
-        with timer:
-            success = systemtools.IOManager.run_lilypond(
-                temporary_ly_file_path,
-                flags='--png',
-                )
-        lilypond_rendering_time = timer.elapsed_time
-
-        png_file_paths = []
-        for file_name in os.listdir(temporary_directory):
-            if not file_name.endswith('.png'):
-                continue
-            source_png_file_path = os.path.join(
+        without_extension = os.path.splitext(ly_file_path)[0]
+        png_file_paths = None
+        if render_cache is not None:
+            timer = systemtools.Timer()
+            with timer:
+                key = render_cache.get_key(
+                    ly_file_path,
+                    flags='--png',
+                    extension='png',
+                    )
+                png_file_paths = render_cache.get(key, without_extension)
+            lilypond_rendering_time = timer.elapsed_time
+            success = True
+
+        if png_file_paths is None:
+            original_directory = os.path.split(ly_file_path)[0]
+            original_ly_file_path = ly_file_path
+            temporary_directory = tempfile.mkdtemp()
+            temporary_ly_file_path = os.path.join(
                 temporary_directory,
-                file_name,
-                )
-            target_png_file_path = os.path.join(
-                original_directory,
-                file_name,
+                os.path.split(ly_file_path)[1],
                 )
-            shutil.move(source_png_file_path, target_png_file_path)
-            png_file_paths.append(target_png_file_path)
-        shutil.rmtree(temporary_directory)
+            shutil.copy(original_ly_file_path, temporary_ly_file_path)
+
+            timer = systemtools.Timer()
+            with timer:
+                success = systemtools.IOManager.run_lilypond(
+                    temporary_ly_file_path,
+                    flags='--png',
+                    )
+            lilypond_rendering_time = timer.elapsed_time
+
+            png_file_paths = []
+            for file_name in os.listdir(temporary_directory):
+                if not file_name.endswith('.png'):
+                    continue
+                source_png_file_path = os.path.join(
+                    temporary_directory,
+                    file_name,
+                    )
+                target_png_file_path = os.path.join(
+                    original_directory,
+                    file_name,
+                    )
+                shutil.move(source_png_file_path, target_png_file_path)
+                png_file_paths.append(target_png_file_path)
+            shutil.rmtree(temporary_directory)
+            if success and render_cache is not None:
+                render_cache.put(key, without_extension, png_file_paths)
+        else:
+            png_file_paths = list(png_file_paths)
 
         if remove_ly:
             os.remove(ly_file_path)
@@ -2,6 +2,21 @@
 import abjad
 
 
+def _make_staff(measure_count):
+    staff = abjad.Staff()
+    for i in range(measure_count):
+        measure = abjad.Measure((4, 4), r"c'8 -. d'8 -> e'8 \p f'8 g'4 ~ g'8 r8")
+        staff.append(measure)
+    leaves = abjad.select(staff).by_leaf()
+    for i in range(0, len(leaves) - 4, 7):
+        abjad.attach(abjad.Beam(), leaves[i:i + 4])
+        abjad.attach(abjad.Slur(), leaves[i + 1:i + 4])
+    abjad.override(leaves[0]).note_head.color = 'red'
+    abjad.setting(staff).instrument_name = abjad.Markup('Violin')
+    abjad.attach(abjad.Clef('bass'), leaves[0])
+    return staff
+
+
 def test_agenttools_MutationAgent_copy_01():
     r'''Deep copies components.
     Deep copies spanners that abjad.attach to client.
@@ -919,3 +934,93 @@ def test_agenttools_MutationAgent_copy_18():
 
     assert abjad.inspect(staff).is_well_formed()
     assert abjad.inspect(new_staff).is_well_formed()
+
+
+def test_agenttools_MutationAgent_copy_19():
+    r'''Copies spanners, overrides, settings and indicators.
+    '''
+
+    staff = _make_staff(4)
+    new_staff = abjad.mutate(staff).copy()
+
+    assert format(new_staff) == format(staff)
+    leaves = abjad.select(staff).by_leaf()
+    new_leaves = abjad.select(new_staff).by_leaf()
+    for leaf, new_leaf in zip(leaves, new_leaves):
+        spanners = abjad.inspect(leaf).get_spanners()
+        new_spanners = abjad.inspect(new_leaf).get_spanners()
+        assert len(new_spanners) == len(spanners)
+        assert not set(new_spanners) & set(spanners)
+    clef = abjad.inspect(new_leaves[-1]).get_effective(abjad.Clef)
+    assert clef == abjad.Clef('bass')
+    assert abjad.inspect(new_staff).is_well_formed()
+
+
+def test_agenttools_MutationAgent_copy_20():
+    r'''Changing copy leaves original unchanged and vice versa.
+    '''
+
+    staff = _make_staff(2)
+    expected_format = format(staff)
+    new_staff = abjad.mutate(staff).copy()
+    new_leaves = abjad.select(new_staff).by_leaf()
+    abjad.override(new_leaves[0]).note_head.color = 'blue'
+    abjad.override(new_leaves[1]).stem.color = 'blue'
+    abjad.setting(new_staff).instrument_name = abjad.Markup('Viola')
+    abjad.detach(abjad.Clef, new_leaves[0])
+    abjad.attach(abjad.Clef('alto'), new_leaves[0])
+    abjad.detach(abjad.Beam, new_leaves[0])
+    abjad.attach(abjad.Fermata(), new_leaves[2])
+    new_leaves[3].written_pitch = "b'"
+    new_staff[0].append("c''8")
+
+    assert format(staff) == expected_format
+
+    new_staff = abjad.mutate(staff).copy()
+    expected_format = format(new_staff)
+    leaves = abjad.select(staff).by_leaf()
+    abjad.override(leaves[0]).note_head.color = 'green'
+    abjad.setting(staff).instrument_name = abjad.Markup('Cello')
+    abjad.detach(abjad.Slur, leaves[1])
+
+    assert format(new_staff) == expected_format
+
+
+def test_agenttools_MutationAgent_copy_21():
+    r'''Copies large staff without sharing components.
+    '''
+
+    staff = _make_staff(40)
+    new_staff = abjad.mutate(staff).copy()
+
+    assert format(new_staff) == format(staff)
+    component_ids = set(id(_) for _ in abjad.iterate(staff).by_class())
+    assert not any(
+        id(_) in component_ids
+        for _ in abjad.iterate(new_staff).by_class()
+        )
+
+
+def test_agenttools_MutationAgent_copy_22():
+    r'''Managers fetched before copy do not write through to copy.
+    '''
+
+    staff = _make_staff(2)
+    leaf = abjad.select(staff).by_leaf()[0]
+    staff_override = abjad.override(staff)
+    staff_setting = abjad.setting(staff)
+    leaf_override = abjad.override(leaf)
+    staff_override.staff_symbol.color = 'blue'
+    new_staff = abjad.mutate(staff).copy()
+    expected_format = format(new_staff)
+    staff_override.note_head.color = 'red'
+    staff_setting.instrument_name = abjad.Markup('Viola')
+    leaf_override.stem.color = 'red'
+
+    assert format(new_staff) == expected_format
+    assert format(staff) != expected_format
+
+    staff_override = abjad.override(new_staff)
+    staff_override.note_head.color = 'green'
+
+    assert 'green' not in format(staff)
@@ -30,3 +30,20 @@ def test_agenttools_PersistenceAgent_as_ly_02():
         assert os.path.isfile(ly_path)
         abjad.persist(note).as_ly(ly_path)
         assert os.path.isfile(ly_path)
+
+
+def test_agenttools_PersistenceAgent_as_ly_03():
+    r'''Agent abjad.persists LilyPond file with contexts formatted in
+    parallel.
+    '''
+
+    staff_group = abjad.StaffGroup([
+        abjad.Staff("c'4 d'4 e'4 f'4"),
+        abjad.Staff("g4 a4 b4 c'4"),
+        ])
+    score = abjad.Score([staff_group])
+    with abjad.FilesystemState(remove=[ly_path]):
+        abjad.persist(score).as_ly(ly_path, processes=2)
+        with open(ly_path, 'r') as file_pointer:
+            lilypond_format = file_pointer.read()
+        assert lilypond_format == format(score.__illustrate__())
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import abjad
 import os
+import sys
 configuration = abjad.AbjadConfiguration()
 ly_path = os.path.join(
     configuration.abjad_directory,
@@ -36,3 +37,57 @@ def test_agenttools_PersistenceAgent_as_pdf_02():
         os.remove(ly_path)
         abjad.persist(note).as_pdf(pdf_path)
         assert os.path.isfile(pdf_path)
+
+
+def test_agenttools_PersistenceAgent_as_pdf_03():
+    r'''Agent abjad.persists PDF from render cache without running LilyPond
+    when LilyPond source is unchanged.
+    '''
+
+    directory = os.path.join(configuration.abjad_directory, 'test_as_pdf')
+    fake_lilypond_path = os.path.join(directory, 'lilypond')
+    count_path = os.path.join(directory, 'count.txt')
+    lines = [
+        '#! {}'.format(sys.executable),
+        'import sys',
+        "if sys.argv[-1] == '--version':",
+        "    print('GNU LilyPond 2.19.0')",
+        '    sys.exit(0)',
+        "with open({!r}, 'a') as file_pointer:".format(count_path),
+        "    file_pointer.write('x')",
+        "with open(sys.argv[-2] + '.pdf', 'w') as file_pointer:",
+        "    file_pointer.write(open(sys.argv[-1]).read())",
+        ]
+    render_cache = abjad.RenderCache(
+        directory=os.path.join(directory, 'cache'),
+        )
+    lilypond_path = abjad.abjad_configuration.get('lilypond_path')
+    lilypond_version_string = \
+        abjad.AbjadConfiguration._lilypond_version_string
+    note = abjad.Note("c'4")
+    with abjad.FilesystemState(remove=paths + [directory]):
+        os.makedirs(directory)
+        with open(fake_lilypond_path, 'w') as file_pointer:
+            file_pointer.write('\n'.join(lines) + '\n')
+        os.chmod(fake_lilypond_path, 0o755)
+        abjad.abjad_configuration['lilypond_path'] = fake_lilypond_path
+        abjad.AbjadConfiguration._lilypond_version_string = None
+        try:
+            for _ in range(2):
+                result = abjad.persist(note).as_pdf(
+                    pdf_path,
+                    render_cache=render_cache,
+                    )
+                assert result[0] == pdf_path
+                assert result[-1] is True
+                os.remove(pdf_path)
+            note.written_pitch = "d'"
+            abjad.persist(note).as_pdf(pdf_path, render_cache=render_cache)
+            with open(pdf_path, 'r') as file_pointer:
+                assert "d'4" in file_pointer.read()
+            with open(count_path, 'r') as file_pointer:
+                assert file_pointer.read() == 'xx'
+        finally:
+            abjad.abjad_configuration['lilypond_path'] = lilypond_path
+            abjad.AbjadConfiguration._lilypond_version_string = \
+                lilypond_version_string
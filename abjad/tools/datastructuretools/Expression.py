@@ -3,6 +3,7 @@ try:
     import funcsigs
 except ImportError:
     import inspect as funcsigs
+import collections
 import inspect
 import numbers
 from abjad.tools import systemtools
@@ -129,6 +130,12 @@ class Expression(AbjadValueObject):
         '_subexpressions',
         )
 
+    _compiled_callables = collections.OrderedDict()
+
+    _compiled_callables_size = 1024
+
+    _globals = None
+
     _private_attributes_to_copy = []
 
     _publish_storage_format = True
@@ -583,6 +590,21 @@ class Expression(AbjadValueObject):
         markup = abjad.new(markup, direction=direction)
         return markup
 
+    def _compile(self, statement, argument_count):
+        key = (statement, argument_count)
+        compiled_callables = Expression._compiled_callables
+        callable_ = compiled_callables.pop(key, None)
+        if callable_ is None:
+            globals_ = self._make_globals()
+            names = ('__argument_' + str(_) for _ in range(argument_count))
+            source = 'lambda {}: {}'.format(', '.join(names), statement)
+            callable_ = eval(source, globals_)
+            size = Expression._compiled_callables_size
+            while size <= len(compiled_callables):
+                compiled_callables.popitem(last=False)
+        compiled_callables[key] = callable_
+        return callable_
+
     def _compile_callback_strings(self, name):
         string = name
         previous_callback = None
@@ -624,7 +646,6 @@ class Expression(AbjadValueObject):
                 arguments,
                 )
             raise Exception(message)
-        globals_ = self._make_globals()
         statement = self.evaluation_template
         strings = []
         if self.is_initializer:
@@ -633,7 +654,6 @@ class Expression(AbjadValueObject):
                     continue
                 string = '__argument_{i}'
                 string = string.format(i=i)
-                globals_[string] = argument
                 strings.append(string)
             keywords_ = self.keywords or {}
             keywords_.update(keywords)
@@ -654,10 +674,8 @@ class Expression(AbjadValueObject):
                 statement = statement.replace('{}', '')
             else:
                 strings = []
-                __argument_0 = arguments[0]
                 for i, argument in enumerate(arguments):
                     string = '__argument_' + str(i)
-                    globals_[string] = argument
                     strings.append(string)
                 try:
                     statement = statement.format(*strings)
@@ -666,30 +684,26 @@ class Expression(AbjadValueObject):
                     message = message.format(statement, exception.args[0])
                     raise type(exception)(message)
         try:
-            result = eval(statement, globals_)
+            callable_ = self._compile(statement, len(arguments))
+            result = callable_(*arguments)
         except Exception as exception:
             message = 'evaluable statement {!r} raises {!r}.'
             message = message.format(statement, exception.args[0])
             raise type(exception)(message)
         if self.force_return:
-            result = __argument_0
+            result = arguments[0]
         return result
 
     def _evaluate_map(self, *arguments):
         assert len(arguments) == 1, repr(arguments)
         assert self.map_operand is not None
-        globals_ = self._make_globals()
-        assert '__argument_0' not in globals_
-        __argument_0 = arguments[0]
-        class_ = type(__argument_0)
+        argument = arguments[0]
+        class_ = type(argument)
         map_operand = self.map_operand
-        globals_['__argument_0'] = __argument_0
-        globals_['class_'] = class_
-        globals_['map_operand'] = map_operand
-        statement = 'class_([map_operand(_) for _ in __argument_0])'
         try:
-            result = eval(statement, globals_)
+            result = class_([map_operand(_) for _ in argument])
         except (NameError, SyntaxError, TypeError) as e:
+            statement = 'class_([map_operand(_) for _ in __argument_0])'
             message = '{!r} raises {!r}.'
             message = message.format(statement, e)
             raise Exception(message)
@@ -903,21 +917,24 @@ class Expression(AbjadValueObject):
 
     def _make_globals(self):
         import abjad
-        globals_ = {'abjad': abjad}
-        globals_.update(abjad.__dict__.copy())
-        module_names = self.module_names or []
+        globals_ = Expression._globals
+        if globals_ is None:
+            globals_ = {'abjad': abjad}
+            globals_.update(systemtools.ImportManager.get_namespace(abjad))
+            try:
+                import experimental
+                globals_.update(experimental.__dict__.copy())
+            except ImportError:
+                pass
+            Expression._globals = globals_
+        module_names = list(self.module_names or [])
         if self.qualified_method_name is not None:
             parts = self.qualified_method_name.split('.')
             root_package_name = parts[0]
             module_names.append(root_package_name)
         for module_name in module_names:
-            module = __import__(module_name)
-            globals_[module_name] = module
-        try:
-            import experimental
-            globals_.update(experimental.__dict__.copy())
-        except ImportError:
-            pass
+            if module_name not in globals_:
+                globals_[module_name] = __import__(module_name)
         return globals_
 
     def _make_initializer_callback(
@@ -960,8 +977,7 @@ class Expression(AbjadValueObject):
                 )
             return markup
         assert '.' in qualified_method_name, repr(self)
-        globals_ = self._make_globals()
-        method = eval(qualified_method_name, globals_)
+        method = self._compile(qualified_method_name, 0)()
         if not getattr(method, 'has_signature_decorator', False):
             message = '{} has no signature decorator.'
             message = message.format(method)
@@ -973,7 +989,7 @@ class Expression(AbjadValueObject):
             parts.append(callback_name)
             qualified_callback_name = '.'.join(parts)
             try:
-                callback = eval(qualified_callback_name, globals_)
+                callback = self._compile(qualified_callback_name, 0)()
             except AttributeError:
                 callback = getattr(self, callback_name)
             argument_values = self.argument_values or {}
@@ -985,7 +1001,7 @@ class Expression(AbjadValueObject):
             parts.pop(-1)
             parts.append(callback_name)
             callback_name = '.'.join(parts)
-            callback = eval(callback_name, globals_)
+            callback = self._compile(callback_name, 0)()
             method_name = callback(**self.argument_values)
         elif getattr(method, 'method_name', None) is not None:
             method_name = method.method_name
@@ -1012,10 +1028,10 @@ class Expression(AbjadValueObject):
                 parts.pop(-1)
                 parts.append(argument_list_callback)
                 qualified_callback_name = '.'.join(parts)
-                argument_list_callback = eval(
+                argument_list_callback = self._compile(
                     qualified_callback_name,
-                    globals_,
-                    )
+                    0,
+                    )()
             markup = Expression._make_function_markup(
                 markup,
                 method_name,
@@ -1053,6 +1053,8 @@ class String(str):
 
         Returns string or none.
         '''
+        if argument is None:
+            return None
         lookup = {
             Up: '^',
             '^': '^',
@@ -1069,9 +1071,7 @@ class String(str):
             'default': '-',
             'neutral': '-',
             }
-        if argument is None:
-            return None
-        elif argument in lookup:
+        if argument in lookup:
             return lookup[argument]
         raise ValueError(argument)
 
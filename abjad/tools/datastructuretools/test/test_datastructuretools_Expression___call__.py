@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import abjad
+import platform
+import pytest
+import time
+from abjad.tools import systemtools
+
+
+def _evaluate_with_eval(expression, argument):
+    r'''Evaluates `expression` on `argument` the way expressions did before
+    compilation: one eval of a statement string against a fresh copy of the
+    Abjad namespace per callback.
+    '''
+    result = argument
+    for callback in expression.callbacks:
+        globals_ = {'abjad': abjad}
+        globals_.update(systemtools.ImportManager.get_namespace(abjad))
+        globals_['__argument_0'] = result
+        template = callback.evaluation_template
+        if callback.is_initializer:
+            statement = '{}(__argument_0)'.format(template)
+        else:
+            statement = template.format('__argument_0')
+        result = eval(statement, globals_)
+    return result
+
+
+def test_datastructuretools_Expression___call___01():
+    r'''Compiled expressions return the same results as eval-based
+    evaluation.
+    '''
+
+    expressions = [
+        abjad.sequence().reverse().rotate(n=1).flatten(),
+        abjad.sequence().partition_by_counts([2, 3], cyclic=True),
+        abjad.sequence().sum(),
+        abjad.Expression().pitch_class_segment().transpose(n=3),
+        ]
+    arguments = [
+        [1, [2, 3], [4, [5, 6]]],
+        list(range(10)),
+        [1, 2, 3],
+        [0, 2, 10],
+        ]
+    for expression, argument in zip(expressions, arguments):
+        assert expression(argument) == \
+            _evaluate_with_eval(expression, argument)
+
+
+def test_datastructuretools_Expression___call___02():
+    r'''Expressions compile each statement once.
+    '''
+
+    expression = abjad.sequence().reverse()
+    assert expression([1, 2, 3]) == abjad.Sequence([3, 2, 1])
+    key = ('__argument_0.reverse()', 1)
+    callable_ = abjad.Expression._compiled_callables[key]
+    assert expression([4, 5]) == abjad.Sequence([5, 4])
+    assert abjad.Expression._compiled_callables[key] is callable_
+
+
+def test_datastructuretools_Expression___call___03():
+    r'''Compiled expressions preserve markup and string templates.
+    '''
+
+    expression = abjad.Expression(name='J')
+    expression = expression.sequence()
+    expression = expression.reverse()
+    assert expression([[1, 2], 3, [4, 5]]) == \
+        abjad.Sequence([[4, 5], 3, [1, 2]])
+    assert expression.get_string() == 'R(J)'
+    assert format(expression.get_markup()) == abjad.String.normalize(
+        r'''
+        \markup {
+            \concat
+                {
+                    R
+                    \bold
+                        J
+                }
+            }
+        ''')
+
+
+def test_datastructuretools_Expression___call___04():
+    r'''Map expressions wrap name and type errors raised by map operands.
+    '''
+
+    callback = abjad.Expression(
+        evaluation_template='undefined_name({})',
+        string_template='U({})',
+        )
+    operands = [
+        abjad.Expression(callbacks=[callback]),
+        abjad.Expression().pitch_class_segment(),
+        ]
+    for operand, error_name in zip(operands, ('NameError', 'TypeError')):
+        expression = abjad.sequence().map(operand)
+        with pytest.raises(Exception) as exception_info:
+            expression([1, 2])
+        assert type(exception_info.value) is Exception
+        message = str(exception_info.value)
+        assert 'map_operand' in message
+        assert error_name in message
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_datastructuretools_Expression___call___05():
+    r'''Benchmarks compiled evaluation against eval-based evaluation.
+    '''
+
+    expression = abjad.sequence().reverse().rotate(n=1).flatten()
+    argument = [1, [2, 3], [4, [5, 6]]]
+    assert expression(argument) == _evaluate_with_eval(expression, argument)
+    iterations = 200
+    start_time = time.time()
+    for _ in range(iterations):
+        _evaluate_with_eval(expression, argument)
+    eval_time = time.time() - start_time
+    start_time = time.time()
+    for _ in range(iterations):
+        expression(argument)
+    compiled_time = time.time() - start_time
+    print('Eval-based evaluation:', eval_time)
+    print('Compiled evaluation:', compiled_time)
@@ -2,6 +2,7 @@
 import copy
 import math
 import re
+import sys
 from abjad import Fraction
 from abjad.tools import mathtools
 from abjad.tools import systemtools
@@ -136,15 +137,45 @@ class Duration(AbjadObject, Fraction):
     __slots__ = (
         )
 
+    _hash_inverses = {}
+
+    _interned_instances = {}
+
+    _maximum_interned_denominator = 64
+
+    _maximum_interned_numerator = 256
+
     ### CONSTRUCTOR ###
 
     def __new__(class_, *arguments):
+        if len(arguments) == 2:
+            numerator, denominator = arguments
+            if type(numerator) is int and type(denominator) is int:
+                return class_._from_pair(numerator, denominator)
         if len(arguments) == 1:
             argument = arguments[0]
             if type(argument) is class_:
                 return argument
+            if type(argument) is int:
+                return class_._from_pair(argument, 1)
+            if (
+                type(argument) is tuple and
+                len(argument) == 2 and
+                type(argument[0]) is int and
+                type(argument[1]) is int
+                ):
+                return class_._from_pair(*argument)
+            if type(argument) is Fraction:
+                return Fraction.__new__(class_, argument)
+            if isinstance(argument, Duration):
+                return class_._from_pair(
+                    argument.numerator,
+                    argument.denominator,
+                    )
             if isinstance(argument, mathtools.NonreducedFraction):
                 return Fraction.__new__(class_, *argument.pair)
+            if isinstance(argument, Fraction):
+                return Fraction.__new__(class_, argument)
             try:
                 return Fraction.__new__(class_, *argument)
             except (AttributeError, TypeError):
@@ -196,7 +227,9 @@ class Duration(AbjadObject, Fraction):
 
         Returns nonnegative duration.
         '''
-        return type(self)(Fraction.__abs__(self, *arguments))
+        if not arguments:
+            return self._from_pair(abs(self.numerator), self.denominator)
+        return self._from_fraction(Fraction.__abs__(self, *arguments))
 
     def __add__(self, *arguments):
         r'''Adds duration to `arguments`.
@@ -226,13 +259,20 @@ class Duration(AbjadObject, Fraction):
 
         Returns duration.
         '''
+        pair = self._get_pair(*arguments)
+        if pair is not None:
+            numerator, denominator = pair
+            return self._from_pair(
+                self.numerator * denominator + numerator * self.denominator,
+                self.denominator * denominator,
+                )
         if (
             len(arguments) == 1 and
             isinstance(arguments[0], mathtools.NonreducedFraction)
             ):
             result = arguments[0].__radd__(self)
         else:
-            result = type(self)(Fraction.__add__(self, *arguments))
+            result = self._from_fraction(Fraction.__add__(self, *arguments))
         return result
 
     def __div__(self, *arguments):
@@ -252,6 +292,17 @@ class Duration(AbjadObject, Fraction):
         Returns multiplier.
         '''
         from abjad.tools import durationtools
+        pair = self._get_pair(*arguments)
+        if pair is not None:
+            numerator, denominator = pair
+            if isinstance(arguments[0], type(self)):
+                class_ = durationtools.Multiplier
+            else:
+                class_ = type(self)
+            return class_._from_pair(
+                self.numerator * denominator,
+                self.denominator * numerator,
+                )
         if len(arguments) == 1 and isinstance(arguments[0], type(self)):
             fraction = Fraction.__truediv__(self, *arguments)
             result = durationtools.Multiplier(fraction)
@@ -259,7 +310,8 @@ class Duration(AbjadObject, Fraction):
             arguments[0], mathtools.NonreducedFraction):
             result = arguments[0].__rdiv__(self)
         else:
-            result = type(self)(Fraction.__truediv__(self, *arguments))
+            result = self._from_fraction(
+                Fraction.__truediv__(self, *arguments))
         return result
 
     def __divmod__(self, *arguments):
@@ -268,8 +320,8 @@ class Duration(AbjadObject, Fraction):
         Returns pair.
         '''
         truncated, residue = Fraction.__divmod__(self, *arguments)
-        truncated = type(self)(truncated)
-        residue = type(self)(residue)
+        truncated = self._from_fraction(truncated)
+        residue = self._from_fraction(residue)
         return truncated, residue
 
     def __eq__(self, argument):
@@ -316,7 +368,25 @@ class Duration(AbjadObject, Fraction):
 
         Returns integer.
         '''
-        return super(Duration, self).__hash__()
+        hash_info = getattr(sys, 'hash_info', None)
+        if hash_info is None:
+            return super(Duration, self).__hash__()
+        denominator = self.denominator
+        inverse = Duration._hash_inverses.get(denominator)
+        if inverse is None:
+            modulus = hash_info.modulus
+            inverse = pow(denominator, modulus - 2, modulus)
+            if len(Duration._hash_inverses) < 1024:
+                Duration._hash_inverses[denominator] = inverse
+        if not inverse:
+            result = hash_info.inf
+        else:
+            result = abs(self.numerator) * inverse % hash_info.modulus
+        if self.numerator < 0:
+            result = -result
+        if result == -1:
+            result = -2
+        return result
 
     def __le__(self, argument):
         r'''Is true when duration is less than or equal to `argument`.
@@ -339,7 +409,7 @@ class Duration(AbjadObject, Fraction):
 
         Returns duration.
         '''
-        return type(self)(Fraction.__mod__(self, *arguments))
+        return self._from_fraction(Fraction.__mod__(self, *arguments))
 
     def __mul__(self, *arguments):
         r'''Duration multiplied by `arguments`.
@@ -369,13 +439,20 @@ class Duration(AbjadObject, Fraction):
 
         Returns duration or nonreduced fraction.
         '''
+        pair = self._get_pair(*arguments)
+        if pair is not None:
+            numerator, denominator = pair
+            return self._from_pair(
+                self.numerator * numerator,
+                self.denominator * denominator,
+                )
         if (
             len(arguments) == 1 and
             isinstance(arguments[0], mathtools.NonreducedFraction)
             ):
             result = arguments[0].__rmul__(self)
         else:
-            result = type(self)(Fraction.__mul__(self, *arguments))
+            result = self._from_fraction(Fraction.__mul__(self, *arguments))
         return result
 
     def __neg__(self, *arguments):
@@ -383,40 +460,44 @@ class Duration(AbjadObject, Fraction):
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__neg__(self, *arguments))
+        if not arguments:
+            return self._from_pair(-self.numerator, self.denominator)
+        return self._from_fraction(Fraction.__neg__(self, *arguments))
 
     def __pos__(self, *arguments):
         r'''Get positive duration.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__pos__(self, *arguments))
+        return self._from_fraction(Fraction.__pos__(self, *arguments))
 
     def __pow__(self, *arguments):
         r'''Raises duration to `arguments` power.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__pow__(self, *arguments))
+        return self._from_fraction(Fraction.__pow__(self, *arguments))
 
     def __radd__(self, *arguments):
         r'''Adds `arguments` to duration.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__radd__(self, *arguments))
+        if self._get_pair(*arguments) is not None:
+            return self.__add__(*arguments)
+        return self._from_fraction(Fraction.__radd__(self, *arguments))
 
     def __rdiv__(self, *arguments):
         r'''Divides `arguments` by duration.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__rdiv__(self, *arguments))
+        return self._from_fraction(Fraction.__rdiv__(self, *arguments))
 
     def __rdivmod__(self, *arguments):
         r'''Documentation required.
         '''
-        return type(self)(Fraction.__rdivmod__(self, *arguments))
+        return self._from_fraction(Fraction.__rdivmod__(self, *arguments))
 
     def __reduce__(self):
         r'''Documentation required.
@@ -431,35 +512,37 @@ class Duration(AbjadObject, Fraction):
     def __rmod__(self, *arguments):
         r'''Documentation required.
         '''
-        return type(self)(Fraction.__rmod__(self, *arguments))
+        return self._from_fraction(Fraction.__rmod__(self, *arguments))
 
     def __rmul__(self, *arguments):
         r'''Multiplies `arguments` by duration.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__rmul__(self, *arguments))
+        if self._get_pair(*arguments) is not None:
+            return self.__mul__(*arguments)
+        return self._from_fraction(Fraction.__rmul__(self, *arguments))
 
     def __rpow__(self, *arguments):
         r'''Raises `arguments` to the power of duration.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__rpow__(self, *arguments))
+        return self._from_fraction(Fraction.__rpow__(self, *arguments))
 
     def __rsub__(self, *arguments):
         r'''Subtracts duration from `arguments`.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__rsub__(self, *arguments))
+        return self._from_fraction(Fraction.__rsub__(self, *arguments))
 
     def __rtruediv__(self, *arguments):
         r'''Documentation required.
 
         Returns new duration.
         '''
-        return type(self)(Fraction.__rtruediv__(self, *arguments))
+        return self._from_fraction(Fraction.__rtruediv__(self, *arguments))
 
     def __sub__(self, *arguments):
         r'''Subtracts `arguments` from duration.
@@ -478,13 +561,20 @@ class Duration(AbjadObject, Fraction):
 
         Returns new duration.
         '''
+        pair = self._get_pair(*arguments)
+        if pair is not None:
+            numerator, denominator = pair
+            return self._from_pair(
+                self.numerator * denominator - numerator * self.denominator,
+                self.denominator * denominator,
+                )
         if (
             len(arguments) == 1 and
             isinstance(arguments[0], mathtools.NonreducedFraction)
             ):
             return arguments[0].__rsub__(self)
         else:
-            return type(self)(Fraction.__sub__(self, *arguments))
+            return self._from_fraction(Fraction.__sub__(self, *arguments))
 
     def __truediv__(self, *arguments):
         r'''Documentation required.
@@ -493,6 +583,31 @@ class Duration(AbjadObject, Fraction):
 
     ### PRIVATE METHODS ###
 
+    def _from_fraction(self, fraction):
+        if type(fraction) is Fraction:
+            return type(self)._from_pair(
+                fraction.numerator,
+                fraction.denominator,
+                )
+        return type(self)(fraction)
+
+    @classmethod
+    def _from_pair(class_, numerator, denominator):
+        key = (class_, numerator, denominator)
+        self = Duration._interned_instances.get(key)
+        if self is not None:
+            return self
+        self = Fraction.__new__(class_, numerator, denominator)
+        if (
+            -class_._maximum_interned_numerator <= numerator <=
+            class_._maximum_interned_numerator and
+            0 < denominator <= class_._maximum_interned_denominator
+            ):
+            reduced_key = (class_, self.numerator, self.denominator)
+            self = Duration._interned_instances.setdefault(reduced_key, self)
+            Duration._interned_instances[key] = self
+        return self
+
     def _get_format_specification(self):
         return systemtools.FormatSpecification(
             client=self,
@@ -504,6 +619,17 @@ class Duration(AbjadObject, Fraction):
             storage_format_kwargs_names=[],
             )
 
+    @staticmethod
+    def _get_pair(*arguments):
+        if len(arguments) != 1:
+            return None
+        argument = arguments[0]
+        if type(argument) is int:
+            return argument, 1
+        if isinstance(argument, Duration):
+            return argument.numerator, argument.denominator
+        return None
+
     @staticmethod
     def _group_nonreduced_fractions_by_implied_prolation(durations):
         durations = [
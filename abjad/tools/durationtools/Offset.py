@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from abjad import Fraction
 from abjad.tools import systemtools
 from abjad.tools.durationtools.Duration import Duration
 
@@ -151,13 +152,18 @@ class Offset(Duration):
     ### CONSTRUCTOR ###
 
     def __new__(class_, *arguments, **keywords):
+        if (
+            not keywords and
+            len(arguments) == 2 and
+            type(arguments[0]) is int and
+            type(arguments[1]) is int
+            ):
+            return class_._from_pair(*arguments)
         grace_displacement = None
         for argument in arguments:
-            try:
+            if hasattr(argument, 'grace_displacement'):
                 grace_displacement = argument.grace_displacement
                 break
-            except AttributeError:
-                pass
         grace_displacement = grace_displacement or keywords.get(
             'grace_displacement')
         if grace_displacement is not None:
@@ -723,6 +729,12 @@ class Offset(Duration):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_pair(class_, numerator, denominator):
+        self = Fraction.__new__(class_, numerator, denominator)
+        self._grace_displacement = None
+        return self
+
     def _get_format_specification(self):
         is_indented = False
         names = []
@@ -740,10 +752,9 @@ class Offset(Duration):
             )
 
     def _get_grace_displacement(self):
-        from abjad.tools import durationtools
-        if self.grace_displacement is None:
-            return durationtools.Duration(0)
-        return self.grace_displacement
+        if self._grace_displacement is None:
+            return Duration._from_pair(0, 1)
+        return self._grace_displacement
 
     ### PUBLIC PROPERTIES ###
 
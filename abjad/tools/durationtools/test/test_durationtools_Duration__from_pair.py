@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import abjad
+import fractions
+
+
+def _get_durations():
+    durations = []
+    for numerator in range(-8, 9):
+        for denominator in (1, 2, 3, 4, 5, 8, 16, 1000):
+            durations.append(abjad.Duration(numerator, denominator))
+            durations.append(abjad.Offset(numerator, denominator))
+            durations.append(abjad.Multiplier(numerator, denominator))
+    return durations
+
+
+def test_durationtools_Duration__from_pair_01():
+    r'''Fast arithmetic equals fraction arithmetic.
+    '''
+
+    durations = _get_durations()
+    for duration_1 in durations[::7]:
+        fraction_1 = fractions.Fraction(
+            duration_1.numerator,
+            duration_1.denominator,
+            )
+        assert hash(duration_1) == hash(fraction_1)
+        assert -duration_1 == -fraction_1
+        assert abs(duration_1) == abs(fraction_1)
+        assert type(-duration_1) is type(duration_1)
+        for duration_2 in durations[::5] + [0, 1, -3]:
+            fraction_2 = fractions.Fraction(duration_2)
+            assert duration_1 + duration_2 == fraction_1 + fraction_2
+            assert duration_1 - duration_2 == fraction_1 - fraction_2
+            assert duration_1 * duration_2 == fraction_1 * fraction_2
+            if fraction_2:
+                assert duration_1 / duration_2 == fraction_1 / fraction_2
+
+
+def test_durationtools_Duration__from_pair_02():
+    r'''Arithmetic preserves result types.
+    '''
+
+    duration = abjad.Duration(1, 4)
+    offset = abjad.Offset(1, 4)
+    multiplier = abjad.Multiplier(2, 3)
+    assert type(duration + duration) is abjad.Duration
+    assert type(offset + duration) is abjad.Offset
+    assert (offset + duration).grace_displacement is None
+    assert type(offset - offset) is abjad.Duration
+    assert type(duration / duration) is abjad.Multiplier
+    assert type(offset / duration) is abjad.Offset
+    assert type(multiplier * duration) is abjad.Duration
+    assert type(duration * multiplier) is abjad.Duration
+    assert type(3 * duration) is abjad.Duration
+    assert abjad.Duration(1, 4) is abjad.Duration(2, 8)
+    assert abjad.Offset(1, 4) is not abjad.Offset(1, 4)
+    offset = abjad.Offset(1, 4, grace_displacement=(-1, 16))
+    assert offset.grace_displacement == abjad.Duration(-1, 16)
+    assert abjad.Offset(1, 4).grace_displacement is None
+    assert abjad.Offset(offset).grace_displacement == abjad.Duration(-1, 16)
+
+
+def test_durationtools_Duration__from_pair_03():
+    r'''Duration arithmetic matches generic construction.
+    '''
+
+    durations = _get_durations()
+
+    expected = []
+    for duration_1 in durations[:60]:
+        for duration_2 in durations[:60]:
+            fraction = fractions.Fraction.__add__(duration_1, duration_2)
+            expected.append(type(duration_1)(fraction))
+
+    result = []
+    for duration_1 in durations[:60]:
+        for duration_2 in durations[:60]:
+            result.append(duration_1 + duration_2)
+
+    assert result == expected
@@ -50,6 +50,8 @@ class Arpeggio(AbjadValueObject):
         '_direction',
         )
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, direction=None):
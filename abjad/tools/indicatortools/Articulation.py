@@ -134,6 +134,8 @@ class Articulation(AbjadValueObject):
         '_',
         )
 
+    _is_immutable = True
+
     # this causes unnecessary coupling to changeable lilypond codebase
     # and is discouraged
     _shortcut_to_word = {
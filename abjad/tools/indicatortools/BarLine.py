@@ -48,6 +48,8 @@ class BarLine(AbjadValueObject):
 
     _format_slot = 'closing'
 
+    _is_immutable = True
+
     ### INITIALIZER ##
 
     def __init__(self, abbreviation='|'):
@@ -63,6 +63,8 @@ class BreathMark(AbjadValueObject):
 
     _format_slot = 'after'
 
+    _is_immutable = True
+
     _time_orientation = Right
 
     ### SPECIAL METHODS ###
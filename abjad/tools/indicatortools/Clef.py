@@ -96,6 +96,8 @@ class Clef(AbjadValueObject):
 
     _format_slot = 'opening'
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, name='treble'):
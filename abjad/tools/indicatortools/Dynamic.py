@@ -149,6 +149,8 @@ class Dynamic(AbjadValueObject):
         6: 'fffff',
         }
 
+    _is_immutable = True
+
     _lilypond_dynamic_commands = [
         _ for _ in _dynamic_names if not _ == 'niente'
         ]
@@ -107,6 +107,8 @@ class Fermata(AbjadValueObject):
 
     _format_slot = 'right'
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, command='fermata'):
@@ -65,6 +65,8 @@ class KeySignature(AbjadValueObject):
 
     _format_slot = 'opening'
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, tonic='c', mode='major'):
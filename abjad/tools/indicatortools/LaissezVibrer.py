@@ -32,6 +32,8 @@ class LaissezVibrer(AbjadValueObject):
 
     _format_slot = 'right'
 
+    _is_immutable = True
+
     _time_orientation = Right
 
     ### SPECIAL METHODS ###
@@ -56,6 +56,8 @@ class LilyPondCommand(AbjadValueObject):
 
     _format_leaf_children = False
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, name=None, format_slot=None, prefix='\\'):
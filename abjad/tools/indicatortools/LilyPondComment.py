@@ -64,6 +64,8 @@ class LilyPondComment(AbjadValueObject):
 
     _format_leaf_children = False
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, contents_string=None, format_slot=None):
@@ -46,6 +46,8 @@ class PageBreak(AbjadValueObject):
 
     _format_slot = 'closing'
 
+    _is_immutable = True
+
     _time_orientation = Right
 
     ### INITIALIZER ##
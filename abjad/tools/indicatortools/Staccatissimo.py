@@ -65,6 +65,8 @@ class Staccatissimo(AbjadValueObject):
 
     _format_slot = Right
 
+    _is_immutable = True
+
     _time_orientation = Right
 
     ### INITIALIZER ###
@@ -65,6 +65,8 @@ class Staccato(AbjadValueObject):
 
     _format_slot = Right
 
+    _is_immutable = True
+
     _time_orientation = Right
 
     ### INITIALIZER ###
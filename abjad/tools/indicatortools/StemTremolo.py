@@ -53,6 +53,8 @@ class StemTremolo(AbjadValueObject):
 
     _format_slot = 'right'
 
+    _is_immutable = True
+
     ### INITIALIZER ###
 
     def __init__(self, tremolo_flags=16):
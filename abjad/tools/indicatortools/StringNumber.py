@@ -42,6 +42,8 @@ class StringNumber(AbjadValueObject):
         '_numbers',
         )
 
+    _is_immutable = True
+
     _publish_storage_format = True
 
     ### INITIALIZER ###
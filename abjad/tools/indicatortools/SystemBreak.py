@@ -41,6 +41,8 @@ class SystemBreak(AbjadValueObject):
 
     _format_slot = 'closing'
 
+    _is_immutable = True
+
     _time_orientation = Right
 
     ### INITIALIZER ##
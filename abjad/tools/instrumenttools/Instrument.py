@@ -232,7 +232,8 @@ class Instrument(AbjadValueObject):
         if classes is None:
             classes = (instrumenttools.Instrument,)
         instruments = []
-        for value in instrumenttools.__dict__.values():
+        namespace = systemtools.ImportManager.get_namespace(instrumenttools)
+        for value in namespace.values():
             try:
                 if issubclass(value, classes):
                     if value is not instrumenttools.Instrument:
@@ -130,7 +130,7 @@ class InstrumentList(TypedList):
         instrument_name = instrument_name.title()
         instrument_name = instrument_name.replace(' ', '')
         instrument_name = instrument_name.replace('-', '')
-        instrument_class = instrumenttools.__dict__[instrument_name]
+        instrument_class = getattr(instrumenttools, instrument_name)
         instrument = instrument_class()
         return instrument
 
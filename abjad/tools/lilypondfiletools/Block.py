@@ -143,60 +143,35 @@ class Block(AbjadObject):
 
     ### PRIVATE METHODS ###
 
-    def _format_item(self, item, depth=1):
+    def _format_item(self, item, depth=1, pending_format_pieces=None):
         from abjad.tools import systemtools
         indent = systemtools.LilyPondFormatManager.indent * depth
-        result = []
         if isinstance(item, (list, tuple)):
-            result.append(indent + '{')
+            yield indent + '{'
             for x in item:
-                result.extend(self._format_item(x, depth + 1))
-            result.append(indent + '}')
+                for piece in self._format_item(
+                    x,
+                    depth + 1,
+                    pending_format_pieces=pending_format_pieces,
+                    ):
+                    yield piece
+            yield indent + '}'
         elif isinstance(item, str):
             string = indent + item
-            result.append(string)
+            yield string
+        elif '_iterate_format_pieces' in dir(item):
+            pieces = item._iterate_format_pieces(
+                pending_format_pieces=pending_format_pieces,
+                )
+            for piece in pieces:
+                yield indent + piece
         elif '_get_format_pieces' in dir(item):
             pieces = item._get_format_pieces()
-            pieces = (indent + item for item in pieces)
-            result.extend(pieces)
-        return result
+            for piece in pieces:
+                yield indent + piece
 
     def _get_format_pieces(self):
-        from abjad.tools import lilypondfiletools
-        from abjad.tools import markuptools
-        from abjad.tools import scoretools
-        from abjad.tools import systemtools
-        indent = systemtools.LilyPondFormatManager.indent
-        result = []
-        if (not self._get_formatted_user_attributes() and
-            not getattr(self, 'contexts', None) and
-            not getattr(self, 'context_blocks', None) and
-            not len(self.items)
-            ):
-            if self.name == 'score':
-                return ''
-            string = '{} {{}}'.format(self._escaped_name)
-            result.append(string)
-            return result
-        string = '{} {{'.format(self._escaped_name)
-        result.append(string)
-        prototype = (scoretools.Leaf, markuptools.Markup)
-        for item in self.items:
-            if isinstance(item, lilypondfiletools.ContextBlock):
-                continue
-            if isinstance(item, prototype):
-                item = [item]
-            result.extend(self._format_item(item))
-        formatted_attributes = self._get_formatted_user_attributes()
-        formatted_attributes = [indent + x for x in formatted_attributes]
-        result.extend(formatted_attributes)
-        formatted_context_blocks = getattr(
-            self, '_formatted_context_blocks', [])
-        formatted_context_blocks = [
-            indent + x for x in formatted_context_blocks]
-        result.extend(formatted_context_blocks)
-        result.append('}')
-        return result
+        return list(self._iterate_format_pieces())
 
     def _get_format_specification(self):
         return systemtools.FormatSpecification(
@@ -255,6 +230,44 @@ class Block(AbjadObject):
     def _get_lilypond_format(self):
         return '\n'.join(self._get_format_pieces())
 
+    def _iterate_format_pieces(self, pending_format_pieces=None):
+        from abjad.tools import lilypondfiletools
+        from abjad.tools import markuptools
+        from abjad.tools import scoretools
+        from abjad.tools import systemtools
+        indent = systemtools.LilyPondFormatManager.indent
+        if (not self._get_formatted_user_attributes() and
+            not getattr(self, 'contexts', None) and
+            not getattr(self, 'context_blocks', None) and
+            not len(self.items)
+            ):
+            if self.name == 'score':
+                return
+            string = '{} {{}}'.format(self._escaped_name)
+            yield string
+            return
+        string = '{} {{'.format(self._escaped_name)
+        yield string
+        prototype = (scoretools.Leaf, markuptools.Markup)
+        for item in self.items:
+            if isinstance(item, lilypondfiletools.ContextBlock):
+                continue
+            if isinstance(item, prototype):
+                item = [item]
+            for piece in self._format_item(
+                item,
+                pending_format_pieces=pending_format_pieces,
+                ):
+                yield piece
+        formatted_attributes = self._get_formatted_user_attributes()
+        for formatted_attribute in formatted_attributes:
+            yield indent + formatted_attribute
+        formatted_context_blocks = getattr(
+            self, '_formatted_context_blocks', [])
+        for formatted_context_block in formatted_context_blocks:
+            yield indent + formatted_context_block
+        yield '}'
+
     ### PUBLIC PROPERTIES ###
 
     @property
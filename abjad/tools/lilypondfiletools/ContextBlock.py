@@ -131,6 +131,9 @@ class ContextBlock(Block):
         result.append('}')
         return result
 
+    def _iterate_format_pieces(self, pending_format_pieces=None):
+        return iter(self._get_format_pieces())
+
     ### PUBLIC PROPERTIES ###
 
     @property
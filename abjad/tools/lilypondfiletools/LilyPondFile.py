@@ -361,26 +361,7 @@ class LilyPondFile(AbjadObject):
     ### PRIVATE METHODS ###
 
     def _get_format_pieces(self):
-        result = []
-        if self.date_time_token is not None:
-            string = '% {}'.format(self.date_time_token)
-            result.append(string)
-        result.extend(self._get_formatted_comments())
-        includes = []
-        if self.lilypond_version_token is not None:
-            string = '{}'.format(self.lilypond_version_token)
-            includes.append(string)
-        if self.lilypond_language_token is not None:
-            string = '{}'.format(self.lilypond_language_token)
-            includes.append(string)
-        includes = '\n'.join(includes)
-        if includes:
-            result.append(includes)
-        if self.use_relative_includes:
-            string = "#(ly:set-option 'relative-includes #t)"
-            result.append(string)
-        result.extend(self._get_formatted_includes())
-        result.extend(self._get_formatted_scheme_settings())
+        result = self._get_formatted_preamble()
         result.extend(self._get_formatted_blocks())
         return result
 
@@ -425,6 +406,29 @@ class LilyPondFile(AbjadObject):
             result = ['\n'.join(result)]
         return result
 
+    def _get_formatted_preamble(self):
+        result = []
+        if self.date_time_token is not None:
+            string = '% {}'.format(self.date_time_token)
+            result.append(string)
+        result.extend(self._get_formatted_comments())
+        includes = []
+        if self.lilypond_version_token is not None:
+            string = '{}'.format(self.lilypond_version_token)
+            includes.append(string)
+        if self.lilypond_language_token is not None:
+            string = '{}'.format(self.lilypond_language_token)
+            includes.append(string)
+        includes = '\n'.join(includes)
+        if includes:
+            result.append(includes)
+        if self.use_relative_includes:
+            string = "#(ly:set-option 'relative-includes #t)"
+            result.append(string)
+        result.extend(self._get_formatted_includes())
+        result.extend(self._get_formatted_scheme_settings())
+        return result
+
     def _get_formatted_scheme_settings(self):
         result = []
         default_paper_size = self.default_paper_size
@@ -445,6 +449,29 @@ class LilyPondFile(AbjadObject):
     def _get_lilypond_format(self):
         return '\n\n'.join(self._get_format_pieces())
 
+    def _iterate_format_pieces(self, pending_format_pieces=None):
+        needs_separator = False
+        for piece in self._get_formatted_preamble():
+            if needs_separator:
+                yield ''
+            yield piece
+            needs_separator = True
+        for x in self.items:
+            if hasattr(x, '_iterate_format_pieces'):
+                pieces = x._iterate_format_pieces(
+                    pending_format_pieces=pending_format_pieces,
+                    )
+            elif '_get_lilypond_format' in dir(x) and not isinstance(x, str):
+                lilypond_format = format(x)
+                pieces = (lilypond_format,) if lilypond_format else ()
+            else:
+                pieces = (str(x),)
+            for i, piece in enumerate(pieces):
+                if i == 0 and needs_separator:
+                    yield ''
+                yield piece
+                needs_separator = True
+
     @staticmethod
     def _make_time_signature_context_block(
         font_size=3,
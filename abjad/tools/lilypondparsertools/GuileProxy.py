@@ -202,13 +202,20 @@ class GuileProxy(AbjadObject):
         from abjad.tools import lilypondparsertools
         self._make_unrelativable(music)
         def recurse(music):
-            key_signatures = music._get_indicators(indicatortools.KeySignature)
-            if key_signatures:
-                for x in key_signatures:
-                    tonic = pitchtools.NamedPitch((x.tonic.name, 4))
-                    # TODO: cheating to assign to a read-only property
-                    x._tonic = lilypondparsertools.LilyPondParser._transpose_enharmonically(
-                        from_pitch, to_pitch, tonic).pitch_class
+            wrappers = music._get_indicators(
+                indicatortools.KeySignature,
+                unwrap=False,
+                )
+            for wrapper in wrappers:
+                key_signature = wrapper.indicator
+                tonic = pitchtools.NamedPitch((key_signature.tonic.name, 4))
+                tonic = lilypondparsertools.LilyPondParser._transpose_enharmonically(
+                    from_pitch, to_pitch, tonic).pitch_class
+                # key signatures are immutable and may be shared by copies
+                wrapper._indicator = indicatortools.KeySignature(
+                    tonic,
+                    key_signature.mode,
+                    )
             if isinstance(music, scoretools.Note):
                 music.written_pitch = \
                     lilypondparsertools.LilyPondParser._transpose_enharmonically(
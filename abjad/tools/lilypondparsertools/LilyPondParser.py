@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 import collections
 import itertools
-import ply
+import ply.lex
+import ply.yacc
+import re
+import time
 from abjad.tools import abctools
 from abjad.tools import datastructuretools
 from abjad.tools import durationtools
@@ -331,6 +334,28 @@ class LilyPondParser(abctools.Parser):
         '_syndef',
         )
 
+    _toplevel_token_regex = re.compile(r'''
+        "(?:[^"\\]|\\.)*(?P<closed_string>")?
+        |
+        %\{(?:.*?%\}|.*)
+        |
+        %[^\n]*
+        |
+        <<|>>|[<>]\Z
+        |
+        [{}()]
+        |
+        \\[A-Za-z]+
+        ''', re.VERBOSE | re.DOTALL)
+
+    _toplevel_continuation_tokens = (
+        '{',
+        '<<',
+        '\\addlyrics',
+        '\\alternative',
+        '\\with',
+        )
+
     ### INITIALIZER ###
 
     def __init__(self, default_language='english', debug=False):
@@ -365,28 +390,7 @@ class LilyPondParser(abctools.Parser):
         Returns Abjad components.
         '''
         self._reset_parser_variables()
-        if self._debug:
-            result = self._parser._lilypond_patch_parse_debug(
-                input_string,
-                lexer=self._lexer,
-                debug=self._logger,
-                )
-        else:
-            result = self._parser._lilypond_patch_parse(
-                input_string,
-                lexer=self._lexer,
-                )
-        if isinstance(result, scoretools.Container):
-            self._apply_spanners(result)
-        elif isinstance(result, lilypondfiletools.LilyPondFile):
-            for x in result.items:
-                if isinstance(x, scoretools.Container):
-                    self._apply_spanners(x)
-                elif isinstance(x, lilypondfiletools.Block) and \
-                    x.name == 'score':
-                    for y in x.items:
-                        self._apply_spanners(y)
-        return result
+        return self._parse_input_string(input_string)
 
     ### PRIVATE METHODS ###
 
@@ -777,6 +781,95 @@ class LilyPondParser(abctools.Parser):
         assert abjad.inspect(leaf).get_annotation('spanners') is None
         return annotation
 
+    @staticmethod
+    def _iterate_toplevel_strings(file_pointer, chunk_size=2 ** 16):
+        r'''Iterates top-level statements in `file_pointer`.
+
+        A statement whose braces and parentheses are balanced stays open
+        until the next significant token. Statements continue when that token
+        is a brace, double angle bracket or command like ``\with``.
+        '''
+        regex = LilyPondParser._toplevel_token_regex
+        continuation_tokens = LilyPondParser._toplevel_continuation_tokens
+        string, start, position, stop = '', 0, 0, None
+        brace_depth = parenthesis_depth = 0
+        is_at_end = False
+        while not is_at_end:
+            chunk = file_pointer.read(chunk_size)
+            is_at_end = not chunk
+            string = string[start:] + chunk
+            position -= start
+            if stop is not None:
+                stop -= start
+            start = 0
+            for match in regex.finditer(string, position):
+                token = match.group()
+                if not is_at_end and (
+                    (token.startswith('"') and
+                        match.group('closed_string') is None) or
+                    (token.startswith('%{') and
+                        (len(token) < 4 or not token.endswith('%}'))) or
+                    (token.startswith(('%', '\\')) and
+                        match.end() == len(string)) or
+                    token in ('<', '>')
+                    ):
+                    break
+                if stop is not None:
+                    is_continued = False
+                    if not string[position:match.start()].strip():
+                        if token.startswith('%'):
+                            position = match.end()
+                            continue
+                        is_continued = token in continuation_tokens
+                    if is_continued:
+                        stop = None
+                    else:
+                        yield string[start:stop]
+                        start, stop = stop, None
+                position = match.end()
+                if token in ('{', '<<'):
+                    brace_depth += 1
+                elif token in ('}', '>>'):
+                    brace_depth -= 1
+                elif token in ('(', ')') and not brace_depth:
+                    if token == '(':
+                        parenthesis_depth += 1
+                    else:
+                        parenthesis_depth -= 1
+                else:
+                    continue
+                if not brace_depth and not parenthesis_depth:
+                    stop = position
+            else:
+                if stop is None:
+                    position = len(string)
+        if string[start:].strip():
+            yield string[start:]
+
+    def _parse_input_string(self, input_string):
+        if self._debug:
+            result = self._parser._lilypond_patch_parse_debug(
+                input_string,
+                lexer=self._lexer,
+                debug=self._logger,
+                )
+        else:
+            result = self._parser._lilypond_patch_parse(
+                input_string,
+                lexer=self._lexer,
+                )
+        if isinstance(result, scoretools.Container):
+            self._apply_spanners(result)
+        elif isinstance(result, lilypondfiletools.LilyPondFile):
+            for x in result.items:
+                if isinstance(x, scoretools.Container):
+                    self._apply_spanners(x)
+                elif isinstance(x, lilypondfiletools.Block) and \
+                    x.name == 'score':
+                    for y in x.items:
+                        self._apply_spanners(y)
+        return result
+
     def _pop_variable_scope(self):
         if self._scope_stack:
             self._scope_stack.pop()
@@ -991,6 +1084,72 @@ class LilyPondParser(abctools.Parser):
 
     ### PUBLIC METHODS ###
 
+    def iterate_file(self, file_path_or_pointer, chunk_size=2 ** 16):
+        r"""Iterates top-level items in LilyPond file.
+
+        ..  container:: example
+
+            ::
+
+                >>> import io
+                >>> string = r'''
+                ... music = { c'4 d'4 }
+                ... \new Staff { \music e'2 }
+                ... \new Staff { f'1 }
+                ... '''
+                >>> file_pointer = io.StringIO(string)
+                >>> parser = abjad.lilypondparsertools.LilyPondParser()
+                >>> for item, seconds in parser.iterate_file(file_pointer):
+                ...     f(item)
+                ...
+                \new Staff {
+                    {
+                        c'4
+                        d'4
+                    }
+                    e'2
+                }
+                \new Staff {
+                    f'1
+                }
+
+        Reads `file_path_or_pointer` in chunks of `chunk_size` characters and
+        parses each top-level statement as soon as it is complete. Keeps
+        variable assignments and language changes from one statement to the
+        next.
+
+        Yields pairs of item and seconds spent parsing the statement that
+        produced the item.
+
+        Returns generator.
+        """
+        if isinstance(file_path_or_pointer, str):
+            with open(file_path_or_pointer, 'r') as file_pointer:
+                for pair in self.iterate_file(file_pointer, chunk_size):
+                    yield pair
+            return
+        variables = {}
+        pitch_names = self._language_pitch_names[self.default_language]
+        for string in self._iterate_toplevel_strings(
+            file_path_or_pointer,
+            chunk_size=chunk_size,
+            ):
+            start_time = time.time()
+            self._reset_parser_variables()
+            self._scope_stack = [variables]
+            self._pitch_names = pitch_names
+            result = self._parse_input_string(string)
+            pitch_names = self._pitch_names
+            seconds = time.time() - start_time
+            if isinstance(result, lilypondfiletools.LilyPondFile):
+                items = result.items[:]
+            elif result is None:
+                items = []
+            else:
+                items = [result]
+            for item in items:
+                yield item, seconds
+
     @staticmethod
     def list_known_contexts():
         r'''Lists all LilyPond contexts recognized by LilyPond parser.
@@ -2,6 +2,16 @@
 from abjad.tools.lilypondparsertools.ReducedLyParser import ReducedLyParser
 
 
+_reduced_ly_parser = None
+
+
+def _get_reduced_ly_parser():
+    global _reduced_ly_parser
+    if _reduced_ly_parser is None:
+        _reduced_ly_parser = ReducedLyParser()
+    return _reduced_ly_parser
+
+
 def parse_reduced_ly_syntax(string):
     r'''Parse the reduced LilyPond rhythmic syntax:
 
@@ -29,4 +39,4 @@ def parse_reduced_ly_syntax(string):
 
     Returns list.
     '''
-    return ReducedLyParser()(string)
+    return _get_reduced_ly_parser()(string)
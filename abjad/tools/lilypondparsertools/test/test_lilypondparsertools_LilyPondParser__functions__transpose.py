@@ -91,3 +91,33 @@ def test_lilypondparsertools_LilyPondParser__functions__transpose_03():
     parser = abjad.lilypondparsertools.LilyPondParser()
     result = parser(string)
     assert format(target) == format(result) and target is not result
+
+
+def test_lilypondparsertools_LilyPondParser__functions__transpose_04():
+    r'''Transposing copy leaves key signature of original unchanged.
+    '''
+
+    staff = abjad.Staff("d'4")
+    abjad.attach(abjad.KeySignature('d', 'major'), staff[0])
+    new_staff = abjad.mutate(staff).copy()
+    parser = abjad.lilypondparsertools.LilyPondParser()
+    proxy = abjad.lilypondparsertools.GuileProxy(parser)
+    proxy.transpose(abjad.NamedPitch("d'"), abjad.NamedPitch("e'"), new_staff)
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            \key d \major
+            d'4
+        }
+        '''
+        )
+
+    assert format(new_staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            \key e \major
+            e'4
+        }
+        '''
+        )
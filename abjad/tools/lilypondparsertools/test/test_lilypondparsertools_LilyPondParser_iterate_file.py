@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import abjad
+import io
+from abjad.tools import lilypondparsertools
+
+
+def _make_string(staff_count):
+    strings = [
+        r'\version "2.19.0"',
+        '% comment with { brace',
+        '%{ block comment with } brace %}',
+        r"music = { c'8 ( d'8 ) e'4 }",
+        ]
+    for i in range(staff_count):
+        if i == staff_count // 2:
+            strings.append(r'\language "deutsch"')
+            strings.append(r"music = { cis'8 ( des'8 ) e'4 }")
+        strings.append(r'\new Staff {')
+        strings.append(r"    \music c'4 ~ c'8 [ d'8 ]")
+        strings.append(r'''    e'2 -\markup { "}" }''')
+        strings.append('}')
+        strings.append(r"<< \new Staff { c'1 } \new Staff { d'1 } >>")
+    return '\n'.join(strings) + '\n'
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_01():
+    r'''Iterated items equal items of whole-file parse.
+    '''
+
+    string = _make_string(6)
+    parser = lilypondparsertools.LilyPondParser()
+    expected = [format(_) for _ in parser(string).items]
+    for chunk_size in (1, 7, 64, 2 ** 16):
+        file_pointer = io.StringIO(abjad.String(string))
+        pairs = list(parser.iterate_file(file_pointer, chunk_size=chunk_size))
+        assert [format(_[0]) for _ in pairs] == expected
+        assert all(0 <= _[1] for _ in pairs)
+    assert format(parser(string).items[0]) == expected[0]
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_02(tmpdir):
+    r'''Parses file path from top-level parse function.
+    '''
+
+    file_path = str(tmpdir.join('test.ly'))
+    string = _make_string(2)
+    with open(file_path, 'w') as file_pointer:
+        file_pointer.write(string)
+    items = [_ for _, seconds in abjad.parse(file_path, stream=True)]
+    assert [format(_) for _ in items] == [
+        format(_) for _ in abjad.parse(string).items]
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_03():
+    r'''Yields first item before reading whole file.
+    '''
+
+    class RecordingStringIO(io.StringIO):
+
+        def __init__(self, string):
+            io.StringIO.__init__(self, string)
+            self.reads = []
+
+        def read(self, *arguments):
+            result = io.StringIO.read(self, *arguments)
+            self.reads.append(result)
+            return result
+
+    string = _make_string(20)
+    file_pointer = RecordingStringIO(abjad.String(string))
+    parser = lilypondparsertools.LilyPondParser()
+    items = parser.iterate_file(file_pointer, chunk_size=64)
+    item, seconds = next(items)
+    assert format(item) == format(parser(string).items[0])
+    assert file_pointer.reads
+    assert sum(len(_) for _ in file_pointer.reads) < len(string) // 4
+    items = [item] + [_ for _, seconds in items]
+    assert ''.join(file_pointer.reads) == string
+    assert [format(_) for _ in items] == [
+        format(_) for _ in parser(string).items]
+
+
+def test_lilypondparsertools_LilyPondParser_iterate_file_04():
+    r'''Keeps statements together across context modifications and
+    consecutive music expressions.
+    '''
+
+    string = '\n'.join((
+        r'''\new Staff \with { instrumentName = "Fl" } { c'4 d'4 }''',
+        r'\new Staff \with { instrumentName = "Ob" } % comment {',
+        r'%{ } %}',
+        r"<< { e'4 } { f'4 } >>",
+        r"music = { g'4 }",
+        r"{ \music }",
+        r"\new Staff { a'1 }",
+        ))
+    parser = lilypondparsertools.LilyPondParser()
+    expected = [format(_) for _ in parser(string).items]
+    assert len(expected) == 4
+    for chunk_size in (1, 7, 64, 2 ** 16):
+        file_pointer = io.StringIO(abjad.String(string))
+        items = parser.iterate_file(file_pointer, chunk_size=chunk_size)
+        assert [format(_) for _, seconds in items] == expected
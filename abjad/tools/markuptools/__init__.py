@@ -4,6 +4,7 @@ from abjad.tools import systemtools
 systemtools.ImportManager.import_structured_package(
     __path__[0],
     globals(),
+    lazy=True,
     )
 
 _documentation_section = 'core'
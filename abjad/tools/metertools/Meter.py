@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import collections
+import copy
 from abjad.tools import datastructuretools
 from abjad.tools import durationtools
 from abjad.tools import graphtools
@@ -279,11 +281,16 @@ class Meter(AbjadValueObject):
     and ``3`` summing to that prime. Summands are arranged from greatest
     to least by default. This means that ``5`` becomes ``3+2`` and ``7``
     becomes ``3+2+2`` in the examples above.
+
+    Meters initialized from a pair, fraction or measure share rhythm trees,
+    depthwise offset inventories and metric accent kernels with other meters
+    of the same numerator, denominator and duration ordering.
     '''
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_cache_key',
         '_decrease_durations_monotonically',
         '_denominator',
         '_numerator',
@@ -291,6 +298,14 @@ class Meter(AbjadValueObject):
         '_root_node',
         )
 
+    _meter_cache = collections.OrderedDict()
+
+    _meter_cache_size = 1024
+
+    _rewrite_plan_cache = collections.OrderedDict()
+
+    _rewrite_plan_cache_size = 1024
+
     ### INITIALIZER ###
 
     def __init__(
@@ -303,6 +318,7 @@ class Meter(AbjadValueObject):
         argument = argument or (4, 4)
         assert isinstance(preferred_boundary_depth, (int, type(None)))
         self._preferred_boundary_depth = preferred_boundary_depth
+        self._cache_key = None
 
         def recurse(
             node,
@@ -377,10 +393,11 @@ class Meter(AbjadValueObject):
             is_fraction_like = False
 
         if isinstance(argument, type(self)):
-            root = argument.root_node
+            root = argument._root_node
             numerator, denominator = argument.numerator, argument.denominator
             decrease_durations_monotonically = \
                 argument.decrease_durations_monotonically
+            self._cache_key = argument._cache_key
 
         elif isinstance(argument, (str, rhythmtreetools.RhythmTreeContainer)):
             if isinstance(argument, str):
@@ -413,18 +430,28 @@ class Meter(AbjadValueObject):
                     argument.denominator,
                     )
             numerator, denominator = fraction.numerator, fraction.denominator
-            factors = mathtools.factors(numerator)
-            # group two nested levels of 2s into a 4
-            if 1 < len(factors) and factors[0] == factors[1] == 2:
-                factors[0:2] = [4]
-            root = rhythmtreetools.RhythmTreeContainer(
-                preprolated_duration=fraction)
-            recurse(
-                root,
-                factors,
+
+            def make_root_node():
+                factors = mathtools.factors(numerator)
+                # group two nested levels of 2s into a 4
+                if 1 < len(factors) and factors[0] == factors[1] == 2:
+                    factors[0:2] = [4]
+                root = rhythmtreetools.RhythmTreeContainer(
+                    preprolated_duration=fraction)
+                recurse(
+                    root,
+                    factors,
+                    denominator,
+                    decrease_durations_monotonically,
+                    )
+                return root
+
+            self._cache_key = (
+                numerator,
                 denominator,
                 decrease_durations_monotonically,
                 )
+            root = self._get_cached_value('root_node', make_root_node)
 
         else:
             message = 'can not initialize {}: {!r}.'
@@ -740,7 +767,7 @@ class Meter(AbjadValueObject):
                     result.extend(recurse(child))
             result.append(node)
             return result
-        result = recurse(self.root_node)
+        result = recurse(self._root_node)
         for x in result:
             start_offset = mathtools.NonreducedFraction(
                 x.start_offset).with_denominator(self.denominator)
@@ -775,6 +802,19 @@ class Meter(AbjadValueObject):
 
     ### PRIVATE METHODS ###
 
+    def _get_cached_value(self, name, function):
+        if self._cache_key is None:
+            return function()
+        key = self._cache_key + (name,)
+        cache = Meter._meter_cache
+        value = cache.pop(key, None)
+        if value is None:
+            value = function()
+            while Meter._meter_cache_size <= len(cache):
+                cache.popitem(last=False)
+        cache[key] = value
+        return value
+
     def _get_format_specification(self):
         return systemtools.FormatSpecification(
             client=self,
@@ -868,6 +908,36 @@ class Meter(AbjadValueObject):
         # return notes
         return notes
 
+    def _make_metric_accent_kernel(self, denominator, normalize):
+        from abjad.tools import metertools
+        inventory = list(self.depthwise_offset_inventory)
+        old_flag_count = durationtools.Duration(1, self.denominator).flag_count
+        new_flag_count = durationtools.Duration(1, denominator).flag_count
+        extra_depth = new_flag_count - old_flag_count
+        for _ in range(extra_depth):
+            old_offsets = inventory[-1]
+            new_offsets = []
+            for first, second in datastructuretools.Sequence(old_offsets).nwise():
+                new_offsets.append(first)
+                new_offsets.append((first + second) / 2)
+            new_offsets.append(old_offsets[-1])
+            inventory.append(tuple(new_offsets))
+
+        total = 0
+        kernel = {}
+        for offsets in inventory:
+            for offset in offsets:
+                if offset not in kernel:
+                    kernel[offset] = 0
+                kernel[offset] += 1
+                total += 1
+
+        if normalize:
+            for offset, response in kernel.items():
+                kernel[offset] = durationtools.Multiplier(response, total)
+
+        return metertools.MetricAccentKernel(kernel)
+
     @staticmethod
     def _rewrite_meter(
         components,
@@ -878,6 +948,14 @@ class Meter(AbjadValueObject):
         rewrite_tuplets=True,
         use_messiaen_style_ties=False,
         ):
+        r'''Rewrites `components` according to `meter`.
+
+        Records the splits made to each logical tie as a rewrite plan keyed
+        to the offset inventory of `meter` and to the offsets and duration
+        of the logical tie. Replays cached rewrite plans instead of
+        recomputing them when the same logical tie offsets recur in the same
+        meter.
+        '''
         from abjad.tools import metertools
         from abjad.tools import selectiontools
         from abjad.tools import mathtools
@@ -936,16 +1014,19 @@ class Meter(AbjadValueObject):
                         )
                     logical_ties = \
                         [selectiontools.LogicalTie(shard) for shard in shards]
+                    plans = []
                     for logical_tie in logical_ties:
-                        recurse(
+                        plan = recurse(
                             boundary_depth=boundary_depth,
                             boundary_offsets=boundary_offsets,
                             depth=depth,
                             logical_tie=logical_tie,
                             )
+                        plans.append(plan)
+                    return split_offset, tuple(plans)
                 else:
                     #print()
-                    recurse(
+                    return recurse(
                         boundary_depth=boundary_depth,
                         boundary_offsets=boundary_offsets,
                         depth=depth + 1,
@@ -978,18 +1059,43 @@ class Meter(AbjadValueObject):
                 logical_ties = [
                     selectiontools.LogicalTie(shard) for shard in shards
                     ]
+                plans = []
                 for logical_tie in logical_ties:
-                    recurse(
+                    plan = recurse(
                         boundary_depth=boundary_depth,
                         boundary_offsets=boundary_offsets,
                         depth=depth,
                         logical_tie=logical_tie,
                         )
+                    plans.append(plan)
+                return split_offset, tuple(plans)
             else:
                 #print('ACCEPTABLE:', logical_tie, logical_tie_start_offset, logical_tie_stop_offset)
                 #print('\t', ' '.join([str(x) for x in offsets]))
                 #print()
                 logical_tie[:]._fuse()
+        def get_split_offsets(plan, start_offset=0):
+            if plan is None:
+                return []
+            split_offset, (left_plan, right_plan) = plan
+            split_offsets = get_split_offsets(left_plan, start_offset)
+            split_offset += start_offset
+            split_offsets.append(split_offset)
+            split_offsets.extend(get_split_offsets(right_plan, split_offset))
+            return split_offsets
+        def replay(logical_tie, plan):
+            split_offsets = get_split_offsets(plan)
+            if split_offsets:
+                durations = mathtools.difference_series([0] + split_offsets)
+                shards = mutate(logical_tie[:]).split(
+                    durations,
+                    use_messiaen_style_ties=use_messiaen_style_ties,
+                    )
+                assert len(shards) == len(split_offsets) + 1
+            else:
+                shards = [logical_tie[:]]
+            for shard in shards:
+                selectiontools.LogicalTie(shard)[:]._fuse()
         # Validate arguments.
         assert selectiontools.Selection._all_in_same_logical_voice(
             components,
@@ -1026,18 +1132,45 @@ class Meter(AbjadValueObject):
             boundary_offsets = offset_inventory[boundary_depth]
         else:
             boundary_offsets = None
+        # Rewrite plans depend on offsets relative to first offset only.
+        plan_cache = Meter._rewrite_plan_cache
+        plan_cache_key = (
+            meter.rtm_format,
+            prolation,
+            boundary_depth,
+            maximum_dot_count,
+            )
         # Cache results of iterator, as we'll be mutating the underlying collection
         iterator = metertools.MeterManager.iterate_rewrite_inputs(components)
         items = tuple(iterator)
-        for item in items:
+        # Durations survive rewriting, so get timespans before rewriting.
+        timespans = [
+            item.get_timespan()
+            if isinstance(item, selectiontools.LogicalTie) else None
+            for item in items
+            ]
+        for item, timespan in zip(items, timespans):
             if isinstance(item, selectiontools.LogicalTie):
-                #print('RECURSING:', item)
-                recurse(
-                    boundary_depth=boundary_depth,
-                    boundary_offsets=boundary_offsets,
-                    depth=0,
-                    logical_tie=item,
+                key = (
+                    plan_cache_key,
+                    timespan.start_offset - first_offset,
+                    timespan.stop_offset - first_offset,
+                    item._get_preprolated_duration(),
                     )
+                plan = plan_cache.pop(key, ())
+                if plan == ():
+                    #print('RECURSING:', item)
+                    plan = recurse(
+                        boundary_depth=boundary_depth,
+                        boundary_offsets=boundary_offsets,
+                        depth=0,
+                        logical_tie=item,
+                        )
+                    while Meter._rewrite_plan_cache_size <= len(plan_cache):
+                        plan_cache.popitem(last=False)
+                else:
+                    replay(item, plan)
+                plan_cache[key] = plan
             elif isinstance(item, scoretools.Tuplet) and rewrite_tuplets == False:
                 pass
             else:
@@ -1070,6 +1203,7 @@ class Meter(AbjadValueObject):
         denominator=32,
         discard_final_orphan_downbeat=True,
         maximum_run_length=None,
+        optimize=False,
         starting_offset=None,
         ):
         r'''Finds the best-matching sequence of meters for the offsets
@@ -1115,6 +1249,24 @@ class Meter(AbjadValueObject):
                 5/4
                 5/4
 
+        ..  container:: example
+
+            Matches the same offsets optimally:
+
+            ::
+
+                >>> for x in abjad.Meter.fit_meters(
+                ...     argument, meters, optimize=True):
+                ...     print(x.implied_time_signature)
+                ...
+                5/4
+                5/4
+                5/4
+                5/4
+
+        Fits meters greedily when `optimize` is false. Fits meters by dynamic
+        programming over all meter sequences when `optimize` is true.
+
         Coerces offsets from `argument` via
         `MetricAccentKernel.count_offsets()`.
 
@@ -1128,6 +1280,7 @@ class Meter(AbjadValueObject):
             maximum_run_length=maximum_run_length,
             meters=meters,
             offset_counter=argument,
+            optimize=optimize,
             )
         meters = session()
         return meters
@@ -1167,37 +1320,13 @@ class Meter(AbjadValueObject):
 
         Returns dictionary.
         '''
-        from abjad.tools import metertools
         assert mathtools.is_positive_integer_power_of_two(
             denominator // self.denominator)
-
-        inventory = list(self.depthwise_offset_inventory)
-        old_flag_count = durationtools.Duration(1, self.denominator).flag_count
-        new_flag_count = durationtools.Duration(1, denominator).flag_count
-        extra_depth = new_flag_count - old_flag_count
-        for _ in range(extra_depth):
-            old_offsets = inventory[-1]
-            new_offsets = []
-            for first, second in datastructuretools.Sequence(old_offsets).nwise():
-                new_offsets.append(first)
-                new_offsets.append((first + second) / 2)
-            new_offsets.append(old_offsets[-1])
-            inventory.append(tuple(new_offsets))
-
-        total = 0
-        kernel = {}
-        for offsets in inventory:
-            for offset in offsets:
-                if offset not in kernel:
-                    kernel[offset] = 0
-                kernel[offset] += 1
-                total += 1
-
-        if normalize:
-            for offset, response in kernel.items():
-                kernel[offset] = durationtools.Multiplier(response, total)
-
-        return metertools.MetricAccentKernel(kernel)
+        name = ('metric_accent_kernel', denominator, bool(normalize))
+        return self._get_cached_value(
+            name,
+            lambda: self._make_metric_accent_kernel(denominator, normalize),
+            )
 
     ### PUBLIC PROPERTIES ###
 
@@ -1308,14 +1437,21 @@ class Meter(AbjadValueObject):
 
         Returns dictionary.
         '''
-        inventory = []
-        all_offsets = set()
-        all_offsets.add(durationtools.Offset(self.numerator, self.denominator))
-        for depth, nodes in sorted(self.root_node.depthwise_inventory.items()):
-            for node in nodes:
-                all_offsets.add(durationtools.Offset(node.start_offset))
-            inventory.append(tuple(sorted(all_offsets)))
-        return tuple(inventory)
+        def make_inventory():
+            inventory = []
+            all_offsets = set()
+            all_offsets.add(
+                durationtools.Offset(self.numerator, self.denominator))
+            for depth, nodes in sorted(
+                self._root_node.depthwise_inventory.items()):
+                for node in nodes:
+                    all_offsets.add(durationtools.Offset(node.start_offset))
+                inventory.append(tuple(sorted(all_offsets)))
+            return tuple(inventory)
+        return self._get_cached_value(
+            'depthwise_offset_inventory',
+            make_inventory,
+            )
 
     @property
     def duration(self):
@@ -1346,7 +1482,7 @@ class Meter(AbjadValueObject):
         Returns time signature.
         '''
         return indicatortools.TimeSignature(
-            self.root_node.preprolated_duration)
+            self._root_node.preprolated_duration)
 
     @property
     def is_compound(self):
@@ -1563,7 +1699,7 @@ class Meter(AbjadValueObject):
 
         Returns string.
         '''
-        return self.root_node.pretty_rtm_format
+        return self._root_node.pretty_rtm_format
 
     @property
     def root_node(self):
@@ -1624,8 +1760,15 @@ class Meter(AbjadValueObject):
                     preprolated_duration=abjad.NonreducedFraction(7, 4),
                     )
 
+        Meters of the same pair share a cached rhythm tree. Gets copy of
+        cached rhythm tree the first time root node is read, so changes to
+        root node never reach other meters.
+
         Returns rhythm tree node.
         '''
+        if self._cache_key is not None:
+            self._root_node = copy.copy(self._root_node)
+            self._cache_key = None
         return self._root_node
 
     @property
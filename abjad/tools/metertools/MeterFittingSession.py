@@ -2,7 +2,10 @@
 from __future__ import print_function
 import bisect
 import collections
+import heapq
+import math
 from abjad.tools import durationtools
+from abjad.tools import mathtools
 from abjad.tools.abctools.AbjadValueObject import AbjadValueObject
 
 
@@ -10,18 +13,32 @@ class MeterFittingSession(AbjadValueObject):
     r'''Meter-fitting session.
 
     Used internally by Meter.fit_meters().
+
+    Kernels are stored as integer weight arrays on a common grid of
+    kernel-denominator steps. Offsets are placed on the same grid. Each
+    offset scores once, as when calling kernels on offset counters. Kernel
+    scores are looked up in a score table filled per grid position.
+
+    Fits meters greedily by default. Fits meters optimally by dynamic
+    programming when `optimize` is true: selected meters maximize the sum of
+    kernel scores weighted by kernel duration without exceeding maximum run
+    length.
     '''
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
         '_cached_offset_counters',
+        '_grid_positions',
         '_kernel_denominator',
+        '_kernel_scores',
+        '_kernel_weights',
         '_kernels',
         '_longest_kernel',
         '_maximum_run_length',
         '_meters',
         '_offset_counter',
+        '_optimize',
         '_ordered_offsets',
         )
 
@@ -38,6 +55,7 @@ class MeterFittingSession(AbjadValueObject):
         maximum_run_length=None,
         meters=None,
         offset_counter=None,
+        optimize=False,
         ):
         from abjad.tools import metertools
         self._cached_offset_counters = {}
@@ -67,6 +85,9 @@ class MeterFittingSession(AbjadValueObject):
                 )[-1]
         else:
             self._longest_kernel = None
+        self._optimize = bool(optimize)
+        self._kernel_scores = {}
+        self._make_grid()
 
     ### SPECIAL METHODS ###
 
@@ -76,63 +97,132 @@ class MeterFittingSession(AbjadValueObject):
         Returns meter list.
         '''
         from abjad.tools import metertools
-        selected_kernels = []
+        if self.optimize:
+            selected_kernels = self._fit_kernels_optimally()
+        else:
+            selected_kernels = self._fit_kernels_greedily()
+        selected_meters = (self.kernels[_] for _ in selected_kernels)
+        selected_meters = metertools.MeterList(selected_meters)
+        return selected_meters
+
+    ### PRIVATE METHODS ###
+
+    def _fit_kernels_greedily(self):
+        kernels = self._get_kernels([])
+        lengths = [len(_) - 1 for _ in self._kernel_weights]
+        longest_index = kernels.index(self.longest_kernel)
+        selected_indices = []
         current_offset = durationtools.Offset(0)
+        current_position = 0
         while current_offset < self.ordered_offsets[-1]:
             kernel_scores = []
-            kernels = self._get_kernels(selected_kernels)
-            offset_counter = self._get_offset_counter_at(current_offset)
-            if not offset_counter:
-                winning_kernel = self.longest_kernel
-                if selected_kernels:
-                    winning_kernel = selected_kernels[-1]
+            if not self._has_offsets_at(current_offset):
+                winning_index = longest_index
+                if selected_indices:
+                    winning_index = selected_indices[-1]
             else:
-                for kernel in kernels:
+                for index in range(len(kernels)):
                     if self.maximum_run_length and \
                         1 < len(kernels) and \
-                        self.maximum_run_length <= len(selected_kernels):
-                        last_n_kernels = \
-                            selected_kernels[-self.maximum_run_length:]
-                        if len(set(last_n_kernels)) == 1:
-                            if kernel == last_n_kernels[-1]:
+                        self.maximum_run_length <= len(selected_indices):
+                        last_n_indices = \
+                            selected_indices[-self.maximum_run_length:]
+                        if len(set(last_n_indices)) == 1:
+                            if index == last_n_indices[-1]:
                                 continue
-                    initial_score = kernel(offset_counter)
-                    lookahead_score = self._get_lookahead_score(
-                        current_offset,
-                        kernel,
-                        kernels,
+                    initial_score = self._get_kernel_score(
+                        index, current_position)
+                    lookahead_position = current_position + lengths[index]
+                    lookahead_score = sum(
+                        self._get_kernel_score(_, lookahead_position)
+                        for _ in range(len(kernels))
                         )
                     score = initial_score + lookahead_score
                     kernel_score = self.KernelScore(
-                        kernel=kernel,
+                        kernel=index,
                         score=score,
                         )
                     kernel_scores.append(kernel_score)
                 kernel_scores.sort(key=lambda kernel_score: kernel_score.score)
-                winning_kernel = kernel_scores[-1].kernel
-            selected_kernels.append(winning_kernel)
-            current_offset += winning_kernel.duration
-        selected_meters = (self.kernels[_] for _ in selected_kernels)
-        selected_meters = metertools.MeterList(selected_meters)
-        return selected_meters
-
-    ### PRIVATE METHODS ###
+                winning_index = kernel_scores[-1].kernel
+            selected_indices.append(winning_index)
+            current_offset += kernels[winning_index].duration
+            current_position += lengths[winning_index]
+        return [kernels[_] for _ in selected_indices]
+
+    def _fit_kernels_optimally(self):
+        kernels = self._get_kernels([])
+        lengths = [len(_) - 1 for _ in self._kernel_weights]
+        stop_position = self.ordered_offsets[-1] * self.kernel_denominator
+        stop_position = max(int(math.ceil(stop_position)), 0)
+        maximum_run_length = self.maximum_run_length
+        if len(kernels) < 2:
+            maximum_run_length = None
+        # states are (position, kernel index, run length) triples
+        initial_state = (0, None, 0)
+        best_scores = {initial_state: (0, None)}
+        states_by_position = {0: [initial_state]}
+        positions = [0]
+        final_states = []
+        while positions:
+            position = heapq.heappop(positions)
+            states = states_by_position.pop(position)
+            if stop_position <= position:
+                final_states.extend(states)
+                continue
+            for state in states:
+                total_score = best_scores[state][0]
+                previous_index, run_length = state[1:]
+                for index in range(len(kernels)):
+                    if maximum_run_length is None:
+                        next_run_length = 1
+                    elif index != previous_index:
+                        next_run_length = 1
+                    elif run_length < maximum_run_length:
+                        next_run_length = run_length + 1
+                    else:
+                        continue
+                    next_position = position + lengths[index]
+                    next_state = (next_position, index, next_run_length)
+                    next_score = total_score + self._get_kernel_score(
+                        index, position) * lengths[index]
+                    if next_state in best_scores:
+                        if next_score <= best_scores[next_state][0]:
+                            continue
+                    elif next_position in states_by_position:
+                        states_by_position[next_position].append(next_state)
+                    else:
+                        states_by_position[next_position] = [next_state]
+                        heapq.heappush(positions, next_position)
+                    best_scores[next_state] = (next_score, state)
+        final_states.sort(key=lambda state: best_scores[state][0])
+        state = final_states[-1]
+        selected_kernels = []
+        while state[1] is not None:
+            selected_kernels.append(kernels[state[1]])
+            state = best_scores[state][1]
+        selected_kernels.reverse()
+        return selected_kernels
+
+    def _get_kernel_score(self, index, position):
+        key = (index, position)
+        if key in self._kernel_scores:
+            return self._kernel_scores[key]
+        weights = self._kernel_weights[index]
+        start = bisect.bisect_left(self._grid_positions, position)
+        stop = bisect.bisect_right(
+            self._grid_positions,
+            position + len(weights) - 1,
+            )
+        score = 0
+        for i in range(start, stop):
+            score += weights[self._grid_positions[i] - position]
+        self._kernel_scores[key] = score
+        return score
 
     def _get_kernels(self, selected_kernels):
         return tuple(self.kernels)
 
-    def _get_lookahead_score(self, current_offset, kernel, kernels):
-        lookahead_scores = []
-        lookahead_offset = current_offset + kernel.duration
-        lookahead_offset_counter = self._get_offset_counter_at(
-            lookahead_offset)
-        for lookahead_kernel in kernels:
-            lookahead_scores.append(
-                lookahead_kernel(lookahead_offset_counter)
-                )
-        lookahead_score = sum(lookahead_scores)  # / len(lookahead_scores)
-        return lookahead_score
-
     def _get_offset_counter_at(self, start_offset):
         if start_offset in self.cached_offset_counters:
             return self.cached_offset_counters[start_offset]
@@ -152,6 +242,33 @@ class MeterFittingSession(AbjadValueObject):
         self.cached_offset_counters[start_offset] = offset_counter
         return offset_counter
 
+    def _has_offsets_at(self, start_offset):
+        stop_offset = start_offset + self.longest_kernel.duration
+        index = bisect.bisect_left(self.ordered_offsets, start_offset)
+        if index == len(self.ordered_offsets):
+            return False
+        return self.ordered_offsets[index] <= stop_offset
+
+    def _make_grid(self):
+        kernels = self._get_kernels([])
+        weights = [_._get_weights(self.kernel_denominator) for _ in kernels]
+        denominators = set()
+        for weights_ in weights:
+            denominators.update(_.denominator for _ in weights_)
+        multiplier = 1
+        if denominators:
+            multiplier = mathtools.least_common_multiple(*denominators)
+        self._kernel_weights = [
+            [int(_ * multiplier) for _ in weights_]
+            for weights_ in weights
+            ]
+        self._grid_positions = []
+        for offset in self.ordered_offsets:
+            position = offset * self.kernel_denominator
+            if position.denominator != 1 or position < 0:
+                continue
+            self._grid_positions.append(int(position))
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -210,6 +327,14 @@ class MeterFittingSession(AbjadValueObject):
         '''
         return self._offset_counter
 
+    @property
+    def optimize(self):
+        r'''Is true when session fits meters optimally. Otherwise false.
+
+        Returns true or false.
+        '''
+        return self._optimize
+
     @property
     def ordered_offsets(self):
         r'''Gets ordered offsets.
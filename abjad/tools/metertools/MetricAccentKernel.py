@@ -119,6 +119,22 @@ class MetricAccentKernel(AbjadValueObject):
             storage_format_kwargs_names=[],
             )
 
+    def _get_weights(self, denominator):
+        r'''Gets weights on grid of `denominator` steps.
+
+        Weight at index ``i`` is weight of offset ``i / denominator``.
+
+        Returns list of multipliers.
+        '''
+        denominator = durationtools.Duration(denominator)
+        length = int(self.duration * denominator) + 1
+        weights = [durationtools.Multiplier(0)] * length
+        for offset, weight in self._kernel.items():
+            index = offset * denominator
+            assert index.denominator == 1, repr(offset)
+            weights[int(index)] = weight
+        return weights
+
     ### PUBLIC METHODS ###
 
     @staticmethod
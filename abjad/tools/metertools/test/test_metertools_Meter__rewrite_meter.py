@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _make_staff(measure_count, strings):
+    measures = []
+    for i in range(measure_count):
+        string = strings[i % len(strings)]
+        measures.append(abjad.Measure((4, 4), string))
+    return abjad.Staff(measures)
+
+
+def _clear_caches():
+    abjad.Meter._meter_cache.clear()
+    abjad.Meter._rewrite_plan_cache.clear()
+
+
+def test_metertools_Meter__rewrite_meter_01():
+    r'''Meters of same pair share rhythm trees, offset inventories and
+    kernels. Meters equal uncached meters.
+    '''
+
+    _clear_caches()
+    meter_1 = abjad.Meter((7, 8))
+    meter_2 = abjad.Meter(abjad.TimeSignature((7, 8)))
+    meter_3 = abjad.Meter((7, 8), decrease_durations_monotonically=False)
+    meter_4 = abjad.Meter(meter_1.rtm_format)
+    assert meter_1._root_node is meter_2._root_node
+    assert meter_1._root_node is not meter_3._root_node
+    assert meter_1 == meter_2 == meter_4
+    assert meter_1 != meter_3
+    assert meter_1.depthwise_offset_inventory is \
+        meter_2.depthwise_offset_inventory
+    assert meter_1.depthwise_offset_inventory == \
+        meter_4.depthwise_offset_inventory
+    kernel = meter_1.generate_offset_kernel_to_denominator(32)
+    assert kernel is meter_2.generate_offset_kernel_to_denominator(32)
+    assert kernel == meter_4.generate_offset_kernel_to_denominator(32)
+    assert kernel != meter_1.generate_offset_kernel_to_denominator(16)
+    _clear_caches()
+    assert abjad.Meter((7, 8))._root_node is not meter_1._root_node
+    assert abjad.Meter((7, 8)) == meter_1
+
+
+def test_metertools_Meter__rewrite_meter_02():
+    r'''Cached rewrite plans rewrite meter like uncached rewrite plans.
+    '''
+
+    strings = [
+        "c'16 c'4 c'8. ~ c'4 c'4",
+        "c'8. c'16 ~ c'2 ~ c'8. c'16",
+        r"r16 c'2. \times 2/3 { c'16 r8 } r16",
+        "c'32 c'8.. ~ c'4 ~ c'4 c'4",
+        ]
+    for keywords in ({}, {'boundary_depth': 1}, {'maximum_dot_count': 0}):
+        staff = _make_staff(8, strings)
+        expected_formats = []
+        for measure in staff:
+            _clear_caches()
+            abjad.mutate(measure[:]).rewrite_meter((4, 4), **keywords)
+            expected_formats.append(format(measure))
+        staff = _make_staff(8, strings)
+        for measure, expected_format in zip(staff, expected_formats):
+            abjad.mutate(measure[:]).rewrite_meter((4, 4), **keywords)
+            assert format(measure) == expected_format
+        assert abjad.inspect(staff).is_well_formed()
+
+
+def test_metertools_Meter__rewrite_meter_03():
+    r'''Rewriting repeated rhythms with cached rewrite plans matches
+    rewriting with empty caches.
+    '''
+
+    strings = ["r16 c'2.. r16", "c'8. c'16 ~ c'2 ~ c'8. c'16"]
+
+    staff = _make_staff(24, strings)
+    for measure in staff:
+        _clear_caches()
+        abjad.mutate(measure[:]).rewrite_meter((4, 4))
+    expected_format = format(staff)
+
+    staff = _make_staff(24, strings)
+    for measure in staff:
+        abjad.mutate(measure[:]).rewrite_meter((4, 4))
+    assert format(staff) == expected_format
+
+
+def test_metertools_Meter__rewrite_meter_04():
+    r'''Changes to root node of meter do not reach cached rhythm tree.
+    '''
+
+    _clear_caches()
+    strings = ["c'8. c'16 ~ c'2 ~ c'8. c'16"]
+    staff = _make_staff(1, strings)
+    abjad.mutate(staff[0][:]).rewrite_meter((4, 4))
+    expected_format = format(staff)
+
+    meter = abjad.Meter((4, 4))
+    root_node = meter.root_node
+    assert meter.root_node is root_node
+    container = abjad.rhythmtreetools.RhythmTreeContainer(
+        preprolated_duration=(2, 1),
+        )
+    container.append(root_node)
+    assert root_node.parent is container
+    root_node.append(abjad.rhythmtreetools.RhythmTreeLeaf())
+    assert abjad.Meter((4, 4)).root_node.parent is None
+    assert abjad.Meter((4, 4)).rtm_format == '(4/4 (1/4 1/4 1/4 1/4))'
+
+    staff = _make_staff(1, strings)
+    abjad.mutate(staff[0][:]).rewrite_meter((4, 4))
+    assert format(staff) == expected_format
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _make_offsets(count):
+    offsets = []
+    start_offset = abjad.Offset(0)
+    numerators = [3, 4, 5, 4, 5, 3, 5]
+    i = 0
+    while len(offsets) < count:
+        numerator = numerators[i % len(numerators)]
+        for beat in range(numerator):
+            offset = start_offset + abjad.Offset(beat, 4)
+            offsets.append(offset)
+            if (i + beat) % 3:
+                offsets.append(offset + abjad.Offset(1, 8))
+        start_offset += abjad.Offset(numerator, 4)
+        i += 1
+    offsets.append(start_offset)
+    return offsets
+
+
+def _fit_meters_by_kernel_calls(offsets, meters, maximum_run_length=None):
+    session = abjad.metertools.MeterFittingSession(
+        maximum_run_length=maximum_run_length,
+        meters=meters,
+        offset_counter=offsets,
+        )
+    kernels = tuple(session.kernels)
+    selected_kernels = []
+    current_offset = abjad.Offset(0)
+    while current_offset < session.ordered_offsets[-1]:
+        offset_counter = session._get_offset_counter_at(current_offset)
+        if not offset_counter:
+            winning_kernel = session.longest_kernel
+            if selected_kernels:
+                winning_kernel = selected_kernels[-1]
+        else:
+            kernel_scores = []
+            for kernel in kernels:
+                if maximum_run_length and \
+                    maximum_run_length <= len(selected_kernels):
+                    last_n_kernels = selected_kernels[-maximum_run_length:]
+                    if len(set(last_n_kernels)) == 1:
+                        if kernel == last_n_kernels[-1]:
+                            continue
+                lookahead_offset_counter = session._get_offset_counter_at(
+                    current_offset + kernel.duration)
+                score = kernel(offset_counter)
+                score += sum(_(lookahead_offset_counter) for _ in kernels)
+                kernel_scores.append((kernel, score))
+            kernel_scores.sort(key=lambda _: _[1])
+            winning_kernel = kernel_scores[-1][0]
+        selected_kernels.append(winning_kernel)
+        current_offset += winning_kernel.duration
+    return [session.kernels[_].rtm_format for _ in selected_kernels]
+
+
+def _get_total_score(offsets, meters):
+    session = abjad.metertools.MeterFittingSession(
+        meters=meters,
+        offset_counter=offsets,
+        )
+    total_score = 0
+    current_offset = abjad.Offset(0)
+    for meter in meters:
+        kernel = meter.generate_offset_kernel_to_denominator(32)
+        offset_counter = session._get_offset_counter_at(current_offset)
+        total_score += kernel(offset_counter) * kernel.duration
+        current_offset += kernel.duration
+    return total_score
+
+
+def test_metertools_Meter_fit_meters_01():
+    r'''Fits meters greedily like kernels called on offset counters.
+    '''
+
+    offsets = _make_offsets(300)
+    offsets.extend(abjad.Offset(_, 3) for _ in range(0, 100, 7))
+    offsets.extend(abjad.Offset(_, 16) for _ in range(0, 400, 13))
+    for pairs in ([(3, 4), (4, 4), (5, 4)], [(3, 8), (5, 8), (2, 4)]):
+        meters = [abjad.Meter(_) for _ in pairs]
+        for maximum_run_length in (None, 1, 2):
+            expected = _fit_meters_by_kernel_calls(
+                offsets,
+                meters,
+                maximum_run_length=maximum_run_length,
+                )
+            result = abjad.Meter.fit_meters(
+                offsets,
+                meters,
+                maximum_run_length=maximum_run_length,
+                )
+            assert [_.rtm_format for _ in result] == expected
+
+
+def test_metertools_Meter_fit_meters_02():
+    r'''Fits meters optimally.
+    '''
+
+    meters = [abjad.Meter(_) for _ in [(3, 4), (4, 4), (5, 4)]]
+    offsets = [(0, 4), (3, 4), (5, 4), (10, 4), (15, 4), (20, 4)]
+    result = abjad.Meter.fit_meters(offsets, meters, optimize=True)
+    assert [_.rtm_format for _ in result] == \
+        [abjad.Meter((5, 4)).rtm_format] * 4
+
+    offsets = _make_offsets(200)
+    greedy_meters = abjad.Meter.fit_meters(offsets, meters)
+    optimal_meters = abjad.Meter.fit_meters(offsets, meters, optimize=True)
+    assert _get_total_score(offsets, greedy_meters) <= \
+        _get_total_score(offsets, optimal_meters)
+    assert offsets[-1] <= sum(_.duration for _ in optimal_meters)
+
+    result = abjad.Meter.fit_meters(
+        offsets,
+        meters,
+        maximum_run_length=1,
+        optimize=True,
+        )
+    for left, right in zip(result, result[1:]):
+        assert left.rtm_format != right.rtm_format
+
+
+def test_metertools_Meter_fit_meters_03():
+    r'''Fits meters to 2000 offsets like kernels called on offset counters.
+    '''
+
+    meters = [abjad.Meter(_) for _ in [(3, 4), (4, 4), (5, 4)]]
+    offsets = _make_offsets(2000)
+    expected = _fit_meters_by_kernel_calls(offsets, meters)
+    result = abjad.Meter.fit_meters(offsets, meters)
+    assert [_.rtm_format for _ in result] == expected
@@ -118,17 +118,21 @@ class NamedPitch(Pitch):
         '_name',
         )
 
+    _pitch_name_to_fields = {}
+
     ### INITIALIZER ###
 
     def __init__(self, name="c'", arrow=None):
         import abjad
-        if self._is_pitch_name(name):
+        if isinstance(name, str) and name in self._pitch_name_to_fields:
             pass
-        elif self._is_pitch_class_octave_number_string(name):
-            name = self._american_name_to_lilypond_name(name)
         elif isinstance(name, type(self)):
             arrow = name.arrow
             name = name.name
+        elif self._is_pitch_name(name):
+            pass
+        elif self._is_pitch_class_octave_number_string(name):
+            name = self._american_name_to_lilypond_name(name)
         elif isinstance(name, abjad.NamedPitchClass):
             name = name.name + "'"
         elif isinstance(name, tuple) and len(name) == 2:
@@ -145,9 +149,9 @@ class NamedPitch(Pitch):
             message = 'can not initialize {} from {!r}.'
             message = message.format(type(self).__name__, name)
             raise ValueError(message)
-        assert self._is_pitch_name(name)
+        assert self._get_pitch_name_fields(name) is not None
         self._name = name
-        if arrow not in (Up, Down, None):
+        if arrow is not None and arrow not in (Up, Down):
             message = 'arrow must be up, down or none: {!r}.'
             message = message.format(arrow)
             raise TypeError(message)
@@ -261,6 +265,11 @@ class NamedPitch(Pitch):
 
         Returns true or false.
         '''
+        if type(argument) is type(self):
+            return (
+                self._name == argument._name and
+                self._arrow == argument._arrow
+                )
         return super(NamedPitch, self).__eq__(argument)
 
     def __hash__(self):
@@ -268,7 +277,7 @@ class NamedPitch(Pitch):
 
         Returns integer.
         '''
-        return super(NamedPitch, self).__hash__()
+        return hash((type(self), self._arrow, self._name))
 
     def __lt__(self, argument):
         r'''Is true when named pitch is less than `argument`. Otherwise false.
@@ -402,7 +411,7 @@ class NamedPitch(Pitch):
         return type(self)(name)
 
     def _get_alteration(self):
-        return self.accidental.semitones
+        return self._get_pitch_name_fields(self.name)[3]
 
     def _get_diatonic_pitch_class_name(self):
         return self._parse_name()[0]
@@ -422,9 +431,7 @@ class NamedPitch(Pitch):
         return diatonic_pitch_class_name + ticks
 
     def _get_diatonic_pitch_number(self):
-        diatonic_pitch_number = 7 * (self.octave.number - 4)
-        diatonic_pitch_number += self._get_diatonic_pitch_class_number()
-        return diatonic_pitch_number
+        return self._get_pitch_name_fields(self.name)[5]
 
     def _get_format_specification(self):
         import abjad
@@ -440,6 +447,42 @@ class NamedPitch(Pitch):
     def _get_lilypond_format(self):
         return str(self)
 
+    @staticmethod
+    def _get_pitch_name_fields(name):
+        fields = NamedPitch._pitch_name_to_fields.get(name)
+        if fields is not None:
+            return fields
+        if not NamedPitch._is_pitch_name(name):
+            return None
+        import abjad
+        groups = NamedPitch._pitch_name_regex.match(name).groups()
+        assert len(groups) == 5, repr(groups)
+        diatonic_pitch_class_name = groups[0]
+        accidental_abbreviation = groups[1]
+        ticks = groups[4]
+        alteration = abjad.Accidental(accidental_abbreviation).semitones
+        octave_number = abjad.Octave(ticks).number
+        class_ = abjad.PitchClass
+        diatonic_pitch_number = 7 * (octave_number - 4)
+        diatonic_pitch_number += \
+            class_._diatonic_pitch_class_name_to_diatonic_pitch_class_number[
+                diatonic_pitch_class_name]
+        number = 12 * (octave_number - 4)
+        number += class_._diatonic_pitch_class_name_to_pitch_class_number[
+            diatonic_pitch_class_name]
+        number += alteration
+        fields = (
+            diatonic_pitch_class_name,
+            accidental_abbreviation,
+            ticks,
+            alteration,
+            octave_number,
+            diatonic_pitch_number,
+            number,
+            )
+        NamedPitch._pitch_name_to_fields[name] = fields
+        return fields
+
     def _get_pitch_class_name(self):
         parts = self._parse_name()
         return parts[0] + parts[1]
@@ -460,17 +503,10 @@ class NamedPitch(Pitch):
         return contributions
 
     def _parse_name(self):
-        match = self._pitch_name_regex.match(self.name)
-        if match is None:
+        fields = self._get_pitch_name_fields(self.name)
+        if fields is None:
             raise Exception(repr(self.name))
-        groups = match.groups()
-        assert len(groups) == 5, repr(groups)
-        diatonic_pitch_class_name = groups[0]
-        accidental_abbreviation = groups[1]
-        groups[2] is None
-        groups[3] is None
-        ticks = groups[4]
-        return diatonic_pitch_class_name, accidental_abbreviation, ticks
+        return fields[:3]
 
     def _respell_with_flats(self):
         import abjad
@@ -635,14 +671,7 @@ class NamedPitch(Pitch):
 
         Returns number.
         '''
-        import abjad
-        number = 12 * (self.octave.number - 4)
-        class_ = abjad.PitchClass
-        number += class_._diatonic_pitch_class_name_to_pitch_class_number[
-            self._get_diatonic_pitch_class_name()
-            ]
-        number += self._get_alteration()
-        return number
+        return self._get_pitch_name_fields(self.name)[6]
 
     @property
     def octave(self):
@@ -668,7 +697,7 @@ class NamedPitch(Pitch):
         Returns octave.
         '''
         import abjad
-        return abjad.Octave(self._parse_name()[2])
+        return abjad.Octave(self._get_pitch_name_fields(self.name)[4])
 
     @property
     def pitch_class(self):
@@ -694,7 +723,7 @@ class NamedPitch(Pitch):
         Returns named pitch-class.
         '''
         import abjad
-        return abjad.NamedPitchClass(self._get_pitch_class_name())
+        return abjad.NamedPitchClass(self)
 
     ### PUBLIC METHODS ###
 
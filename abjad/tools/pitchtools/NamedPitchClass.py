@@ -137,7 +137,12 @@ class NamedPitchClass(PitchClass):
             pitchtools.NumberedPitch,
             pitchtools.NumberedPitchClass,
             )
-        if isinstance(name, type(self)):
+        if (
+            isinstance(name, str) and
+            name in pitchtools.NamedPitch._pitch_name_to_fields
+            ):
+            self._initialize_by_pitch_name(name)
+        elif isinstance(name, type(self)):
             self._initialize_by_named_pitch_class(name)
         elif isinstance(name, pitchtools.NamedPitch):
             self._initialize_by_named_pitch(name)
@@ -236,6 +241,12 @@ class NamedPitchClass(PitchClass):
 
         Returns true or false.
         '''
+        if type(argument) is type(self):
+            return (
+                self._alteration == argument._alteration and
+                self._diatonic_pitch_class_number ==
+                argument._diatonic_pitch_class_number
+                )
         return super(NamedPitchClass, self).__eq__(argument)
 
     def __format__(self, format_specification=''):
@@ -262,7 +273,7 @@ class NamedPitchClass(PitchClass):
 
         Returns integer.
         '''
-        return super(NamedPitchClass, self).__hash__()
+        return hash((type(self), self.name))
 
     def __lt__(self, argument):
         r'''Is true when `argument` is a named pitch-class with a pitch
@@ -420,14 +431,11 @@ class NamedPitchClass(PitchClass):
 
     def _initialize_by_pitch_name(self, argument):
         from abjad.tools import pitchtools
-        match = pitchtools.Pitch._pitch_name_regex.match(argument.lower())
-        if match is None:
+        fields = pitchtools.NamedPitch._get_pitch_name_fields(argument.lower())
+        if fields is None:
             raise ValueError
-        groups = match.groups()
-        diatonic_pitch_class_name = groups[0]
-        abbreviation = groups[1]
-        accidental = pitchtools.Accidental(abbreviation)
-        self._alteration = accidental.semitones
+        diatonic_pitch_class_name = fields[0]
+        self._alteration = fields[3]
         self._diatonic_pitch_class_number = \
             self._diatonic_pitch_class_name_to_diatonic_pitch_class_number[
                 diatonic_pitch_class_name]
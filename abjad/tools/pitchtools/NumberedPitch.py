@@ -99,7 +99,7 @@ class NumberedPitch(Pitch):
             number = pitchtools.NamedPitch(number).number
         number = mathtools.integer_equivalent_number_to_integer(number)
         self._number = number
-        if arrow not in (Up, Down, None):
+        if arrow is not None and arrow not in (Up, Down):
             message = 'arrow must be up, down or none: {!r}.'
             message = message.format(arrow)
             raise TypeError(message)
@@ -128,6 +128,37 @@ class NumberedPitch(Pitch):
         semitones = self.number + argument.number
         return type(self)(semitones)
 
+    def __eq__(self, argument):
+        r'''Is true when `argument` is a numbered pitch equal to this numbered
+        pitch. Otherwise false.
+
+        ..  container:: example
+
+            ::
+
+                >>> abjad.NumberedPitch(13) == abjad.NumberedPitch(13)
+                True
+                >>> abjad.NumberedPitch(13) == abjad.NumberedPitch(14)
+                False
+
+        Returns true or false.
+        '''
+        if type(argument) is type(self):
+            return (
+                self._number == argument._number and
+                self._arrow == argument._arrow
+                )
+        return super(NumberedPitch, self).__eq__(argument)
+
+    def __hash__(self):
+        r'''Hashes numbered pitch.
+
+        Required to be explicitly redefined on Python 3 if __eq__ changes.
+
+        Returns integer.
+        '''
+        return hash((type(self), self._arrow, self._number))
+
     def __lt__(self, argument):
         r'''Is true when `argument` can be coerced to a numbered pitch and when this
         numbered pitch is less than `argument`. Otherwise false.
@@ -208,6 +208,8 @@ class NumberedPitchClass(PitchClass):
 
         Returns true or false.
         '''
+        if type(argument) is type(self):
+            return self._number == argument._number
         return super(NumberedPitchClass, self).__eq__(argument)
 
     def __format__(self, format_specification=''):
@@ -234,7 +236,7 @@ class NumberedPitchClass(PitchClass):
 
         Returns integer.
         '''
-        return super(NumberedPitchClass, self).__hash__()
+        return hash((type(self), self._number))
 
     def __lt__(self, argument):
         r'''Is true when `argument` is a numbered pitch-class with a pitch
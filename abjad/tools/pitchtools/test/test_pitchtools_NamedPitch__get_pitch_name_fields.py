@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _get_pitch_names():
+    pitch_names = []
+    for diatonic_pitch_class_name in 'cdefgab':
+        for abbreviation in ('', 's', 'f', 'ss', 'ff', 'qs', 'qf', 'tqs'):
+            for ticks in ('', "'", "''", ',', ',,'):
+                pitch_name = diatonic_pitch_class_name + abbreviation + ticks
+                pitch_names.append(pitch_name)
+    return pitch_names
+
+
+def test_pitchtools_NamedPitch__get_pitch_name_fields_01():
+    r'''Interned fields equal fields parsed from pitch name.
+    '''
+
+    class_ = abjad.PitchClass
+    for pitch_name in _get_pitch_names():
+        pitch = abjad.NamedPitch(pitch_name)
+        groups = abjad.NamedPitch._pitch_name_regex.match(pitch_name).groups()
+        accidental = abjad.Accidental(groups[1])
+        octave = abjad.Octave(groups[4])
+        assert pitch.accidental == accidental
+        assert pitch.octave == octave
+        pitch_class = abjad.NamedPitchClass(groups[0] + groups[1])
+        assert pitch.pitch_class == pitch_class
+        number = 12 * (octave.number - 4)
+        number += class_._diatonic_pitch_class_name_to_pitch_class_number[
+            groups[0]]
+        number += accidental.semitones
+        assert pitch.number == number
+        assert abjad.NumberedPitch(pitch).number == number
+        diatonic_pitch_number = 7 * (octave.number - 4)
+        diatonic_pitch_number += \
+            class_._diatonic_pitch_class_name_to_diatonic_pitch_class_number[
+                groups[0]]
+        assert pitch._get_diatonic_pitch_number() == diatonic_pitch_number
+
+
+def test_pitchtools_NamedPitch__get_pitch_name_fields_02():
+    r'''Interned fields leave equality and hashing unchanged.
+    '''
+
+    for pitch_name in _get_pitch_names():
+        for class_ in (abjad.NamedPitch, abjad.NamedPitchClass):
+            pitch = class_(pitch_name)
+            agent = abjad.StorageFormatAgent(pitch)
+            assert hash(pitch) == hash(agent.get_hash_values())
+            assert pitch == class_(pitch_name)
+            assert pitch == pitch_name
+    pitch = abjad.NamedPitch("cs'", arrow=Up)
+    assert pitch == abjad.NamedPitch("cs'", arrow=Up)
+    assert pitch != abjad.NamedPitch("cs'")
+    agent = abjad.StorageFormatAgent(pitch)
+    assert hash(pitch) == hash(agent.get_hash_values())
+    assert abjad.NamedPitch('c') != 'x'
+    assert abjad.NumberedPitch(13) == abjad.NumberedPitch("cs''")
+    assert abjad.NumberedPitch(13) != abjad.NumberedPitch(13, arrow=Down)
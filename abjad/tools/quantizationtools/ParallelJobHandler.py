@@ -15,36 +15,210 @@ class ParallelJobHandler(JobHandler):
         >>> import abjad
         >>> from abjad.tools import quantizationtools
 
+    ..  container:: example
+
+        ::
+
+            >>> job_handler = quantizationtools.ParallelJobHandler(
+            ...     processes=2,
+            ...     chunksize=4,
+            ...     )
+            >>> job_handler
+            ParallelJobHandler(processes=2, chunksize=4)
+
+    Worker processes start on first call and persist between calls until the
+    job handler is closed, terminated or deleted. Use the job handler as a
+    context manager to share one pool of worker processes across many
+    quantizer calls:
+
+    ::
+
+        >>> with quantizationtools.ParallelJobHandler() as job_handler:
+        ...     quantizer = quantizationtools.Quantizer()
+        ...     for durations in ([1000, 1000], [500, 250, 250]):
+        ...         sequence = quantizationtools.QEventSequence.from_millisecond_durations(
+        ...             durations)
+        ...         result = quantizer(sequence, job_handler=job_handler)
+        ...
+
+    Jobs travel to and from worker processes pickled with the highest
+    available pickle protocol.
     '''
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
+        '_chunksize',
+        '_pool',
+        '_processes',
         )
 
+    ### INITIALIZER ###
+
+    def __init__(self, processes=None, chunksize=None):
+        if processes is not None:
+            processes = int(processes)
+            assert 0 < processes, repr(processes)
+        if chunksize is not None:
+            chunksize = int(chunksize)
+            assert 0 < chunksize, repr(chunksize)
+        self._processes = processes
+        self._chunksize = chunksize
+        self._pool = None
+
     ### SPECIAL METHODS ###
 
     def __call__(self, jobs):
         r'''Calls parallel job handler.
+
+        Returns finished jobs in the order of `jobs`.
         '''
-        from abjad.tools import quantizationtools
-        finished_jobs = []
-        job_queue = multiprocessing.JoinableQueue()
-        result_queue = multiprocessing.Queue()
-        workers = [quantizationtools.ParallelJobHandlerWorker(
-            job_queue, result_queue)
-            for i in range(multiprocessing.cpu_count() * 2)]
-        for worker in workers:
-            worker.start( )
-        for job in jobs:
-            job_queue.put(pickle.dumps(job, protocol=0))
-        for i in range(len(jobs)):
-            finished_jobs.append(pickle.loads(result_queue.get()))
-        for worker in workers:
-            job_queue.put(None)
-        job_queue.join()
-        result_queue.close()
-        job_queue.close()
-        for worker in workers:
-             worker.join()
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        pool = self._get_pool()
+        pickled_jobs = [
+            pickle.dumps(job, protocol=pickle.HIGHEST_PROTOCOL)
+            for job in jobs
+            ]
+        chunksize = self.chunksize
+        if chunksize is None:
+            chunksize = self._get_default_chunksize(len(jobs))
+        pickled_jobs = pool.map(
+            _process_pickled_job,
+            pickled_jobs,
+            chunksize,
+            )
+        finished_jobs = [pickle.loads(_) for _ in pickled_jobs]
         return finished_jobs
+
+    def __del__(self):
+        r'''Deletes parallel job handler.
+
+        Terminates worker processes.
+
+        Returns none.
+        '''
+        if getattr(self, '_pool', None) is not None:
+            self.terminate()
+
+    def __enter__(self):
+        r'''Enters parallel job handler context manager.
+
+        Returns parallel job handler.
+        '''
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r'''Exits parallel job handler context manager.
+
+        Closes worker processes.
+
+        Returns none.
+        '''
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def __getstate__(self):
+        r'''Gets state of parallel job handler.
+
+        Excludes worker processes.
+
+        Returns dictionary.
+        '''
+        state = JobHandler.__getstate__(self)
+        state['_pool'] = None
+        return state
+
+    ### PRIVATE METHODS ###
+
+    def _get_default_chunksize(self, job_count):
+        processes = self.processes or multiprocessing.cpu_count()
+        chunksize, remainder = divmod(job_count, processes * 4)
+        if remainder:
+            chunksize += 1
+        return chunksize
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=self.processes)
+        return self._pool
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def chunksize(self):
+        r'''Gets number of jobs sent to a worker process at one time.
+
+        ..  container:: example
+
+            ::
+
+                >>> quantizationtools.ParallelJobHandler(chunksize=8).chunksize
+                8
+
+        Defaults to none.
+
+        Set to positive integer or none.
+
+        Calculates chunksize from number of jobs and worker processes when
+        none.
+
+        Returns positive integer or none.
+        '''
+        return self._chunksize
+
+    @property
+    def processes(self):
+        r'''Gets number of worker processes.
+
+        ..  container:: example
+
+            ::
+
+                >>> quantizationtools.ParallelJobHandler(processes=4).processes
+                4
+
+        Defaults to none.
+
+        Set to positive integer or none.
+
+        Uses one worker process per CPU when none.
+
+        Returns positive integer or none.
+        '''
+        return self._processes
+
+    ### PUBLIC METHODS ###
+
+    def close(self):
+        r'''Closes worker processes after outstanding jobs finish.
+
+        Job handler starts new worker processes when next called.
+
+        Returns none.
+        '''
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def terminate(self):
+        r'''Terminates worker processes immediately.
+
+        Job handler starts new worker processes when next called.
+
+        Returns none.
+        '''
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def _process_pickled_job(pickled_job):
+    job = pickle.loads(pickled_job)
+    job()
+    return pickle.dumps(job, protocol=pickle.HIGHEST_PROTOCOL)
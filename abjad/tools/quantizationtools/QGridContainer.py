@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import copy
 from abjad.tools.rhythmtreetools import RhythmTreeContainer
 
 
@@ -28,6 +29,19 @@ class QGridContainer(RhythmTreeContainer):
     __slots__ = (
         )
 
+    ### SPECIAL METHODS ###
+
+    def __copy__(self, *arguments):
+        r'''Copies q-grid container.
+
+        Returns new q-grid container.
+        '''
+        return type(self)(
+            children=[copy.copy(_) for _ in self.children],
+            preprolated_duration=self.preprolated_duration,
+            name=self.name,
+            )
+
     ### PRIVATE PROPERTIES ###
 
     @property
@@ -70,6 +70,17 @@ class QGridLeaf(RhythmTreeMixin, TreeNode):
         maker = abjad.NoteMaker()
         return maker(0, total_duration)
 
+    def __copy__(self, *arguments):
+        r'''Copies q-grid leaf.
+
+        Returns new q-grid leaf.
+        '''
+        return type(self)(
+            preprolated_duration=self.preprolated_duration,
+            q_event_proxies=self.q_event_proxies,
+            is_divisible=self.is_divisible,
+            )
+
     def __graph__(self, **keywords):
         r'''Graphviz graph of q-grid leaf.
 
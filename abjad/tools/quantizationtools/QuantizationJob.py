@@ -105,32 +105,8 @@ class QuantizationJob(AbjadObject):
 
         Returns none.
         '''
-        from abjad.tools import quantizationtools
-        #print('XXX')
-        #print(format(self.q_event_proxies[0]))
-
-        q_grid = quantizationtools.QGrid()
-        q_grid.fit_q_events(self.q_event_proxies)
-
-        #print(format(q_grid))
-
-        old_q_grids = []
-        new_q_grids = [q_grid]
-
-        while new_q_grids:
-            q_grid = new_q_grids.pop()
-            search_results = self.search_tree(q_grid)
-            #print q_grid.rtm_format
-            #for x in search_results:
-            #    print '\t', x.rtm_format
-            new_q_grids.extend(search_results)
-            old_q_grids.append(q_grid)
-
-        #for q_grid in old_q_grids:
-        #    print('\t', q_grid)
-        #print()
-
-        self._q_grids = tuple(old_q_grids)
+        q_grids = self.search_tree._search(self.q_event_proxies)
+        self._q_grids = tuple(q_grids)
 
     def __eq__(self, argument):
         r'''Is true when `argument` is a quantization job with job ID, search tree,
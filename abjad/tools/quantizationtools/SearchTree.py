@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 import abc
+import collections
 import copy
 from abjad.tools import datastructuretools
 from abjad.tools import mathtools
+from abjad.tools import systemtools
 from abjad.tools.abctools import AbjadObject
 
 
@@ -21,22 +23,40 @@ class SearchTree(AbjadObject):
     subdivisions in the quantization output.  That is to say, they allow
     composers to specify what sorts of tuplets and ratios of pulses may be
     contained within other tuplets, to arbitrary levels of nesting.
+
+    Set `memoize` to true to cache search results by the normalized offsets of
+    the ``QEventProxy`` instances searched. Beats with identical q-event
+    patterns then reuse the ``QGrids`` found for earlier beats.
+
+    Set `prune` to true to skip subdividing any ``QGrid`` none of whose
+    descendants can have a smaller distance than the best ``QGrid`` found so
+    far. Pruned searches return only those ``QGrids`` which improve on all
+    ``QGrids`` found before them, and so always return the ``QGrid`` selected
+    by the ``DistanceHeuristic``.
     '''
 
     ### CLASS VARIABLES ###
 
     __slots__ = (
         '_definition',
+        '_memoize',
+        '_prune',
         )
 
+    _search_cache = collections.OrderedDict()
+
+    _search_cache_size = 1024
+
     ### INITIALIZER ###
 
-    def __init__(self, definition=None):
+    def __init__(self, definition=None, memoize=False, prune=False):
         if definition is None:
             definition = self.default_definition
         else:
             assert self._is_valid_definition(definition)
         self._definition = definition
+        self._memoize = bool(memoize)
+        self._prune = bool(prune)
 
     ### SPECIAL METHODS ###
 
@@ -55,14 +75,16 @@ class SearchTree(AbjadObject):
         return new_q_grids
 
     def __eq__(self, argument):
-        r'''Is true when `argument` is a search tree with definition equal to that of
-        this search tree. Otherwise false.
+        r'''Is true when `argument` is a search tree with definition, memoize
+        and prune equal to those of this search tree. Otherwise false.
 
         Returns true or false.
         '''
         if type(self) == type(argument):
             if self.definition == argument.definition:
-                return True
+                if self.memoize == argument.memoize:
+                    if self.prune == argument.prune:
+                        return True
         return False
 
     def __hash__(self):
@@ -108,6 +130,24 @@ class SearchTree(AbjadObject):
     def _find_leaf_subdivisions(self, leaf):
         raise NotImplementedError
 
+    def _freeze_q_grids(self, q_grids, q_event_proxies):
+        indices = dict((id(_), i) for i, _ in enumerate(q_event_proxies))
+        frozen_q_grids = []
+        for q_grid in q_grids:
+            root_node = copy.copy(q_grid.root_node)
+            if hasattr(root_node, 'leaves'):
+                leaves = root_node.leaves
+            else:
+                leaves = (root_node,)
+            for leaf in leaves:
+                leaf._q_event_proxies = []
+            placements = tuple(
+                tuple(indices[id(_)] for _ in leaf.q_event_proxies)
+                for leaf in q_grid.leaves
+                )
+            frozen_q_grids.append((root_node, placements))
+        return tuple(frozen_q_grids)
+
     def _generate_all_subdivision_commands(self, q_grid):
         indices, subdivisions = \
             self._find_divisible_leaf_indices_and_subdivisions(q_grid)
@@ -118,10 +158,109 @@ class SearchTree(AbjadObject):
         combinations = [tuple(_) for _ in combinations]
         return tuple(tuple(zip(indices, combo)) for combo in combinations)
 
+    def _get_format_specification(self):
+        agent = systemtools.StorageFormatAgent(self)
+        names = agent.signature_names
+        template_names = names[:]
+        for name in ('memoize', 'prune'):
+            if name in names and not getattr(self, name):
+                names.remove(name)
+        return systemtools.FormatSpecification(
+            client=self,
+            storage_format_kwargs_names=names,
+            template_names=template_names,
+            )
+
+    def _get_lower_bound_distance(self, q_grid):
+        # proxies falling within the span of a leaf which may still be
+        # subdivided may reach distance zero; all others keep their distance
+        leaves, offsets = q_grid.leaves, q_grid.offsets
+        fixed_distance = 0
+        count = 0
+        subdividable_leaves = {}
+        for i, leaf in enumerate(leaves):
+            for q_event_proxy in leaf.q_event_proxies:
+                count += 1
+                if q_event_proxy.offset == offsets[i]:
+                    continue
+                elif q_event_proxy.offset < offsets[i]:
+                    j = i - 1
+                else:
+                    j = i
+                if j not in subdividable_leaves:
+                    span_leaf = leaves[j]
+                    subdividable_leaves[j] = span_leaf.is_divisible and \
+                        bool(self._find_leaf_subdivisions(
+                            span_leaf.parentage_ratios))
+                if not subdividable_leaves[j]:
+                    fixed_distance += abs(q_event_proxy.offset - offsets[i])
+        if count:
+            return fixed_distance / count
+        return None
+
+    def _get_search_cache_key(self, q_event_proxies):
+        def recurse(x):
+            if isinstance(x, dict):
+                return tuple(sorted((k, recurse(v)) for k, v in x.items()))
+            elif isinstance(x, (list, tuple)):
+                return tuple(recurse(_) for _ in x)
+            return x
+        offsets = tuple(_.offset for _ in q_event_proxies)
+        return (type(self), recurse(self.definition), self.prune, offsets)
+
     @abc.abstractmethod
     def _is_valid_definition(self, definition):
         raise NotImplementedError
 
+    def _search(self, q_event_proxies):
+        from abjad.tools import quantizationtools
+        if self.memoize:
+            key = self._get_search_cache_key(q_event_proxies)
+            cached_q_grids = self._search_cache.pop(key, None)
+            if cached_q_grids is not None:
+                self._search_cache[key] = cached_q_grids
+                return self._thaw_q_grids(cached_q_grids, q_event_proxies)
+        q_grid = quantizationtools.QGrid()
+        q_grid.fit_q_events(q_event_proxies)
+        old_q_grids = []
+        new_q_grids = [q_grid]
+        best_key = None
+        while new_q_grids:
+            q_grid = new_q_grids.pop()
+            if self.prune:
+                # DistanceHeuristic picks first q-grid with smallest key;
+                # descendants have more leaves and no smaller distance
+                # than lower bound
+                q_grid_key = (q_grid.distance, len(q_grid.leaves))
+                lower_bound = self._get_lower_bound_distance(q_grid)
+                bound_key = (lower_bound, len(q_grid.leaves) + 1)
+                if best_key is None or q_grid_key < best_key:
+                    best_key = q_grid_key
+                    old_q_grids.append(q_grid)
+                if best_key <= bound_key:
+                    continue
+            else:
+                old_q_grids.append(q_grid)
+            new_q_grids.extend(self(q_grid))
+        if self.memoize:
+            cached_q_grids = self._freeze_q_grids(
+                old_q_grids, q_event_proxies)
+            self._search_cache[key] = cached_q_grids
+            while self._search_cache_size < len(self._search_cache):
+                self._search_cache.popitem(last=False)
+        return old_q_grids
+
+    def _thaw_q_grids(self, frozen_q_grids, q_event_proxies):
+        from abjad.tools import quantizationtools
+        q_grids = []
+        for root_node, placements in frozen_q_grids:
+            q_grid = quantizationtools.QGrid(copy.copy(root_node))
+            for leaf, indices in zip(q_grid.leaves, placements):
+                leaf.q_event_proxies.extend(
+                    q_event_proxies[_] for _ in indices)
+            q_grids.append(q_grid)
+        return q_grids
+
     ### PUBLIC PROPERTIES ###
 
     @abc.abstractproperty
@@ -139,3 +278,45 @@ class SearchTree(AbjadObject):
         Returns dictionary.
         '''
         return self._definition
+
+    @property
+    def memoize(self):
+        r'''Is true when search tree caches search results by normalized
+        q-event offsets. Otherwise false.
+
+        ..  container:: example
+
+            ::
+
+                >>> search_tree = quantizationtools.UnweightedSearchTree(
+                ...     memoize=True,
+                ...     )
+                >>> search_tree.memoize
+                True
+
+        Defaults to false.
+
+        Returns true or false.
+        '''
+        return self._memoize
+
+    @property
+    def prune(self):
+        r'''Is true when search tree prunes q-grids which cannot improve on the
+        best q-grid found so far. Otherwise false.
+
+        ..  container:: example
+
+            ::
+
+                >>> search_tree = quantizationtools.UnweightedSearchTree(
+                ...     prune=True,
+                ...     )
+                >>> search_tree.prune
+                True
+
+        Defaults to false.
+
+        Returns true or false.
+        '''
+        return self._prune
@@ -76,8 +76,13 @@ class WeightedSearchTree(SearchTree):
 
     ### INITIALIZER ###
 
-    def __init__(self, definition=None):
-        SearchTree.__init__(self, definition)
+    def __init__(self, definition=None, memoize=False, prune=False):
+        SearchTree.__init__(
+            self,
+            definition=definition,
+            memoize=memoize,
+            prune=prune,
+            )
         self._compositions = self._precompute_compositions()
         all_compositions = []
         for value in list(self._compositions.values()):
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 import abjad
+import gc
+import multiprocessing
+import multiprocessing.pool
 import pytest
 from abjad.tools import quantizationtools
 
@@ -17,12 +20,11 @@ class Job(abjad.abctools.AbjadObject):
         self.result = [x for x in abjad.mathtools.yield_all_compositions_of_integer(self.number)]
 
 
-@pytest.mark.skip()
 def test_quantizationtools_ParallelJobHandler___call___01():
 
     jobs = [Job(x) for x in range(1, 11)]
-    job_handler = quantizationtools.ParallelJobHandler()
-    finished_jobs = job_handler(jobs)
+    with quantizationtools.ParallelJobHandler() as job_handler:
+        finished_jobs = job_handler(jobs)
 
 
 @pytest.mark.skip()
@@ -88,3 +90,101 @@ def test_quantizationtools_ParallelJobHandler___call___02():
 
     assert sorted(a_jobs[0].q_grids, key=lambda x: x.root_node.rtm_format) == \
         sorted(b_jobs[0].q_grids, key=lambda x: x.root_node.rtm_format)
+
+
+def test_quantizationtools_ParallelJobHandler___call___03():
+    r'''Returns finished jobs in order across repeated calls to one pool.
+    '''
+
+    with quantizationtools.ParallelJobHandler(
+        processes=2, chunksize=3) as job_handler:
+        for count in (1, 7, 10):
+            jobs = [Job(x) for x in range(1, count + 1)]
+            finished_jobs = job_handler(jobs)
+            assert [_.number for _ in finished_jobs] == \
+                list(range(1, count + 1))
+            for job in finished_jobs:
+                assert len(job.result) == 2 ** (job.number - 1)
+        pool = job_handler._pool
+        assert pool is not None
+        job_handler([Job(3)])
+        assert job_handler._pool is pool
+
+    assert job_handler._pool is None
+
+
+def test_quantizationtools_ParallelJobHandler___call___04():
+    r'''Shares one job handler across many quantizer calls.
+    '''
+
+    quantizer = quantizationtools.Quantizer()
+    durations = [
+        [1000, 1000],
+        [500, 250, 250, 1000],
+        [1500, -500, 750, 250],
+        ]
+    serial_formats = []
+    for x in durations:
+        sequence = \
+            quantizationtools.QEventSequence.from_millisecond_durations(x)
+        result = quantizer(
+            sequence,
+            job_handler=quantizationtools.SerialJobHandler(),
+            )
+        serial_formats.append(format(result))
+
+    parallel_formats = []
+    with quantizationtools.ParallelJobHandler(processes=2) as job_handler:
+        for x in durations:
+            sequence = \
+                quantizationtools.QEventSequence.from_millisecond_durations(x)
+            result = quantizer(sequence, job_handler=job_handler)
+            parallel_formats.append(format(result))
+
+    assert parallel_formats == serial_formats
+
+
+def test_quantizationtools_ParallelJobHandler___call___05():
+    r'''Restarts worker processes after close.
+    '''
+
+    job_handler = quantizationtools.ParallelJobHandler(processes=1)
+    assert job_handler([]) == []
+    assert job_handler._pool is None
+    assert [_.number for _ in job_handler([Job(4)])] == [4]
+    job_handler.close()
+    assert job_handler._pool is None
+    assert [_.number for _ in job_handler([Job(5)])] == [5]
+    job_handler.terminate()
+    assert job_handler._pool is None
+
+
+def test_quantizationtools_ParallelJobHandler___call___06():
+    r'''Returns same results as serial job handler.
+    '''
+
+    numbers = [14] * 32
+    serial_jobs = [Job(x) for x in numbers]
+    quantizationtools.SerialJobHandler()(serial_jobs)
+
+    with quantizationtools.ParallelJobHandler() as job_handler:
+        parallel_jobs = [Job(x) for x in numbers]
+        parallel_jobs = job_handler(parallel_jobs)
+
+    assert [_.result for _ in parallel_jobs] == \
+        [_.result for _ in serial_jobs]
+
+
+def test_quantizationtools_ParallelJobHandler___call___07():
+    r'''Terminates worker processes when job handler is deleted.
+    '''
+
+    job_handler = quantizationtools.ParallelJobHandler(processes=1)
+    assert [_.number for _ in job_handler([Job(3)])] == [3]
+    pool = job_handler._pool
+    assert pool._state == multiprocessing.pool.RUN
+
+    del(job_handler)
+    gc.collect()
+
+    assert pool._state == multiprocessing.pool.TERMINATE
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import abjad
+from abjad.tools import quantizationtools
+
+
+def _make_q_event_proxies(offsets, start=0):
+    q_event_proxies = []
+    for i, offset in enumerate(offsets):
+        offset = abjad.Offset(offset)
+        q_event = quantizationtools.PitchedQEvent(
+            1000 * (start + offset), [0], index=i)
+        q_event_proxy = quantizationtools.QEventProxy(
+            q_event, 1000 * start, 1000 * (start + 1))
+        q_event_proxies.append(q_event_proxy)
+    return q_event_proxies
+
+
+def _describe(q_grids):
+    result = []
+    for q_grid in q_grids:
+        placements = tuple(
+            tuple(_.q_event.index for _ in leaf.q_event_proxies)
+            for leaf in q_grid.leaves
+            )
+        result.append((q_grid.rtm_format, placements))
+    return result
+
+
+def _select(q_grids):
+    key = lambda x: (x.distance, len(x.leaves))
+    return sorted(q_grids, key=key)[0]
+
+
+def test_quantizationtools_SearchTree__search_01():
+    r'''Memoized search reuses results for beats with equal normalized
+    offsets.
+    '''
+
+    offsets = [0, (1, 5), (1, 3), (3, 4)]
+    search_tree = quantizationtools.UnweightedSearchTree()
+    memoized_search_tree = quantizationtools.UnweightedSearchTree(
+        memoize=True)
+    expected = _describe(search_tree._search(_make_q_event_proxies(offsets)))
+
+    q_event_proxies_one = _make_q_event_proxies(offsets, start=3)
+    q_grids_one = memoized_search_tree._search(q_event_proxies_one)
+    q_event_proxies_two = _make_q_event_proxies(offsets, start=7)
+    q_grids_two = memoized_search_tree._search(q_event_proxies_two)
+
+    assert _describe(q_grids_one) == expected
+    assert _describe(q_grids_two) == expected
+    assert q_grids_two[0].leaves[0].q_event_proxies[0] is \
+        q_event_proxies_two[0]
+    assert q_grids_one[0].root_node is not q_grids_two[0].root_node
+
+
+def test_quantizationtools_SearchTree__search_02():
+    r'''Pruned search finds the q-grid selected by distance heuristic.
+    '''
+
+    offsets = [0, (1, 7), (2, 5), (9, 16), (5, 6)]
+    search_trees = [
+        quantizationtools.UnweightedSearchTree(),
+        quantizationtools.UnweightedSearchTree(prune=True),
+        ]
+    q_grids = search_trees[0]._search(_make_q_event_proxies(offsets))
+    pruned_q_grids = search_trees[1]._search(_make_q_event_proxies(offsets))
+    assert len(pruned_q_grids) < len(q_grids)
+    assert _describe([_select(pruned_q_grids)]) == \
+        _describe([_select(q_grids)])
+
+    offsets = [0, (1, 3), (3, 4)]
+    definition = {'divisors': (2, 3), 'max_depth': 2, 'max_divisions': 2}
+    search_trees = [
+        quantizationtools.WeightedSearchTree(definition),
+        quantizationtools.WeightedSearchTree(definition, prune=True),
+        ]
+    q_grids = search_trees[0]._search(_make_q_event_proxies(offsets))
+    pruned_q_grids = search_trees[1]._search(_make_q_event_proxies(offsets))
+    assert len(pruned_q_grids) < len(q_grids)
+    assert _describe([_select(pruned_q_grids)]) == \
+        _describe([_select(q_grids)])
+
+
+def test_quantizationtools_SearchTree__search_03():
+    r'''Memoized and pruned search quantizes repetitive input identically.
+    '''
+
+    durations = [250, 125, 125, 500, 333, 333, 334, 200, 300, 250, 250] * 2
+    q_event_sequence = \
+        quantizationtools.QEventSequence.from_millisecond_durations(durations)
+    quantizer = quantizationtools.Quantizer()
+    result = quantizer(q_event_sequence)
+
+    search_tree = quantizationtools.UnweightedSearchTree(
+        memoize=True,
+        prune=True,
+        )
+    q_schema = quantizationtools.MeasurewiseQSchema(search_tree=search_tree)
+    assert format(quantizer(q_event_sequence, q_schema=q_schema)) == \
+        format(result)
+
+
+def test_quantizationtools_SearchTree__search_04():
+    r'''Search tree modes appear in storage format only when set.
+    '''
+
+    search_tree = quantizationtools.UnweightedSearchTree(
+        definition={2: None},
+        prune=True,
+        )
+    assert format(search_tree) == abjad.String.normalize(
+        r'''
+        quantizationtools.UnweightedSearchTree(
+            definition={
+                2: None,
+                },
+            prune=True,
+            )
+        ''')
+    assert search_tree != quantizationtools.UnweightedSearchTree(
+        definition={2: None})
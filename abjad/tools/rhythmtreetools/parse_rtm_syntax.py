@@ -2,6 +2,17 @@
 from abjad.tools import scoretools
 
 
+_rhythm_tree_parser = None
+
+
+def _get_rhythm_tree_parser():
+    from abjad.tools import rhythmtreetools
+    global _rhythm_tree_parser
+    if _rhythm_tree_parser is None:
+        _rhythm_tree_parser = rhythmtreetools.RhythmTreeParser()
+    return _rhythm_tree_parser
+
+
 def parse_rtm_syntax(rtm):
     r'''Parses RTM syntax.
 
@@ -57,9 +68,7 @@ def parse_rtm_syntax(rtm):
 
     Returns tuplet or container.
     '''
-    from abjad.tools import rhythmtreetools
-
-    result = rhythmtreetools.RhythmTreeParser()(rtm)
+    result = _get_rhythm_tree_parser()(rtm)
 
     con = scoretools.Container()
 
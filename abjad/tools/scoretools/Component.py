@@ -28,22 +28,29 @@ class Component(AbjadObject):
 
     __slots__ = (
         '_dependent_wrappers',
+        '_effective_indicator_index',
         '_indicator_wrappers',
         '_indicators_are_current',
         '_is_forbidden_to_update',
+        '_lilypond_format_bundle',
         '_lilypond_grob_name_manager',
         '_lilypond_setting_name_manager',
         '_logical_measure_number',
+        '_measure_numbers_are_current',
+        '_modification_count',
         '_name',
         '_offsets_are_current',
         '_offsets_in_seconds_are_current',
         '_parent',
+        '_selection_cache',
         '_spanners',
         '_start_offset',
         '_start_offset_in_seconds',
         '_stop_offset',
         '_stop_offset_in_seconds',
+        '_tempo_map_cache',
         '_timespan',
+        '_vertical_moment_cache',
         )
 
     _is_counttime_component = False
@@ -53,21 +60,28 @@ class Component(AbjadObject):
     @abc.abstractmethod
     def __init__(self, name=None):
         self._dependent_wrappers = []
+        self._effective_indicator_index = None
         self._indicator_wrappers = []
         self._indicators_are_current = False
         self._is_forbidden_to_update = False
+        self._lilypond_format_bundle = None
         self._logical_measure_number = None
+        self._measure_numbers_are_current = False
+        self._modification_count = 0
         self._offsets_are_current = False
         self._offsets_in_seconds_are_current = False
         self._lilypond_grob_name_manager = None
         self._parent = None
         self._lilypond_setting_name_manager = None
+        self._selection_cache = None
         self._spanners = set()
         self._start_offset = None
         self._start_offset_in_seconds = None
         self._stop_offset = None
         self._stop_offset_in_seconds = None
+        self._tempo_map_cache = None
         self._timespan = timespantools.Timespan()
+        self._vertical_moment_cache = None
         self._name = None
         if name is not None:
             self.name = name  # name must be setup *after* parent
@@ -189,6 +203,23 @@ class Component(AbjadObject):
                 return True
         return False
 
+    def _clear_lilypond_format_bundles(self):
+        r'''Clears cached format bundles of component, descendants and
+        grace containers.
+        '''
+        components = [self]
+        while components:
+            component = components.pop()
+            component._lilypond_format_bundle = None
+            components.extend(getattr(component, '_music', ()))
+            grace_containers = (
+                getattr(component, '_grace_container', None),
+                getattr(component, '_after_grace_container', None),
+                )
+            for grace_container in grace_containers:
+                if grace_container is not None:
+                    components.append(grace_container)
+
     def _copy_with_children_and_indicators_but_without_spanners(self):
         return self._copy_with_indicators_but_without_children_or_spanners()
 
@@ -331,41 +362,81 @@ class Component(AbjadObject):
                     return
         # update indicators of entire score tree if necessary
         self._update_now(indicators=True)
-        # gather candidate wrappers
-        candidate_wrappers = {}
-        for parent in self._get_parentage(
-            include_self=True,
-            with_grace_notes=True,
-            ):
-            for wrapper in parent._dependent_wrappers:
-                if isinstance(wrapper.indicator, prototype):
-                    offset = wrapper.start_offset
-                    candidate_wrappers.setdefault(offset, []).append(
-                        wrapper
-                        )
-            for wrapper in parent._indicator_wrappers:
-                if wrapper.scope is not None:
+        start_offset = self._get_timespan()._start_offset
+        # gather candidate wrappers from indexed parentage
+        indices = [
+            parent._get_effective_indicator_index(prototype)
+            for parent in self._get_parentage(
+                include_self=True,
+                with_grace_notes=True,
+                )
+            ]
+        if n == 0:
+            # elect most recent candidate wrapper
+            wrapper, wrapper_offset = None, None
+            for offsets, wrappers_by_offset in indices:
+                index = bisect.bisect(offsets, start_offset) - 1
+                if index < 0:
                     continue
-                if isinstance(wrapper.indicator, prototype):
-                    offset = wrapper.start_offset
-                    candidate_wrappers.setdefault(offset, []).append(
-                        wrapper
+                offset = offsets[index]
+                if wrapper is None or wrapper_offset < offset:
+                    wrapper = wrappers_by_offset[offset]
+                    wrapper_offset = offset
+            if wrapper is None:
+                return
+        else:
+            candidate_wrappers = {}
+            for offsets, wrappers_by_offset in indices:
+                for offset in offsets:
+                    candidate_wrappers.setdefault(
+                        offset,
+                        wrappers_by_offset[offset],
                         )
-        if not candidate_wrappers:
-            return
-        # elect most recent candidate wrapper
-        all_offsets = sorted(candidate_wrappers)
-        start_offset = self._get_timespan()._start_offset
-        index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
-        if index < 0:
-            return
-        elif len(candidate_wrappers) <= index:
-            return
-        wrapper = candidate_wrappers[all_offsets[index]][0]
+            if not candidate_wrappers:
+                return
+            # elect nth candidate wrapper
+            all_offsets = sorted(candidate_wrappers)
+            index = bisect.bisect(all_offsets, start_offset) - 1 + int(n)
+            if index < 0:
+                return
+            elif len(candidate_wrappers) <= index:
+                return
+            wrapper = candidate_wrappers[all_offsets[index]]
         if unwrap:
             return wrapper.indicator
         return wrapper
 
+    def _get_effective_indicator_index(self, prototype):
+        r'''Gets sorted offsets and offset-to-wrapper dictionary of wrappers
+        that match `prototype` and take effect in component.
+
+        Caches result until indicators attach or detach or until offsets
+        change.
+        '''
+        if not self._dependent_wrappers and not self._indicator_wrappers:
+            return (), {}
+        if self._effective_indicator_index is None:
+            self._effective_indicator_index = {}
+        try:
+            return self._effective_indicator_index[prototype]
+        except KeyError:
+            pass
+        wrappers_by_offset = {}
+        for wrapper in self._dependent_wrappers:
+            if isinstance(wrapper.indicator, prototype):
+                offset = wrapper.start_offset
+                wrappers_by_offset.setdefault(offset, wrapper)
+        for wrapper in self._indicator_wrappers:
+            if wrapper.scope is not None:
+                continue
+            if isinstance(wrapper.indicator, prototype):
+                offset = wrapper.start_offset
+                wrappers_by_offset.setdefault(offset, wrapper)
+        offsets = tuple(sorted(wrappers_by_offset))
+        result = offsets, wrappers_by_offset
+        self._effective_indicator_index[prototype] = result
+        return result
+
     def _get_effective_staff(self):
         from abjad.tools import indicatortools
         from abjad.tools import scoretools
@@ -701,6 +772,13 @@ class Component(AbjadObject):
             )
         return bool(spanners)
 
+    def _increment_modification_count(self):
+        for component in self._get_parentage(
+            include_self=True,
+            with_grace_notes=True,
+            ):
+            component._modification_count += 1
+
     def _is_immediate_temporal_successor_of(self, component):
         temporal_successors = []
         current = self
@@ -714,6 +792,9 @@ class Component(AbjadObject):
                 break
         return component in temporal_successors
 
+    def _iterate_format_pieces(self, pending_format_pieces=None):
+        return iter(self._get_format_pieces())
+
     def _move_indicators(self, recipient_component):
         for indicator in self._get_indicators(unwrap=False):
             detach(indicator, self)
@@ -779,6 +860,7 @@ class Component(AbjadObject):
         if self._parent is not None:
             self._parent._music.remove(self)
         self._parent = None
+        self._clear_lilypond_format_bundles()
 
     def _remove_named_children_from_parentage(self, name_dictionary):
         if self._parent is not None and name_dictionary:
@@ -809,6 +891,7 @@ class Component(AbjadObject):
         self._parent = new_parent
         self._restore_named_children_to_parentage(named_children)
         self._update_later(offsets=True)
+        self._clear_lilypond_format_bundles()
 
     def _splice(
         self,
@@ -882,11 +965,22 @@ class Component(AbjadObject):
 
     def _update_later(self, offsets=False, offsets_in_seconds=False):
         assert offsets or offsets_in_seconds
-        for component in self._get_parentage(include_self=True):
+        for component in self._get_parentage(
+            include_self=True,
+            with_grace_notes=True,
+            ):
+            component._modification_count += 1
             if offsets:
                 component._offsets_are_current = False
-            elif offsets_in_seconds:
-                component._offsets_in_seconds_are_current = False
+                component._measure_numbers_are_current = False
+            component._offsets_in_seconds_are_current = False
+        if offsets:
+            # descendants may now be prolated differently
+            components = list(getattr(self, '_music', ()))
+            while components:
+                component = components.pop()
+                component._offsets_are_current = False
+                components.extend(getattr(component, '_music', ()))
 
     def _update_logical_measure_numbers(self):
         from abjad.tools import systemtools
@@ -898,6 +992,7 @@ class Component(AbjadObject):
         offsets=False,
         offsets_in_seconds=False,
         indicators=False,
+        measure_numbers=False,
         ):
         from abjad.tools import systemtools
         update_manager = systemtools.UpdateManager()
@@ -906,6 +1001,7 @@ class Component(AbjadObject):
             offsets=offsets,
             offsets_in_seconds=offsets_in_seconds,
             indicators=indicators,
+            measure_numbers=measure_numbers,
             )
 
     ### PUBLIC PROPERTIES ###
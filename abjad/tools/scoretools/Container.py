@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import re
 from abjad.tools import durationtools
 from abjad.tools import mathtools
 from abjad.tools import selectiontools
@@ -153,6 +154,22 @@ class Container(Component):
         '_is_simultaneous',
         )
 
+    _simple_string_durations = dict(
+        (_, durationtools.Duration.from_lilypond_duration_string(_))
+        for _ in (str(2 ** exponent) for exponent in range(8))
+        )
+
+    _simple_string_regex = re.compile(r'''
+        [ \n\t\f\r]*
+        (?:
+            (?P<name>[a-zA-Z]+)
+            (?P<ticks>'+|,+)?
+            (?P<duration>[0-9]+\.*)?
+            |
+            (?P<post_event>[~\[\]])
+        )
+        ''', re.VERBOSE)
+
     ### INITIALIZER ###
 
     def __init__(self, music=None, is_simultaneous=None, name=None):
@@ -466,11 +483,21 @@ class Container(Component):
         return node
 
     def _copy_with_children_and_indicators_but_without_spanners(self):
+        r'''Sets new children directly because they are copied with neither
+        parent nor spanners.
+        '''
         new = self._copy_with_indicators_but_without_children_or_spanners()
-        for component in self:
-            new_component = \
-                component._copy_with_children_and_indicators_but_without_spanners()
-            new.append(new_component)
+        new_components = [
+            component._copy_with_children_and_indicators_but_without_spanners()
+            for component in self
+            ]
+        new._music.extend(new_components)
+        for new_component in new_components:
+            new_component._set_parent(new)
+        for component in iterate(new_components).by_class():
+            for wrapper in component._get_indicators(unwrap=False):
+                if wrapper.scope is not None:
+                    wrapper._update_effective_context()
         return new
 
     def _copy_with_indicators_but_without_children_or_spanners(self):
@@ -529,13 +556,7 @@ class Container(Component):
         return self._format_slot_contributions_with_indent(result)
 
     def _format_content_pieces(self):
-        from abjad.tools import systemtools
-        indent = systemtools.LilyPondFormatManager.indent
-        result = []
-        for m in self._music:
-            result.extend(format(m).split('\n'))
-        result = [indent + x for x in result]
-        return result
+        return list(self._iterate_content_pieces())
 
     def _format_contents_slot(self, bundle):
         result = []
@@ -750,19 +771,20 @@ class Container(Component):
             self._music = list(music)
             self[:]._set_parents(self)
         elif isinstance(music, str):
-            parsed = self._parse_string(music)
             self._music = []
-            self.is_simultaneous = parsed.is_simultaneous
-            if (
-                parsed.is_simultaneous or
-                not abjad.Selection._all_in_same_logical_voice(
-                    parsed[:],
-                    contiguous=True)
-                ):
-                while len(parsed):
-                    self.append(parsed.pop(0))
-            else:
-                self[:] = parsed[:]
+            if not self._parse_simple_string(music.strip()):
+                parsed = self._parse_string(music)
+                self.is_simultaneous = parsed.is_simultaneous
+                if (
+                    parsed.is_simultaneous or
+                    not abjad.Selection._all_in_same_logical_voice(
+                        parsed[:],
+                        contiguous=True)
+                    ):
+                    while len(parsed):
+                        self.append(parsed.pop(0))
+                else:
+                    self[:] = parsed[:]
         else:
             message = 'can not initialize container from {!r}.'
             message += ' try using mutate().wrap()?'
@@ -784,6 +806,49 @@ class Container(Component):
             yield node
         return recurse(self)
 
+    def _iterate_content_pieces(self, pending_format_pieces=None):
+        indent = systemtools.LilyPondFormatManager.indent
+        for component in self._music:
+            if (pending_format_pieces is not None and
+                id(component) in pending_format_pieces):
+                pieces = (pending_format_pieces[id(component)].get(),)
+            elif isinstance(component, Container):
+                pieces = component._iterate_format_pieces(
+                    pending_format_pieces=pending_format_pieces,
+                    )
+            else:
+                pieces = (format(component),)
+            for piece in pieces:
+                for line in piece.split('\n'):
+                    yield indent + line
+
+    def _iterate_format_pieces(self, pending_format_pieces=None):
+        self._update_now(indicators=True)
+        manager = systemtools.LilyPondFormatManager
+        bundle = manager.bundle_format_contributions(self)
+        slots = (
+            self._format_before_slot(bundle),
+            self._format_open_brackets_slot(bundle),
+            self._format_opening_slot(bundle),
+            )
+        for slot in slots:
+            for contributor, contributions in slot:
+                for contribution in contributions:
+                    yield contribution
+        for piece in self._iterate_content_pieces(
+            pending_format_pieces=pending_format_pieces,
+            ):
+            yield piece
+        slots = (
+            self._format_closing_slot(bundle),
+            self._format_close_brackets_slot(bundle),
+            self._format_after_slot(bundle),
+            )
+        for slot in slots:
+            for contributor, contributions in slot:
+                for contribution in contributions:
+                    yield contribution
+
     def _iterate_top_down(self):
         def recurse(node):
             yield node
@@ -802,15 +867,120 @@ class Container(Component):
             self._spanners.discard(spanner)
         return self
 
+    def _parse_simple_string(self, string):
+        r'''Parses `string` into empty container when `string` contains only
+        notes, rests, skips, ties and beams.
+
+        Builds leaves directly instead of going through the LilyPond parser.
+
+        Returns true when `string` is that simple. Otherwise returns false and
+        leaves container unchanged.
+        '''
+        import abjad
+        from abjad.ly.language_pitch_names import language_pitch_names
+        pitch_names = language_pitch_names['english']
+        durations = Container._simple_string_durations
+        match = Container._simple_string_regex.match
+        leaves, leaf_post_events = [], []
+        duration = durations['4']
+        position, length = 0, len(string)
+        while position < length:
+            match_ = match(string, position)
+            if match_ is None or match_.end() == position:
+                return False
+            position = match_.end()
+            post_event = match_.group('post_event')
+            if post_event is not None:
+                if not leaves:
+                    return False
+                leaf_post_events[-1].append(post_event)
+                continue
+            name, ticks, duration_string = match_.group(
+                'name', 'ticks', 'duration')
+            if duration_string is not None:
+                if duration_string not in durations:
+                    if duration_string.rstrip('.') not in durations:
+                        return False
+                    durations[duration_string] = \
+                        durationtools.Duration.from_lilypond_duration_string(
+                            duration_string)
+                duration = durations[duration_string]
+            ticks = ticks or ''
+            if name in ('r', 's'):
+                if ticks:
+                    return False
+                if name == 'r':
+                    leaf = abjad.Rest(duration)
+                else:
+                    leaf = abjad.Skip(duration)
+            elif name in pitch_names:
+                pitch = abjad.NamedPitch(str(pitch_names[name]) + ticks)
+                leaf = abjad.Note(pitch, duration)
+                leaf.note_head.is_forced = False
+                leaf.note_head.is_cautionary = False
+            else:
+                return False
+            leaves.append(leaf)
+            leaf_post_events.append([])
+        last_index = len(leaves) - 1
+        beam_is_open = tie_is_open = False
+        for i, post_events in enumerate(leaf_post_events):
+            tie_count = post_events.count('~')
+            if 1 < tie_count:
+                return False
+            if tie_count:
+                if i == last_index:
+                    return False
+                if not tie_is_open and (
+                    not isinstance(leaves[i], abjad.Note) or
+                    not isinstance(leaves[i + 1], abjad.Note) or
+                    leaves[i].written_pitch != leaves[i + 1].written_pitch
+                    ):
+                    return False
+            tie_is_open = bool(tie_count)
+            start_beam_count = post_events.count('[')
+            if 1 < start_beam_count:
+                return False
+            if start_beam_count:
+                if beam_is_open:
+                    return False
+                beam_is_open = True
+            if ']' in post_events:
+                beam_is_open = False
+        if beam_is_open:
+            return False
+        tie, beam = None, None
+        for i, post_events in enumerate(leaf_post_events):
+            leaf = leaves[i]
+            if '~' in post_events:
+                if tie is not None:
+                    tie._append(leaves[i + 1])
+                else:
+                    tie = abjad.Tie()
+                    abjad.attach(tie, abjad.select([leaf, leaves[i + 1]]))
+            else:
+                tie = None
+            if '[' in post_events:
+                beam = abjad.Beam()
+            if ']' in post_events and beam is not None:
+                beam._append(leaf)
+                beam = None
+            if beam is not None:
+                beam._append(leaf)
+        self._music = leaves
+        self[:]._set_parents(self)
+        return True
+
     def _parse_string(self, string):
         import abjad
         from abjad.tools import lilypondfiletools
-        from abjad.tools import lilypondparsertools
         from abjad.tools import rhythmtreetools
+        from abjad.tools.lilypondparsertools.parse_reduced_ly_syntax import \
+            _get_reduced_ly_parser
         from abjad.tools.topleveltools import parse
         user_input = string.strip()
         if user_input.startswith('abj:'):
-            parser = lilypondparsertools.ReducedLyParser()
+            parser = _get_reduced_ly_parser()
             parsed = parser(user_input[4:])
             if parser._toplevel_component_count == 1:
                 parent = abjad.inspect(parsed).get_parentage().parent
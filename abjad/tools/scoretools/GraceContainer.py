@@ -172,12 +172,14 @@ class GraceContainer(Container):
             raise TypeError(message)
         leaf._grace_container = self
         self._carrier = leaf
+        leaf._update_later(offsets=True)
 
     def _detach(self):
         if self._carrier is not None:
             carrier = self._carrier
             carrier._grace_container = None
             self._carrier = None
+            carrier._update_later(offsets=True)
         return self
 
     def _format_open_brackets_slot(self, bundle):
@@ -628,3 +628,4 @@ class Leaf(Component):
             message = message.format(rational)
             raise AssignabilityError(message)
         self._written_duration = rational
+        self._update_later(offsets=True)
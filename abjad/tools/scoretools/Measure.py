@@ -65,7 +65,7 @@ class Measure(Container):
         self._automatically_adjust_time_signature = False
         time_signature = time_signature or abjad.TimeSignature((4, 4))
         time_signature = abjad.TimeSignature(time_signature)
-        self.implicit_scaling = bool(implicit_scaling)
+        self._implicit_scaling = bool(implicit_scaling)
         Container.__init__(self, music)
         self._always_format_time_signature = False
         self._measure_number = None
@@ -286,8 +286,9 @@ class Measure(Container):
         if getattr(self, '_lilypond_setting_name_manager', None) is not None:
             new._lilypond_setting_name_manager = copy.copy(setting(self))
         for indicator in self._get_indicators():
-            new_indicator = copy.copy(indicator)
-            attach(new_indicator, new)
+            if not getattr(indicator, '_is_immutable', False):
+                indicator = copy.copy(indicator)
+            attach(indicator, new)
         new.is_simultaneous = self.is_simultaneous
         new.implicit_scaling = self.implicit_scaling
         return new
@@ -323,28 +324,6 @@ class Measure(Container):
         else:
             return indicatortools.TimeSignature(duration)
 
-    def _format_content_pieces(self):
-        from abjad.tools import systemtools
-        result = []
-        if self.has_non_power_of_two_denominator and \
-            type(self) is Measure and \
-            self.implicit_scaling:
-            indent = systemtools.LilyPondFormatManager.indent
-            string = "{}\\scaleDurations #'({} . {}) {{"
-            string = string.format(
-                indent,
-                self.implied_prolation.numerator,
-                self.implied_prolation.denominator,
-                )
-            result.append(string)
-            pieces = Container._format_content_pieces(self)
-            pieces = [indent + x for x in pieces]
-            result.extend(pieces)
-            result.append(indent + '}')
-        else:
-            result.extend(Container._format_content_pieces(self))
-        return result
-
     def _format_opening_slot(self, bundle):
         result = []
         result.append(('comments', bundle.opening.comments))
@@ -408,6 +387,38 @@ class Measure(Container):
             time_signature_prolation = self.time_signature.implied_prolation
         return time_signature_prolation * self._get_contents_duration()
 
+    def _iterate_content_pieces(self, pending_format_pieces=None):
+        from abjad.tools import systemtools
+        pieces = Container._iterate_content_pieces(
+            self,
+            pending_format_pieces=pending_format_pieces,
+            )
+        if self.has_non_power_of_two_denominator and \
+            type(self) is Measure and \
+            self.implicit_scaling:
+            indent = systemtools.LilyPondFormatManager.indent
+            string = "{}\\scaleDurations #'({} . {}) {{"
+            string = string.format(
+                indent,
+                self.implied_prolation.numerator,
+                self.implied_prolation.denominator,
+                )
+            yield string
+            for piece in pieces:
+                yield indent + piece
+            yield indent + '}'
+        else:
+            for piece in pieces:
+                yield piece
+
+    def _iterate_format_pieces(self, pending_format_pieces=None):
+        self._check_duration()
+        superclass = super(Measure, self)
+        for piece in superclass._iterate_format_pieces(
+            pending_format_pieces=pending_format_pieces,
+            ):
+            yield piece
+
     # TODO: see if self._scale can be combined with
     #       with self.scale_and_adjust_time_signature()
     def _scale(self, multiplier=None):
@@ -602,6 +613,7 @@ class Measure(Container):
     def implicit_scaling(self, argument):
         assert isinstance(argument, bool)
         self._implicit_scaling = argument
+        self._update_later(offsets=True)
 
     @property
     def implied_prolation(self):
@@ -792,7 +804,7 @@ class Measure(Container):
 
         Returns positive integer.
         '''
-        self._update_now(offsets=True)
+        self._update_now(measure_numbers=True)
         return self._measure_number
 
     @property
@@ -90,7 +90,7 @@ def test_scoretools_Chord___copy___04():
 
 
 def test_scoretools_Chord___copy___05():
-    r'''Chord coipes articulations and markup.
+    r'''Chord copies markup and shares immutable articulations.
     '''
 
     chord_1 = abjad.Chord("<ef' cs'' f''>4")
@@ -106,7 +106,7 @@ def test_scoretools_Chord___copy___05():
 
     articulation_2 = abjad.inspect(chord_2).get_indicators(abjad.Articulation)[0]
     assert articulation_1 == articulation_2
-    assert articulation_1 is not articulation_2
+    assert articulation_1 is articulation_2
 
     markup_2 = abjad.inspect(chord_2).get_markup()[0]
     assert markup_1 == markup_2
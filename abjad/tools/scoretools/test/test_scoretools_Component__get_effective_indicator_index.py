@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def test_scoretools_Component__get_effective_indicator_index_01():
+    r'''Indexes context-scoped indicators by start offset.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    abjad.inspect(staff).get_effective(abjad.Clef)
+
+    offsets, wrappers = staff._get_effective_indicator_index(abjad.Clef)
+    assert offsets == (abjad.Offset(0), abjad.Offset(1, 4))
+    assert wrappers[offsets[0]].indicator == abjad.Clef('alto')
+    assert wrappers[offsets[1]].indicator == abjad.Clef('bass')
+
+
+def test_scoretools_Component__get_effective_indicator_index_02():
+    r'''Index is invalidated when indicators attach and detach.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('bass')
+
+    abjad.detach(abjad.Clef, staff[2])
+    assert abjad.inspect(staff[3]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+
+
+def test_scoretools_Component__get_effective_indicator_index_03():
+    r'''Index is invalidated when offsets change.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    assert abjad.inspect(staff[1]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+
+    staff.insert(0, abjad.Note("g'4"))
+    assert abjad.inspect(staff[2]).get_effective(abjad.Clef) == \
+        abjad.Clef('alto')
+    offsets, wrappers = staff._get_effective_indicator_index(abjad.Clef)
+    assert offsets == (abjad.Offset(1, 4), abjad.Offset(1, 2))
+
+
+def test_scoretools_Component__get_effective_indicator_index_04():
+    r'''Previous and next effective indicators agree with index.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.attach(abjad.Clef('alto'), staff[0])
+    abjad.attach(abjad.Clef('bass'), staff[2])
+    abjad.attach(abjad.Clef('tenor'), staff[3])
+
+    inspector = abjad.inspect(staff[2])
+    assert inspector.get_effective(abjad.Clef, n=-1) == abjad.Clef('alto')
+    assert inspector.get_effective(abjad.Clef, n=0) == abjad.Clef('bass')
+    assert inspector.get_effective(abjad.Clef, n=1) == abjad.Clef('tenor')
+    assert inspector.get_effective(abjad.Clef, n=2) is None
+    assert inspector.get_effective(abjad.Clef, n=-2) is None
+
+
+def test_scoretools_Component__get_effective_indicator_index_05():
+    r'''Indicators attach to and detach from spanners.
+    '''
+
+    staff = abjad.Staff("c'4 d'4")
+    beam = abjad.Beam()
+    abjad.attach(beam, staff[:])
+    markup = abjad.Markup('text')
+    abjad.attach(markup, beam)
+
+    assert abjad.inspect(staff[0]).get_effective(abjad.Clef) is None
+    assert abjad.detach(markup, beam) == (markup,)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _parse(string):
+    return abjad.parse('{{ {} }}'.format(string))
+
+
+def _get_spanner_indices(container):
+    leaves = list(abjad.iterate(container).by_leaf())
+    result = set()
+    for leaf in leaves:
+        for spanner in abjad.inspect(leaf).get_spanners():
+            indices = tuple(leaves.index(_) for _ in spanner.components)
+            result.add((type(spanner).__name__, indices))
+    return sorted(result)
+
+
+def test_scoretools_Container__parse_simple_string_01():
+    r'''Simple strings parse like LilyPond parser strings.
+    '''
+
+    strings = [
+        '',
+        "c'4 d'8 e'8 f'4. r8",
+        "cs'4 df,,8 eqs'16 ftqf''32 s4 r",
+        "c'8 [ d'8 e'8 ] f'8 [ ] g'4",
+        "c'8[ d'8] e'8 ] f'4",
+        "c'4 ~ c'8 ~ c'8 d'2 ~ d'4..",
+        "c'8 ~ [ c'8 ~ c'8 ]\nd'4\te'4",
+        "c'4~ c'4~ d'4",
+        ]
+    for string in strings:
+        container = abjad.Container()
+        assert container._parse_simple_string(string)
+        container = abjad.Container(string)
+        parsed = _parse(string)
+        assert format(container) == format(parsed)
+        assert _get_spanner_indices(container) == \
+            _get_spanner_indices(parsed)
+        for leaf, parsed_leaf in zip(
+            abjad.iterate(container).by_leaf(),
+            abjad.iterate(parsed).by_leaf(),
+            ):
+            assert repr(leaf) == repr(parsed_leaf)
+            if isinstance(leaf, abjad.Note):
+                assert leaf.note_head.is_forced is False
+                assert leaf.note_head.is_cautionary is False
+
+
+def test_scoretools_Container__parse_simple_string_02():
+    r'''Other strings fall back to LilyPond parser.
+    '''
+
+    strings = [
+        "c'4 -. d'4",
+        "c'4 ( d'4 )",
+        "<c' e'>4 d'4",
+        "c'4 d'4 ~",
+        "c'4 ~ d'4",
+        "c'4 ~ ~ c'4",
+        "r4 ~ r4",
+        "c'8 [ d'8 [ e'8 ] ]",
+        "c'8 [ d'8",
+        "c'3 d'4",
+        "c'4 \\times 2/3 { c'8 d'8 e'8 }",
+        "R1 c'4",
+        "c'4 cis'4",
+        "abj: c'4 d'4",
+        "<< \\new Voice { c'4 } >>",
+        ]
+    for string in strings:
+        container = abjad.Container()
+        assert not container._parse_simple_string(string)
+        assert not len(container)
+    container = abjad.Container("c'4 ( d'4 )")
+    assert format(container) == format(_parse("c'4 ( d'4 )"))
+
+
+def test_scoretools_Container__parse_simple_string_03():
+    r'''Long simple strings parse like LilyPond parser strings.
+    '''
+
+    string = "c'8 [ d'8 e'8 f'8 ] g'4 ~ g'8 r8 a'16 b'16 c''4 " * 4
+    parsed_staff = abjad.Staff()
+    parsed_staff[:] = _parse(string)[:]
+    staff = abjad.Staff(string)
+    assert format(staff) == format(parsed_staff)
@@ -595,38 +595,29 @@ class Selection(object):
         # return empty list when nothing to copy
         if n < 1:
             return []
+        if include_enclosing_containers:
+            return self._copy_and_include_enclosing_containers()
         new_components = [
             component._copy_with_children_and_indicators_but_without_spanners()
             for component in self
             ]
-        if include_enclosing_containers:
-            return self._copy_and_include_enclosing_containers()
         new_components = type(self)(new_components)
-        # make schema of spanners contained by components
-        schema = self._make_spanner_schema()
-        # copy spanners covered by components
-        for covered_spanner, component_indices in list(schema.items()):
-            new_covered_spanner = copy.copy(covered_spanner)
-            del(schema[covered_spanner])
-            schema[new_covered_spanner] = component_indices
-        # reverse schema
-        reversed_schema = {}
-        for new_covered_spanner, component_indices in list(schema.items()):
-            for component_index in component_indices:
-                try:
-                    reversed_schema[component_index].append(
-                        new_covered_spanner)
-                except KeyError:
-                    reversed_schema[component_index] = [new_covered_spanner]
-        # iterate components and add new components to new spanners
-        for component_index, new_component in enumerate(
-            iterate(new_components).by_class()):
-            try:
-                new_covered_spanners = reversed_schema[component_index]
-                for new_covered_spanner in new_covered_spanners:
-                    new_covered_spanner._append(new_component)
-            except KeyError:
-                pass
+        # copy spanners covered by components and attach copied spanners to
+        # copied components in a single pass
+        new_spanners = {}
+        for component, new_component in zip(
+            iterate(self).by_class(),
+            iterate(new_components).by_class(),
+            ):
+            for spanner in component._get_spanners():
+                new_spanner = new_spanners.get(id(spanner))
+                if new_spanner is None:
+                    new_spanner = copy.copy(spanner)
+                    new_spanners[id(spanner)] = new_spanner
+                new_spanner._components.append(new_component)
+                new_component._spanners.add(new_spanner)
+        for new_component in new_components:
+            new_component._increment_modification_count()
         # repeat as specified by input
         for i in range(n - 1):
             new_components += self._copy()
@@ -956,23 +947,6 @@ class Selection(object):
             for component in self:
                 yield component
 
-    def _make_spanner_schema(self):
-        schema = {}
-        spanners = set()
-        for component in iterate(self).by_class():
-            spanners.update(component._get_spanners())
-        for spanner in spanners:
-            schema[spanner] = []
-        for i, component in \
-            enumerate(iterate(self).by_class()):
-            attached_spanners = component._get_spanners()
-            for attached_spanner in attached_spanners:
-                try:
-                    schema[attached_spanner].append(i)
-                except KeyError:
-                    pass
-        return schema
-
     def _set_parents(self, new_parent):
         r'''Not composer-safe.
         '''
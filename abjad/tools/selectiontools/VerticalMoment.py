@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import collections
+import heapq
 from abjad.tools import durationtools
 from abjad.tools import systemtools
 from abjad.tools.selectiontools.Selection import Selection
@@ -142,13 +143,8 @@ class VerticalMoment(Selection):
         while lo < hi:
             mid = (lo + hi) // 2
             start_offset = container[mid]._get_timespan().start_offset
-            stop_offset = container[mid]._get_timespan().stop_offset
-            if start_offset <= offset < stop_offset:
-                lo = mid + 1
-            # if container[mid] is of nonzero duration
-            elif start_offset < stop_offset:
+            if offset < start_offset:
                 hi = mid
-            # container[mid] is of zero duration so we skip it
             else:
                 lo = mid + 1
         return lo - 1
@@ -184,6 +180,81 @@ class VerticalMoment(Selection):
     def _get_format_specification(self):
         return systemtools.FormatSpecification(client=self)
 
+    @staticmethod
+    def _get_vertical_moment_at(governor, offset):
+        cache = governor._vertical_moment_cache
+        if cache is None or cache[0] != governor._modification_count:
+            vertical_moments = VerticalMoment._make_vertical_moments(governor)
+            vertical_moments = dict((_.offset, _) for _ in vertical_moments)
+            cache = (governor._modification_count, vertical_moments)
+            governor._vertical_moment_cache = cache
+        return cache[1].get(offset)
+
+    @staticmethod
+    def _iterate_vertical_moments(governor):
+        from abjad.tools import scoretools
+        governor._update_now(offsets=True)
+        score_indices, next_components = {}, {}
+        components = [governor]
+        while components:
+            component = components.pop()
+            score_indices[id(component)] = len(score_indices)
+            if isinstance(component, scoretools.Container):
+                music = component._music
+                if not component.is_simultaneous:
+                    for left, right in zip(music, music[1:]):
+                        next_components[id(left)] = right
+                components.extend(reversed(music))
+        governors = (governor,)
+        buffer_, stop_offsets = {}, []
+        def _buffer_components_starting_with(component):
+            components = [component]
+            while components:
+                component = components.pop()
+                score_index = score_indices[id(component)]
+                buffer_[score_index] = component
+                heapq.heappush(
+                    stop_offsets,
+                    (component._stop_offset, score_index, component),
+                    )
+                if isinstance(component, scoretools.Container):
+                    if component.is_simultaneous:
+                        components.extend(component._music)
+                    elif component._music:
+                        components.append(component._music[0])
+        current_offset = governor._start_offset
+        _buffer_components_starting_with(governor)
+        while buffer_:
+            vertical_moment = VerticalMoment()
+            vertical_moment._offset = durationtools.Offset(current_offset)
+            vertical_moment._governors = governors
+            vertical_moment._components = tuple(
+                buffer_[_] for _ in sorted(buffer_))
+            yield vertical_moment
+            current_offset = stop_offsets[0][0]
+            stopped_components = []
+            while stop_offsets and stop_offsets[0][0] <= current_offset:
+                stopped_components.append(heapq.heappop(stop_offsets)[-1])
+            for component in stopped_components:
+                del buffer_[score_indices[id(component)]]
+                next_component = next_components.get(id(component))
+                if next_component is not None:
+                    _buffer_components_starting_with(next_component)
+
+    @staticmethod
+    def _make_vertical_moments(governor):
+        vertical_moments = collections.OrderedDict()
+        for vertical_moment in VerticalMoment._iterate_vertical_moments(
+            governor):
+            vertical_moments[vertical_moment.offset] = vertical_moment
+        for offset, vertical_moment in vertical_moments.items():
+            vertical_moment._music = governor
+            vertical_moment._components = tuple(
+                _ for _ in vertical_moment._components
+                if _._start_offset <= offset < _._stop_offset
+                )
+        return list(vertical_moments.values())
+
     @staticmethod
     def _recurse(component, offset):
         result = []
@@ -266,15 +337,12 @@ class VerticalMoment(Selection):
     def next_vertical_moment(self):
         r'''Reference to next vertical moment forward in time.
         '''
-        from abjad.tools import scoretools
-        candidate_shortest_leaf = self.leaves[0]
-        for leaf in self.leaves[1:]:
-            if (leaf._get_timespan().stop_offset <
-                candidate_shortest_leaf._get_timespan().stop_offset):
-                candidate_shortest_leaf = leaf
-        next_leaf = candidate_shortest_leaf._get_in_my_logical_voice(
-            1, prototype=scoretools.Leaf)
-        next_vertical_moment = next_leaf._get_vertical_moment()
+        leaves = self.leaves
+        offset = min(_._get_timespan().stop_offset for _ in leaves)
+        governor = leaves[0]._get_parentage().root
+        next_vertical_moment = self._get_vertical_moment_at(governor, offset)
+        if next_vertical_moment is None:
+            raise IndexError
         return next_vertical_moment
 
     @property
@@ -388,7 +456,12 @@ class VerticalMoment(Selection):
         if token_leaf is None:
             token_leaf = leaf
             #print 'token_leaf is %s ...' % token_leaf
-        previous_vertical_moment = token_leaf._get_vertical_moment()
+        governor = token_leaf._get_parentage().root
+        offset = token_leaf._get_timespan().start_offset
+        previous_vertical_moment = self._get_vertical_moment_at(
+            governor,
+            offset,
+            )
         return previous_vertical_moment
 
     @property
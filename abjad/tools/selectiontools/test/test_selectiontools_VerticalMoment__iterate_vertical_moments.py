@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _make_score(staff_count, repeat_count):
+    strings = [
+        r"c'8 d'8 \times 2/3 { e'8 f'8 g'8 } a'4 ",
+        r"\times 4/5 { c'8 d'8 e'8 f'8 g'8 } a'8. b'16 ",
+        r"c'4. { d'8 } e'4 ",
+        ]
+    staves = []
+    for i in range(staff_count):
+        string = strings[i % len(strings)] * repeat_count
+        staves.append(abjad.Staff(string))
+    score = abjad.Score(staves[:-2])
+    score.append(abjad.StaffGroup(staves[-2:]))
+    return score
+
+
+def _get_components_at(governor, offset):
+    components = []
+    for component in abjad.iterate(governor).by_class():
+        timespan = abjad.inspect(component).get_timespan()
+        if timespan.start_offset <= offset < timespan.stop_offset:
+            components.append(component)
+    return components
+
+
+def test_selectiontools_VerticalMoment__iterate_vertical_moments_01():
+    r'''Vertical moments contain components active at vertical moment
+    offset, in score order.
+    '''
+
+    score = _make_score(5, 2)
+    staff = abjad.Staff(r"c'4 \times 2/3 { d'4 e'4 f'4 }")
+    container = abjad.Container([abjad.Staff("c'4 d'4"), staff])
+    for governor in [score, score[0], score[-1], staff]:
+        start_offsets = set()
+        for component in abjad.iterate(governor).by_class():
+            timespan = abjad.inspect(component).get_timespan()
+            start_offsets.add(timespan.start_offset)
+        vertical_moments = list(
+            abjad.iterate(governor).by_vertical_moment())
+        offsets = [_.offset for _ in vertical_moments]
+        assert offsets == sorted(start_offsets)
+        for vertical_moment in vertical_moments:
+            components = _get_components_at(governor, vertical_moment.offset)
+            assert list(vertical_moment.components) == components
+        vertical_moments = list(
+            abjad.iterate(governor).by_vertical_moment(reverse=True))
+        assert [_.offset for _ in vertical_moments] == offsets[::-1]
+        for vertical_moment in vertical_moments:
+            components = _get_components_at(governor, vertical_moment.offset)
+            assert list(vertical_moment.components) == components
+            assert vertical_moment == abjad.VerticalMoment(
+                governor,
+                vertical_moment.offset,
+                )
+
+
+def test_selectiontools_VerticalMoment__iterate_vertical_moments_02():
+    r'''Next and previous vertical moments walk root vertical moments.
+    '''
+
+    score = _make_score(4, 2)
+    vertical_moments = list(abjad.iterate(score).by_vertical_moment())
+    for left, right in zip(vertical_moments, vertical_moments[1:]):
+        assert left.next_vertical_moment == right
+        assert right.previous_vertical_moment == left
+    try:
+        vertical_moments[-1].next_vertical_moment
+        assert False
+    except IndexError:
+        pass
+    leaf = score[0][0]
+    vertical_moment = abjad.inspect(leaf).get_vertical_moment()
+    next_vertical_moment = vertical_moment.next_vertical_moment
+    assert next_vertical_moment.offset == abjad.Offset(1, 10)
+    leaf.written_duration = abjad.Duration(1, 16)
+    next_vertical_moment = vertical_moment.next_vertical_moment
+    assert next_vertical_moment.offset == abjad.Offset(1, 16)
+    components = _get_components_at(score, abjad.Offset(1, 16))
+    assert list(next_vertical_moment.components) == components
+
+
+def test_selectiontools_VerticalMoment__iterate_vertical_moments_03():
+    r'''Reverse iteration matches vertical moments made at each start
+    offset.
+    '''
+
+    score = _make_score(4, 10)
+    start_offsets = set()
+    for component in abjad.iterate(score).by_class():
+        start_offsets.add(abjad.inspect(component).get_timespan().start_offset)
+
+    expected = [
+        abjad.VerticalMoment(score, _)
+        for _ in reversed(sorted(start_offsets))
+        ]
+    vertical_moments = list(
+        abjad.iterate(score).by_vertical_moment(reverse=True))
+    assert [_.offset for _ in vertical_moments] == \
+        [_.offset for _ in expected]
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
 import collections
+import itertools
 from abjad.tools import durationtools
 from abjad.tools import scoretools
 from abjad.tools import selectiontools
@@ -164,6 +165,8 @@ class Selector(AbjadValueObject):
         '_callbacks',
         )
 
+    _node_ids = itertools.count()
+
     _publish_storage_format = True
 
     ### INITIALIZER ###
@@ -192,11 +195,18 @@ class Selector(AbjadValueObject):
             )
         if not isinstance(argument, prototype):
             argument = select(argument)
+        memo, node_id = self._get_selection_cache(argument, rotation)
         argument = (argument,)
         assert all(isinstance(x, prototype) for x in argument), repr(argument)
         callbacks = self.callbacks or ()
-        for callback in callbacks:
-            argument = callback(argument, rotation=rotation)
+        argument = self._run_callbacks(
+            argument,
+            callbacks,
+            rotation,
+            memo,
+            node_id,
+            {},
+            )
         if isinstance(argument, tuple):
             argument = selectiontools.Selection(argument)
         return argument
@@ -229,6 +239,82 @@ class Selector(AbjadValueObject):
         callbacks = callbacks + (callback,)
         return type(self)(callbacks)
 
+    @staticmethod
+    def _get_selection_cache(argument, rotation):
+        if isinstance(argument, scoretools.Component):
+            components = (argument,)
+        elif (isinstance(argument, selectiontools.Selection) and
+            argument and
+            all(isinstance(_, scoretools.Component) for _ in argument)):
+            components = tuple(argument)
+        else:
+            return None, next(Selector._node_ids)
+        roots = set()
+        for component in components:
+            while component._parent is not None:
+                component = component._parent
+            roots.add(component)
+        if len(roots) != 1:
+            return None, next(Selector._node_ids)
+        root = roots.pop()
+        cache = root._selection_cache
+        if cache is None or cache[0] != root._modification_count:
+            cache = (root._modification_count, {})
+            root._selection_cache = cache
+        memo = cache[1]
+        key = (type(argument), components, rotation)
+        if key not in memo:
+            memo[key] = next(Selector._node_ids)
+        return memo, memo[key]
+
+    @staticmethod
+    def _is_cacheable_callback(callback):
+        from abjad.tools import selectortools
+        prototype = (
+            selectortools.GroupByPitchCallback,
+            selectortools.PitchSelectorCallback,
+            )
+        if isinstance(callback, prototype):
+            return False
+        module = type(callback).__module__
+        return module.startswith('abjad.tools.selectortools.')
+
+    @staticmethod
+    def _run_callbacks(
+        argument,
+        callbacks,
+        rotation,
+        memo,
+        node_id,
+        local_memo,
+        ):
+        r'''Runs `callbacks` on `argument`.
+
+        Memoizes results in `memo` by identifier of previous result and
+        callback. Results memoized in `memo` persist on score root until
+        score changes. Results of callbacks that depend on pitch, and of
+        callbacks defined outside selectortools, memoize only in `local_memo`.
+        '''
+        for callback in callbacks:
+            if memo is not None and not Selector._is_cacheable_callback(
+                callback):
+                memo = None
+            if memo is None:
+                current_memo = local_memo
+            else:
+                current_memo = memo
+            key = (node_id, callback)
+            try:
+                entry = current_memo.get(key)
+            except TypeError:
+                memo, current_memo, entry = None, {}, None
+            if entry is None:
+                argument = callback(argument, rotation=rotation)
+                entry = (next(Selector._node_ids), argument)
+                current_memo[key] = entry
+            node_id, argument = entry
+        return argument
+
     ### PUBLIC METHODS ###
 
     def append_callback(self, callback):
@@ -5855,47 +5941,23 @@ class Selector(AbjadValueObject):
             )
         if not isinstance(argument, prototype):
             argument = select(argument)
+        memo, node_id = Selector._get_selection_cache(argument, rotation)
         argument = (argument,)
         assert all(isinstance(x, prototype) for x in argument), repr(argument)
-        maximum_length = 0
-        for selector in selectors:
-            if selector.callbacks:
-                maximum_length = max(maximum_length, len(selector.callbacks))
-        #print('MAX LENGTH', maximum_length)
-        selectors = list(selectors)
-        results_by_prefix = {(): argument}
+        local_memo = {}
         results_by_selector = collections.OrderedDict()
-        for index in range(1, maximum_length + 2):
-            #print('INDEX', index)
-            #print('PRUNING')
-            for selector in selectors[:]:
-                callbacks = selector.callbacks or ()
-                callback_length = index - 1
-                if len(callbacks) == callback_length:
-                    prefix = callbacks[:callback_length]
-                    results_by_selector[selector] = results_by_prefix[prefix]
-                    selectors.remove(selector)
-                    #print('\tREMOVED:', selector)
-                    #print('\tREMAINING:', len(selectors))
-            if not selectors:
-                #print('BREAKING')
-                break
-            #print('ADDING')
-            for selector in selectors:
-                callbacks = selector.callbacks or ()
-                this_prefix = callbacks[:index]
-                if this_prefix in results_by_prefix:
-                    #print('\tSKIPPING', repr(selector))
-                    continue
-                #print('\tADDING', repr(selector))
-                previous_prefix = callbacks[:index - 1]
-                previous_expr = results_by_prefix[previous_prefix]
-                callback = this_prefix[-1]
-                argument = callback(
-                    previous_expr,
-                    rotation=rotation,
-                    )
-                results_by_prefix[this_prefix] = argument
+        for selector in selectors:
+            if selector in results_by_selector:
+                continue
+            callbacks = selector.callbacks or ()
+            results_by_selector[selector] = Selector._run_callbacks(
+                argument,
+                callbacks,
+                rotation,
+                memo,
+                node_id,
+                local_memo,
+                )
         return results_by_selector
 
 
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _run_uncached(selector, argument):
+    argument = (argument,)
+    for callback in selector.callbacks or ():
+        argument = callback(argument, rotation=0)
+    if isinstance(argument, tuple):
+        argument = abjad.Selection(argument)
+    return argument
+
+
+def test_selectortools_Selector___call___01():
+    r'''Selector results equal uncached results.
+    '''
+
+    staff = abjad.Staff("c'8 ~ c'8 d'8 r8 e'8 [ f'8 ] r8 g'8")
+    selectors = [
+        abjad.select(),
+        abjad.select().by_leaf(),
+        abjad.select().by_leaf()[2],
+        abjad.select().by_logical_tie(pitched=True),
+        abjad.select().by_logical_tie(pitched=True).get_item(1),
+        abjad.select().by_logical_tie(pitched=True).by_pitch('C4'),
+        abjad.select().by_leaf().by_run(abjad.Note),
+        abjad.select().by_leaf().by_duration('==', (1, 8)).by_contiguity(),
+        ]
+    for _ in range(2):
+        for selector in selectors:
+            assert selector(staff) == _run_uncached(selector, staff)
+
+
+def test_selectortools_Selector___call___02():
+    r'''Selectors share memoized intermediate selections.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    result = abjad.select().by_leaf()[0](staff)
+    selection = abjad.select().by_leaf()[1](staff)
+    assert result == abjad.Selection([staff[0]])
+    assert selection == abjad.Selection([staff[1]])
+    modification_count, memo = staff._selection_cache
+    assert len(memo) == 4
+
+
+def test_selectortools_Selector___call___03():
+    r'''Changing score invalidates memoized selections.
+    '''
+
+    staff = abjad.Staff("c'8 c'8 e'8 f'8")
+    selector = abjad.select().by_logical_tie(pitched=True)
+    assert len(selector(staff)) == 4
+
+    abjad.attach(abjad.Tie(), staff[:2])
+    assert len(selector(staff)) == 3
+
+    staff.append(abjad.Rest((1, 8)))
+    staff.append("g'8")
+    assert len(selector(staff)) == 4
+
+    abjad.detach(abjad.Tie, staff[0])
+    assert len(selector(staff)) == 5
+
+    staff[0].written_duration = abjad.Duration(1, 4)
+    selector = abjad.select().by_logical_tie().by_duration('==', (1, 8))
+    assert len(selector(staff)) == 5
+
+    voice = abjad.Voice("c'8 d'8")
+    staff.insert(0, voice)
+    assert len(selector(staff)) == 7
+    assert len(selector(voice)) == 2
+
+
+def test_selectortools_Selector___call___04():
+    r'''Pitch selectors see changed pitches.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    selector = abjad.select().by_logical_tie().by_pitch('C4')
+    assert len(selector(staff)) == 1
+    staff[1].written_pitch = abjad.NamedPitch('C4')
+    assert len(selector(staff)) == 2
+
+
+def test_selectortools_Selector___call___05():
+    r'''Many selectors applied to one staff return same results as uncached
+    selectors.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8 r8 g'8 a'8 b'8 " * 25)
+    selectors = []
+    for i in range(50):
+        selectors.append(abjad.select().by_leaf()[i])
+        selectors.append(
+            abjad.select().by_logical_tie(pitched=True).get_item(i))
+
+    uncached_results = [_run_uncached(_, staff) for _ in selectors]
+    results = [_(staff) for _ in selectors]
+
+    assert results == uncached_results
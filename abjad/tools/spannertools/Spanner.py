@@ -119,7 +119,7 @@ class Spanner(AbjadObject):
 
         Returns nonnegative integer.
         '''
-        return len(self.components)
+        return len(self._components)
 
     def __lt__(self, argument):
         r'''Is true when spanner is less than `argument`. Otherwise false.
@@ -150,6 +150,7 @@ class Spanner(AbjadObject):
                 raise Except(components)
         component._spanners.add(self)
         self._components.append(component)
+        component._increment_modification_count()
 
     def _append_left(self, component):
         components = [component] + self[:1]
@@ -159,6 +160,7 @@ class Spanner(AbjadObject):
             )
         component._spanners.add(self)
         self._components.insert(0, component)
+        component._increment_modification_count()
 
     def _apply_overrides(self, overrides):
         import abjad
@@ -217,6 +219,7 @@ class Spanner(AbjadObject):
         r'''Not composer-safe.
         '''
         component._spanners.remove(self)
+        component._increment_modification_count()
 
     def _constrain_contiguity(self):
         r'''Not composer-safe.
@@ -437,6 +440,10 @@ class Spanner(AbjadObject):
         from abjad.tools import scoretools
         if not isinstance(n, int):
             raise TypeError
+        if n in (0, -1) and self._components:
+            component = self._components[n]
+            if isinstance(component, scoretools.Leaf):
+                return component
         if 0 <= n:
             leaves = iterate(self).by_leaf()
             for leaf_index, leaf in enumerate(leaves):
@@ -514,6 +521,7 @@ class Spanner(AbjadObject):
             raise Exception(message)
         component._spanners.add(self)
         self._components.insert(i, component)
+        component._increment_modification_count()
 
     def _is_exterior_leaf(self, leaf):
         r'''True if leaf is first or last in spanner.
@@ -650,6 +658,7 @@ class Spanner(AbjadObject):
         r'''Not composer-safe.
         '''
         component._spanners.add(self)
+        component._increment_modification_count()
 
     def _unconstrain_contiguity(self):
         r'''Not composer-safe.
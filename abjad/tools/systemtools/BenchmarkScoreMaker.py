@@ -190,6 +190,126 @@ class BenchmarkScoreMaker(AbjadObject):
         voice = abjad.Voice(200 * abjad.Note("c'16"))
         return voice
 
+    def make_score_for_meter_fitting_01(self):
+        r'''Make 10,005-note staff with bars of 3, 4 and 5 quarter notes
+        split into eighth notes on two beats out of three.
+
+        Fitting 3/4, 4/4 and 5/4 meters to the 10,006 leaf offsets of staff:
+
+        ::
+
+            2.21 (c7e5a5b) greedy meter fitting:     37,262,574 function calls
+            2.21 (8862578) greedy meter fitting:      3,041,992 function calls
+            2.21 (8862578) optimal meter fitting:     2,628,055 function calls
+
+        '''
+        import abjad
+        numerators = [3, 4, 5, 4, 5, 3, 5]
+        durations = []
+        i = 0
+        while len(durations) < 10000:
+            numerator = numerators[i % len(numerators)]
+            for beat in range(numerator):
+                if (i + beat) % 3:
+                    durations.extend([(1, 8), (1, 8)])
+                else:
+                    durations.append((1, 4))
+            i += 1
+        maker = abjad.NoteMaker()
+        staff = abjad.Staff(maker([0], durations))
+        return staff
+
+    def make_score_for_quantization_01(self):
+        r'''Make 40-measure staff of 2/4 measures with two random triplets,
+        quintuplets or septuplets per measure.
+
+        Quantizing the leaves of each measure of staff at quarter equals 60
+        with one quantizer call per measure, in seconds on one CPU:
+
+        ::
+
+            2.21 (39c4e6d) serial job handler:          108.8 seconds
+            2.21 (39c4e6d) parallel job handler:        115.5 seconds
+            2.21 (7bf800b) serial job handler:           98.7 seconds
+            2.21 (7bf800b) parallel job handler:        108.6 seconds
+
+        '''
+        import abjad
+        import random
+        random_ = random.Random(0)
+        tuplet_specifiers = [
+            ((4, 5), (1, 16), 5),
+            ((2, 3), (1, 8), 3),
+            ((4, 7), (1, 16), 7),
+            ]
+        staff = abjad.Staff()
+        for _ in range(40):
+            measure = abjad.Measure((2, 4))
+            for _ in range(2):
+                multiplier, duration, count = random_.choice(
+                    tuplet_specifiers)
+                leaves = []
+                for _ in range(count):
+                    if random_.randint(0, 3):
+                        leaves.append(abjad.Note(0, duration))
+                    else:
+                        leaves.append(abjad.Rest(duration))
+                measure.append(abjad.Tuplet(multiplier, leaves))
+            staff.append(measure)
+        return staff
+
+    def make_score_for_timespan_operations_01(self):
+        r'''Make 10-staff score with 100 random notes and rests per staff.
+
+        Timespans of the 673 notes of score:
+
+        ::
+
+            2.21 (d7ed681) logical OR:        1,174,421 function calls
+            2.21 (20b53e9) logical OR:          228,040 function calls
+
+            2.21 (d7ed681) logical AND:          68,368 function calls
+            2.21 (20b53e9) logical AND:          76,213 function calls
+
+            2.21 (d7ed681) logical XOR:       6,093,334 function calls
+            2.21 (20b53e9) logical XOR:          83,245 function calls
+
+            2.21 (d7ed681) partition:           279,457 function calls
+            2.21 (20b53e9) partition:           143,552 function calls
+
+        '''
+        import abjad
+        import random
+        random_ = random.Random(0)
+        durations = [(1, 16), (1, 8), (3, 16), (1, 4)]
+        maker = abjad.LeafMaker()
+        score = abjad.Score()
+        for _ in range(10):
+            pitches = [random_.choice([None, 0, 0]) for _ in range(100)]
+            staff_durations = [random_.choice(durations) for _ in range(100)]
+            staff = abjad.Staff(maker(pitches, staff_durations))
+            score.append(staff)
+        return score
+
+    def make_score_with_measures_01(self):
+        r'''Make 4-staff score with 50 measures of four notes per staff.
+
+        ::
+
+            2.21 offset update after local edit:          7,879 function calls
+            2.21 offset update after global edit:       101,757 function calls
+
+        '''
+        import abjad
+        score = abjad.Score()
+        for staff_index in range(4):
+            staff = abjad.Staff()
+            for measure_index in range(50):
+                measure = abjad.Measure((4, 8), "c'8 d'8 e'8 f'8")
+                staff.append(measure)
+            score.append(staff)
+        return score
+
     def make_score_with_indicators_01(self):
         r'''Make 200-note voice with dynamic on every 20th note:
 
@@ -260,6 +380,30 @@ class BenchmarkScoreMaker(AbjadObject):
             abjad.attach(dynamic, note)
         return staff
 
+    def make_score_with_tuplets_01(self):
+        r'''Make 4-staff score with 50 triplets and 50 quintuplets per staff.
+
+        ::
+
+            2.21 (4e5fec5) offset update:       196,757 function calls
+            2.21 (8e02e1e) offset update:       115,289 function calls
+
+            2.21 (4e5fec5) LilyPond format:   1,634,189 function calls
+            2.21 (8e02e1e) LilyPond format:   1,581,031 function calls
+
+        '''
+        import abjad
+        score = abjad.Score()
+        for staff_index in range(4):
+            staff = abjad.Staff()
+            for tuplet_index in range(50):
+                tuplet = abjad.Tuplet((2, 3), "c'8 d'8 e'8")
+                staff.append(tuplet)
+                tuplet = abjad.Tuplet((4, 5), "c'16 d'16 e'16 f'16 g'16")
+                staff.append(tuplet)
+            score.append(staff)
+        return score
+
     def make_spanner_score_01(self):
         r'''Make 200-note voice with durated complex beam spanner
         on every 4 notes.
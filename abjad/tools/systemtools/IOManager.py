@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import datetime
+import multiprocessing.pool
 import os
 import platform
 import re
@@ -50,6 +51,27 @@ class IOManager(AbjadObject):
             input(message)
             os.makedirs(directory)
 
+    @staticmethod
+    def _get_lilypond_command(ly_path, flags=None, lilypond_path=None):
+        from abjad import abjad_configuration
+        if not lilypond_path:
+            lilypond_path = abjad_configuration.get('lilypond_path')
+        if not lilypond_path:
+            lilypond_path = IOManager.find_executable('lilypond')
+            if lilypond_path:
+                lilypond_path = lilypond_path[0]
+            else:
+                lilypond_path = 'lilypond'
+        lilypond_base, extension = os.path.splitext(ly_path)
+        flags = flags or ''
+        command = '{} {} -dno-point-and-click -o {} {}'.format(
+            lilypond_path,
+            flags,
+            lilypond_base,
+            ly_path,
+            )
+        return command
+
     @staticmethod
     def _make_score_package(
         score_package_path,
@@ -129,6 +151,39 @@ class IOManager(AbjadObject):
                 with open(file_, 'w') as file_pointer:
                     file_pointer.write(completed_template)
 
+    @staticmethod
+    def _run_lilypond_command(ly_path, command):
+        date = datetime.datetime.now().strftime('%c')
+        process = subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            )
+        subprocess_output, _ = process.communicate()
+        if sys.version_info[0] == 3:
+            subprocess_output = subprocess_output.decode('utf-8')
+        exit_code = process.returncode
+        postscript_path = ly_path.replace('.ly', '.ps')
+        try:
+            os.remove(postscript_path)
+        except OSError:
+            pass
+        log = date + '\n' + subprocess_output
+        return log, not exit_code
+
+    @staticmethod
+    def _run_lilypond_job(job):
+        from abjad.tools import systemtools
+        ly_path, command = job
+        timer = systemtools.Timer()
+        with timer:
+            log, success = IOManager._run_lilypond_command(ly_path, command)
+        log_file_path = '{}.log'.format(os.path.splitext(ly_path)[0])
+        with open(log_file_path, 'w') as file_pointer:
+            file_pointer.write(log)
+        return ly_path, success, log, timer.elapsed_time
+
     @staticmethod
     def _warn_when_output_directory_almost_full(last_number):
         from abjad import abjad_configuration
@@ -614,48 +669,90 @@ class IOManager(AbjadObject):
         Then appends redirected output of LilyPond output to the LilyPond log
         file.
 
-        Returns none.
+        Returns true when LilyPond exits without error. Otherwise false.
         '''
         from abjad import abjad_configuration
-        from abjad.tools import systemtools
-        lilypond_path = abjad_configuration.get('lilypond_path')
-        if not lilypond_path:
-            lilypond_path = systemtools.IOManager.find_executable('lilypond')
-            if lilypond_path:
-                lilypond_path = lilypond_path[0]
-            else:
-                lilypond_path = 'lilypond'
-        lilypond_base, extension = os.path.splitext(ly_path)
-        flags = flags or ''
-        date = datetime.datetime.now().strftime('%c')
-        log_file_path = abjad_configuration.lilypond_log_file_path
-        command = '{} {} -dno-point-and-click -o {} {}'.format(
-            lilypond_path,
-            flags,
-            lilypond_base,
+        command = IOManager._get_lilypond_command(
             ly_path,
+            flags=flags,
+            lilypond_path=lilypond_path,
             )
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            )
-        subprocess_output, _ = process.communicate()
-        if sys.version_info[0] == 3:
-            subprocess_output = subprocess_output.decode('utf-8')
-        exit_code = process.returncode
+        log, success = IOManager._run_lilypond_command(ly_path, command)
+        log_file_path = abjad_configuration.lilypond_log_file_path
         with open(log_file_path, 'w') as file_pointer:
-            file_pointer.write(date + '\n')
-            file_pointer.write(subprocess_output)
-        postscript_path = ly_path.replace('.ly', '.ps')
+            file_pointer.write(log)
+        return success
+
+    @staticmethod
+    def run_lilypond_batch(
+        arguments,
+        flags=None,
+        lilypond_path=None,
+        processes=None,
+        ):
+        r'''Runs LilyPond on each of `arguments` concurrently.
+
+        ..  container:: example
+
+            ::
+
+                >>> notes = [abjad.Note(_, (1, 4)) for _ in range(4)]
+
+            ::
+
+                >>> results = abjad.IOManager.run_lilypond_batch( # doctest: +SKIP
+                ...     notes,
+                ...     processes=2,
+                ...     )
+                >>> for ly_path, success, log, elapsed_time in results: # doctest: +SKIP
+                ...     ly_path, success
+                ...
+                ('/Users/josiah/.abjad/output/1417.ly', True)
+                ('/Users/josiah/.abjad/output/1418.ly', True)
+                ('/Users/josiah/.abjad/output/1419.ly', True)
+                ('/Users/josiah/.abjad/output/1420.ly', True)
+
+        Each of `arguments` may be the path of a LilyPond file or any object
+        which can be illustrated. Persists illustrations as LilyPond files in
+        the Abjad output directory first.
+
+        Runs at most `processes` LilyPond subprocesses at one time. Runs one
+        LilyPond subprocess per CPU when `processes` is none.
+
+        Writes the redirected output of each LilyPond subprocess to a log file
+        next to each LilyPond file, with the date on the top line.
+
+        Returns list of LilyPond file path, success, log and elapsed rendering
+        time tuples in the order of `arguments`.
+        '''
+        from abjad.tools import agenttools
+        jobs = []
+        for argument in arguments:
+            if hasattr(argument, '__illustrate__'):
+                agent = agenttools.PersistenceAgent(argument)
+                ly_path, abjad_formatting_time = agent.as_ly()
+            else:
+                ly_path = os.path.expanduser(argument)
+            command = IOManager._get_lilypond_command(
+                ly_path,
+                flags=flags,
+                lilypond_path=lilypond_path,
+                )
+            jobs.append((ly_path, command))
+        if not jobs:
+            return []
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        processes = max(1, min(int(processes), len(jobs)))
+        if processes == 1:
+            return [IOManager._run_lilypond_job(_) for _ in jobs]
+        pool = multiprocessing.pool.ThreadPool(processes)
         try:
-            os.remove(postscript_path)
-        except OSError:
-            pass
-        if exit_code:
-            return False
-        return True
+            results = pool.map(IOManager._run_lilypond_job, jobs, 1)
+        finally:
+            pool.close()
+            pool.join()
+        return results
 
     @staticmethod
     def save_last_ly_as(file_path):
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
+import importlib
 import os
+import sys
 import types
 from abjad.tools.abctools import AbjadObject
 
 
 class ImportManager(AbjadObject):
     r'''Imports structured packages.
+
+    Imports structured packages lazily on request: lazy packages import
+    modules on first access of public names defined in them.
     '''
 
     ### CLASS VARIABLES ###
@@ -18,6 +23,54 @@ class ImportManager(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _get_lazy_names(path, ignored_names=None):
+        r'''Inspects the top level of `path` without importing modules.
+
+        Maps eponymous name of each .py module in `path` and name of each
+        package in `path` to pair of module name and attribute name.
+
+        Assumes that each .py module defines exactly one public name: the
+        eponymous class, function or datum.
+        '''
+        lazy_names = {}
+        package_path = ImportManager._split_package_path(path)
+        for element in os.listdir(path):
+            if ignored_names and element in ignored_names:
+                continue
+            element_path = os.path.join(path, element)
+            if os.path.isfile(element_path):
+                if element.startswith('_'):
+                    continue
+                if not element.endswith(('.py', '.pyx')):
+                    continue
+                name = os.path.splitext(element)[0]
+                module_name = '.'.join((package_path, name))
+                lazy_names[name] = (module_name, name)
+            elif os.path.isdir(element_path):
+                if element in ('.svn', '.git', 'test', '__pycache__'):
+                    continue
+                initializer_file_path = os.path.join(
+                    element_path,
+                    '__init__.py',
+                    )
+                if os.path.exists(initializer_file_path):
+                    module_name = '.'.join((package_path, element))
+                    lazy_names[element] = (module_name, None)
+            else:
+                message = 'neither a directory or file: {!r}'
+                message = message.format(element)
+                raise ImportError(message)
+        return lazy_names
+
+    @staticmethod
+    def _get_lazy_value(module_name, attribute_name):
+        value = importlib.import_module(module_name)
+        if attribute_name is not None:
+            for name in attribute_name.split('.'):
+                value = getattr(value, name)
+        return value
+
     @staticmethod
     def _get_public_function_names_in_module(module_file):
         r'''Collects and returns all public functions defined in
@@ -73,6 +126,26 @@ class ImportManager(AbjadObject):
                     for public_name in public_names:
                         namespace[public_name.__name__] = public_name
 
+    @staticmethod
+    def _install_lazy_names(namespace, lazy_names):
+        r'''Defers import of `lazy_names` into `namespace` until first
+        access.
+
+        Imports `lazy_names` immediately when module class assignment is
+        unavailable.
+        '''
+        module = sys.modules.get(namespace.get('__name__'))
+        if sys.version_info < (3, 5) or module is None:
+            for name, pair in lazy_names.items():
+                namespace[name] = ImportManager._get_lazy_value(*pair)
+            return
+        if not isinstance(module, _LazyModule):
+            namespace['_lazy_names'] = {}
+            module.__class__ = _LazyModule
+        for name in lazy_names:
+            namespace.pop(name, None)
+        namespace['_lazy_names'].update(lazy_names)
+
     @staticmethod
     def _split_package_path(path):
         outer, inner = path, None
@@ -84,6 +157,28 @@ class ImportManager(AbjadObject):
 
     ### PUBLIC METHODS ###
 
+    @staticmethod
+    def get_namespace(module):
+        r'''Gets namespace of `module`.
+
+        ..  container:: example
+
+            ::
+
+                >>> from abjad.tools import mathtools
+                >>> manager = abjad.systemtools.ImportManager
+                >>> namespace = manager.get_namespace(mathtools)
+                >>> namespace['Ratio'] is mathtools.Ratio
+                True
+
+        Imports lazy names of `module` first.
+
+        Returns dictionary.
+        '''
+        for name in list(vars(module).get('_lazy_names', ())):
+            getattr(module, name)
+        return vars(module).copy()
+
     @staticmethod
     def import_material_packages(
         path,
@@ -157,6 +252,47 @@ class ImportManager(AbjadObject):
         if ImportManager.__name__ in namespace:
             del(namespace[ImportManager.__name__])
 
+    @staticmethod
+    def import_public_names_from_modules_into_namespace(
+        module_names,
+        namespace,
+        names=None,
+        lazy=False,
+        ):
+        r'''Imports public names from modules called `module_names` into
+        `namespace`.
+
+        Behaves like star-importing each module in turn: public names of later
+        modules replace public names of earlier modules.
+
+        Imports only `names` when `names` is not none.
+
+        Defers import of names not yet imported by lazy modules until first
+        access when `lazy` is true.
+        '''
+        if isinstance(namespace, types.ModuleType):
+            namespace = namespace.__dict__
+        lazy_names = {}
+        for module_name in module_names:
+            module = importlib.import_module(module_name)
+            module_dictionary = vars(module)
+            for name, value in list(module_dictionary.items()):
+                if name.startswith('_'):
+                    continue
+                if names is not None and name not in names:
+                    continue
+                namespace[name] = value
+                lazy_names.pop(name, None)
+            for name in module_dictionary.get('_lazy_names', ()):
+                if names is not None and name not in names:
+                    continue
+                if lazy:
+                    lazy_names[name] = (module_name, name)
+                else:
+                    namespace[name] = getattr(module, name)
+        if lazy_names:
+            ImportManager._install_lazy_names(namespace, lazy_names)
+
     @staticmethod
     def import_public_names_from_path_into_namespace(
         path,
@@ -233,6 +369,7 @@ class ImportManager(AbjadObject):
         namespace,
         delete_systemtools=True,
         ignored_names=None,
+        lazy=False,
         ):
         r'''Imports public names from `path` into `namespace`.
 
@@ -240,15 +377,81 @@ class ImportManager(AbjadObject):
         public classes and functions on startup.
 
         The function will work for any package laid out like Abjad packages.
+
+        Defers import of each module in `path` until first access of public
+        names defined in module when `lazy` is true.
+
+        Imports eagerly under Python versions that do not allow module class
+        assignment.
         '''
-        ImportManager.import_public_names_from_path_into_namespace(
-            path,
-            namespace,
-            delete_systemtools=delete_systemtools,
-            ignored_names=ignored_names,
-            )
+        if lazy and (3, 5) <= sys.version_info:
+            lazy_names = ImportManager._get_lazy_names(
+                path,
+                ignored_names=ignored_names,
+                )
+            if delete_systemtools:
+                lazy_names.pop('systemtools', None)
+            ImportManager._install_lazy_names(namespace, lazy_names)
+            ImportManager._import_contents_of_public_packages_in_path_into_namespace(
+                path, namespace)
+        else:
+            ImportManager.import_public_names_from_path_into_namespace(
+                path,
+                namespace,
+                delete_systemtools=delete_systemtools,
+                ignored_names=ignored_names,
+                )
         if delete_systemtools:
             if 'systemtools' in namespace:
                 del(namespace['systemtools'])
         if ImportManager.__name__ in namespace:
             del(namespace[ImportManager.__name__])
+
+
+class _LazyModule(types.ModuleType):
+    r'''Module importing public names listed in its `_lazy_names`
+    dictionary on first access.
+    '''
+
+    ### SPECIAL METHODS ###
+
+    def __delattr__(self, name):
+        lazy_names = vars(self).get('_lazy_names', {})
+        if name in lazy_names:
+            del(lazy_names[name])
+            if name not in vars(self):
+                return
+        types.ModuleType.__delattr__(self, name)
+
+    def __dir__(self):
+        names = set(vars(self))
+        names.update(vars(self).get('_lazy_names', ()))
+        return sorted(names)
+
+    def __getattr__(self, name):
+        lazy_names = vars(self).get('_lazy_names', {})
+        if name == '__all__':
+            names = (_ for _ in dir(self) if not _.startswith('_'))
+            return sorted(names)
+        if name not in lazy_names:
+            message = 'module {!r} has no attribute {!r}'
+            message = message.format(self.__name__, name)
+            raise AttributeError(message)
+        value = ImportManager._get_lazy_value(*lazy_names[name])
+        types.ModuleType.__setattr__(self, name, value)
+        lazy_names.pop(name, None)
+        return value
+
+    def __setattr__(self, name, value):
+        lazy_names = vars(self).get('_lazy_names', {})
+        if name in lazy_names:
+            module_name, attribute_name = lazy_names[name]
+            # ignore submodule bound by import machinery
+            if (
+                attribute_name is not None and
+                isinstance(value, types.ModuleType) and
+                value.__name__ == module_name
+                ):
+                return
+            del(lazy_names[name])
+        types.ModuleType.__setattr__(self, name, value)
@@ -190,6 +190,8 @@ class IndicatorWrapper(AbjadValueObject):
                     )
 
         Copies indicator and scope.
+
+        Shares immutable indicators instead of copying them.
         
         Does not copy start component.
 
@@ -199,9 +201,12 @@ class IndicatorWrapper(AbjadValueObject):
         
         Returns new indicator wrapper.
         '''
+        indicator = self.indicator
+        if not getattr(indicator, '_is_immutable', False):
+            indicator = copy.copy(indicator)
         new = type(self)(
             component=None,
-            indicator=copy.copy(self.indicator),
+            indicator=indicator,
             is_annotation=self.is_annotation,
             is_piecewise=self.is_piecewise,
             name=self.name,
@@ -217,7 +222,10 @@ class IndicatorWrapper(AbjadValueObject):
         self._unbind_effective_context()
         if correct_effective_context is not None:
             correct_effective_context._dependent_wrappers.append(self)
+            correct_effective_context._effective_indicator_index = None
         self._effective_context = correct_effective_context
+        if isinstance(self.component, abjad.Component):
+            self.component._lilypond_format_bundle = None
         self._update_effective_context()
         if isinstance(self.indicator, abjad.MetronomeMark):
             correct_effective_context._update_later(offsets_in_seconds=True)
@@ -228,9 +236,11 @@ class IndicatorWrapper(AbjadValueObject):
         self._unbind_component()
         self._component = component
         self._update_effective_context()
-        if isinstance(self.indicator, abjad.MetronomeMark):
-            self._component._update_later(offsets_in_seconds=True)
         component._indicator_wrappers.append(self)
+        if isinstance(component, abjad.Component):
+            component._effective_indicator_index = None
+            component._clear_lilypond_format_bundles()
+        self._update_component_offsets_later()
 
     def _detach(self):
         self._unbind_component()
@@ -309,11 +319,16 @@ class IndicatorWrapper(AbjadValueObject):
         return False
 
     def _unbind_component(self):
+        import abjad
         component = self.component
         if component is not None:
             if hasattr(component, '_indicator_wrappers'):
                 if self in component._indicator_wrappers:
                     component._indicator_wrappers.remove(self)
+                    if isinstance(component, abjad.Component):
+                        component._effective_indicator_index = None
+                        component._clear_lilypond_format_bundles()
+                    self._update_component_offsets_later()
         self._component = None
 
     def _unbind_effective_context(self):
@@ -323,8 +338,26 @@ class IndicatorWrapper(AbjadValueObject):
                 effective_context._dependent_wrappers.remove(self)
             except ValueError:
                 pass
+            effective_context._effective_indicator_index = None
         self._effective_context = None
 
+    def _update_component_offsets_later(self):
+        r'''Multipliers and time signatures change component duration.
+        Metronome marks change component duration in seconds.
+        '''
+        import abjad
+        if not isinstance(self.component, abjad.Component):
+            return
+        prototype = (
+            abjad.Multiplier,
+            abjad.NonreducedFraction,
+            abjad.TimeSignature,
+            )
+        if isinstance(self.indicator, prototype):
+            self.component._update_later(offsets=True)
+        elif isinstance(self.indicator, abjad.MetronomeMark):
+            self.component._update_later(offsets_in_seconds=True)
+
     def _update_effective_context(self):
         r'''This function is designed to be called by score components
         during score update.
@@ -101,19 +101,141 @@ class LilyPondFormatManager(AbjadObject):
             )
         return indicators
 
+    @staticmethod
+    def _dump_component(component):
+        r'''Pickles `component` and its descendants.
+
+        Components outside `component` pickle as persistent IDs.
+
+        Returns bytes.
+        '''
+        import io
+        import pickle
+        from abjad.tools import scoretools
+        from abjad.tools import systemtools
+        components = systemtools.UpdateManager._iterate_entire_score(
+            component)
+        component_ids = set(id(_) for _ in components)
+        class Pickler(pickle.Pickler):
+            def persistent_id(self, object_):
+                if (isinstance(object_, scoretools.Component) and
+                    id(object_) not in component_ids):
+                    return 'outside'
+        file_pointer = io.BytesIO()
+        Pickler(file_pointer, 2).dump(component)
+        return file_pointer.getvalue()
+
+    @staticmethod
+    def _format_dumped_component(string):
+        r'''Formats component pickled by ``_dump_component()``.
+
+        Returns string.
+        '''
+        component = LilyPondFormatManager._load_component(string)
+        pieces = component._iterate_format_pieces()
+        return '\n'.join(pieces)
+
+    @staticmethod
+    def _get_parallel_format_components(argument):
+        from abjad.tools import lilypondfiletools
+        from abjad.tools import scoretools
+        roots = []
+        items = [argument]
+        while items:
+            item = items.pop(0)
+            if isinstance(item, scoretools.Component):
+                roots.append(item)
+            elif isinstance(item, (list, tuple)):
+                items[0:0] = item
+            elif isinstance(item, (
+                lilypondfiletools.Block,
+                lilypondfiletools.LilyPondFile,
+                )):
+                items[0:0] = item.items
+        components = []
+        def recurse(container):
+            if not isinstance(container, scoretools.Container):
+                return
+            if not container.is_simultaneous:
+                return
+            for component in container:
+                if not isinstance(component, scoretools.Context):
+                    continue
+                if (component.is_simultaneous and
+                    all(isinstance(_, scoretools.Context) for _ in component)
+                    ):
+                    recurse(component)
+                elif LilyPondFormatManager._is_formattable_alone(component):
+                    components.append(component)
+        for root in roots:
+            recurse(root)
+        return roots, components
+
+    @staticmethod
+    def _is_formattable_alone(component):
+        r'''Is true when `component` formats the same without parentage.
+
+        Parentage must carry no indicators or spanners. Spanners must not
+        cross `component`. No clef or dynamic may be scoped to parentage
+        because clef spanners and hairpins get effective clefs and dynamics
+        during formatting.
+        '''
+        from abjad.tools import indicatortools
+        from abjad.tools import systemtools
+        components = list(
+            systemtools.UpdateManager._iterate_entire_score(component))
+        component_ids = set(id(_) for _ in components)
+        prototype = (indicatortools.Clef, indicatortools.Dynamic)
+        for parent in component._get_parentage(include_self=False):
+            if parent._indicator_wrappers or parent._spanners:
+                return False
+            for wrapper in parent._dependent_wrappers:
+                if isinstance(wrapper.indicator, prototype):
+                    return False
+        for component_ in components:
+            for spanner in component_._spanners:
+                for leaf in spanner:
+                    if id(leaf) not in component_ids:
+                        return False
+        return True
+
+    @staticmethod
+    def _load_component(string):
+        r'''Unpickles component pickled by ``_dump_component()``.
+
+        Components outside the unpickled component load as a placeholder so
+        that indicators keep their effective context. The unpickled
+        component is forbidden to update because its offsets and indicators
+        were updated before pickling.
+
+        Returns component.
+        '''
+        import io
+        import pickle
+        placeholder = object()
+        class Unpickler(pickle.Unpickler):
+            def persistent_load(self, persistent_id):
+                return placeholder
+        component = Unpickler(io.BytesIO(string)).load()
+        component._parent = None
+        component._is_forbidden_to_update = True
+        return component
+
     @staticmethod
     def _populate_context_setting_format_contributions(component, bundle):
         result = []
         from abjad.tools.topleveltools import setting
         from abjad.tools import scoretools
         manager = LilyPondFormatManager
+        contextualizer = component._lilypond_setting_name_manager
+        if contextualizer is None:
+            contextualizer = setting(component)
         if isinstance(component, scoretools.Context):
-            for name, value in vars(setting(component)).items():
+            for name, value in vars(contextualizer).items():
                 string = manager.format_lilypond_context_setting_in_with_block(
                     name, value)
                 result.append(string)
         else:
-            contextualizer = setting(component)
             variables = vars(contextualizer)
             for name, value in variables.items():
                 # if we've found a leaf context namespace
@@ -140,7 +262,9 @@ class LilyPondFormatManager(AbjadObject):
         from abjad.tools import topleveltools
         result = []
         is_once = isinstance(component, scoretools.Leaf)
-        grob = topleveltools.override(component)
+        grob = component._lilypond_grob_name_manager
+        if grob is None:
+            grob = topleveltools.override(component)
         contributions = grob._list_format_contributions(
             'override',
             is_once=is_once,
@@ -153,7 +277,7 @@ class LilyPondFormatManager(AbjadObject):
             arrow = written_pitch.arrow
         except AttributeError:
             arrow = None
-        if arrow in (Up, Down):
+        if arrow is not None and arrow in (Up, Down):
             contributions_ = written_pitch._list_format_contributions()
             contributions.extend(contributions_)
         bundle.grob_overrides.extend(contributions)
@@ -163,7 +287,9 @@ class LilyPondFormatManager(AbjadObject):
         from abjad.tools import scoretools
         from abjad.tools import topleveltools
         if not isinstance(component, scoretools.Leaf):
-            manager = topleveltools.override(component)
+            manager = component._lilypond_grob_name_manager
+            if manager is None:
+                manager = topleveltools.override(component)
             contributions = manager._list_format_contributions('revert')
             bundle.grob_reverts.extend(contributions)
 
@@ -278,12 +404,37 @@ class LilyPondFormatManager(AbjadObject):
     def bundle_format_contributions(component):
         r'''Gets all format contributions for `component`.
 
+        Caches indicator contributions on `component` until indicators
+        attach or detach, effective contexts change or component parentage
+        changes. Recomputes spanner, context setting and grob override
+        contributions each time.
+
         Returns LilyPond format bundle.
         '''
+        from abjad.tools import scoretools
         from abjad.tools import systemtools
         manager = LilyPondFormatManager
+        spanners = component._get_parentage()._get_spanners()
+        has_spanner_indicators = any(_._indicator_wrappers for _ in spanners)
+        indicator_bundle = component._lilypond_format_bundle
+        if indicator_bundle is None or has_spanner_indicators:
+            indicator_bundle = systemtools.LilyPondFormatBundle()
+            manager._populate_indicator_format_contributions(
+                component, indicator_bundle)
+            indicator_bundle.alphabetize()
+            indicator_bundle.make_immutable()
+            if (not has_spanner_indicators and
+                not isinstance(component, scoretools.Measure)):
+                component._lilypond_format_bundle = indicator_bundle
+        written_pitch = getattr(component, 'written_pitch', None)
+        if (not spanners and
+            component._lilypond_grob_name_manager is None and
+            component._lilypond_setting_name_manager is None and
+            getattr(written_pitch, 'arrow', None) is None
+            ):
+            return indicator_bundle
         bundle = systemtools.LilyPondFormatBundle()
-        manager._populate_indicator_format_contributions(component, bundle)
+        bundle.update(indicator_bundle)
         manager._populate_spanner_format_contributions(component, bundle)
         manager._populate_context_setting_format_contributions(
             component, bundle)
@@ -541,3 +692,76 @@ class LilyPondFormatManager(AbjadObject):
                 result.append('\t{}'.format(piece))
         result = '\n'.join(result)
         return result
+
+    @staticmethod
+    def write_lilypond_format(argument, file_pointer, processes=None):
+        r'''Writes LilyPond format of `argument` to `file_pointer` piece by
+        piece.
+
+        ..  container:: example
+
+            ::
+
+                >>> import io
+                >>> staff = abjad.Staff("c'4 d'4")
+                >>> file_pointer = io.StringIO()
+                >>> manager = abjad.LilyPondFormatManager
+                >>> manager.write_lilypond_format(staff, file_pointer)
+                >>> print(file_pointer.getvalue())
+                \new Staff {
+                    c'4
+                    d'4
+                }
+
+        Writes the same string as ``format(argument, 'lilypond')`` without
+        building that string in memory first.
+
+        Set `processes` to an integer greater than 1 to format the contexts
+        of simultaneous containers (like the staves in a staff group) in a
+        pool of worker processes. Each worker receives only the subtree of
+        the context it formats. Contexts whose format depends on components
+        outside their subtree format in the calling process. Formatted
+        contexts are written in score order.
+
+        Returns none.
+        '''
+        import multiprocessing
+        if not hasattr(argument, '_iterate_format_pieces'):
+            file_pointer.write(format(argument, 'lilypond'))
+            return
+        manager = LilyPondFormatManager
+        pool, pending_format_pieces = None, None
+        if processes is not None and 1 < processes:
+            roots, components = manager._get_parallel_format_components(
+                argument)
+            if components:
+                for root in roots:
+                    root._update_now(indicators=True)
+                pool = multiprocessing.Pool(processes)
+                pending_format_pieces = {}
+                for component in components:
+                    result = pool.apply_async(
+                        manager._format_dumped_component,
+                        (manager._dump_component(component),),
+                        )
+                    pending_format_pieces[id(component)] = result
+        try:
+            pieces = argument._iterate_format_pieces(
+                pending_format_pieces=pending_format_pieces,
+                )
+            chunk, is_first_chunk = [], True
+            for piece in pieces:
+                chunk.append(piece)
+                if len(chunk) == 1000:
+                    if not is_first_chunk:
+                        file_pointer.write('\n')
+                    file_pointer.write('\n'.join(chunk))
+                    chunk, is_first_chunk = [], False
+            if chunk:
+                if not is_first_chunk:
+                    file_pointer.write('\n')
+                file_pointer.write('\n'.join(chunk))
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
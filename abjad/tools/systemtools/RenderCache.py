@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from abjad.tools.abctools import AbjadObject
+
+
+class RenderCache(AbjadObject):
+    r'''Render cache.
+
+    ::
+
+        >>> import abjad
+
+    ..  container:: example
+
+        ::
+
+            >>> cache = abjad.RenderCache(
+            ...     directory='render-cache',
+            ...     maximum_size=2 ** 20,
+            ...     )
+            >>> cache
+            RenderCache(directory='render-cache', maximum_size=1048576)
+
+    Content-addressed on-disk cache of LilyPond output files.
+
+    Keys rendered output by a hash of LilyPond source, LilyPond version,
+    LilyPond flags and output file extension. Restores cached output files
+    without running LilyPond when a LilyPond file is rendered again
+    unchanged.
+
+    Ignores the date / time comment that opens LilyPond files persisted by
+    Abjad so that rendering the same score later still hits the cache.
+
+    Evicts least recently used entries when the total size of cached output
+    files exceeds `maximum_size` bytes.
+
+    Note that the cache does not hash files included by the LilyPond file.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = 'Managers'
+
+    __slots__ = (
+        '_directory',
+        '_maximum_size',
+        )
+
+    _date_time_comment_regex = re.compile(
+        br'\A% \d{4}-\d{2}-\d{2} \d{2}:\d{2}\r?\n',
+        )
+
+    _output_file_name = 'output'
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory=None, maximum_size=None):
+        if directory is not None:
+            directory = os.path.expanduser(directory)
+        self._directory = directory
+        if maximum_size is not None:
+            maximum_size = int(maximum_size)
+            assert 0 <= maximum_size, repr(maximum_size)
+        self._maximum_size = maximum_size
+
+    ### PRIVATE METHODS ###
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+        for entry_path in self._get_entry_paths():
+            size = 0
+            for file_name in os.listdir(entry_path):
+                file_path = os.path.join(entry_path, file_name)
+                size += os.path.getsize(file_path)
+            entries.append((os.path.getmtime(entry_path), entry_path, size))
+            total_size += size
+        entries.sort()
+        for last_used, entry_path, size in entries:
+            if total_size <= self.maximum_size:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= size
+
+    def _get_entry_path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _get_entry_paths(self):
+        if not os.path.isdir(self.directory):
+            return []
+        entry_paths = []
+        for prefix in os.listdir(self.directory):
+            prefix_path = os.path.join(self.directory, prefix)
+            if not os.path.isdir(prefix_path):
+                continue
+            for key in os.listdir(prefix_path):
+                entry_path = os.path.join(prefix_path, key)
+                if os.path.isdir(entry_path) and not key.startswith('.'):
+                    entry_paths.append(entry_path)
+        return entry_paths
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory(self):
+        r'''Gets render cache directory.
+
+        ..  container:: example
+
+            ::
+
+                >>> directory = abjad.RenderCache().directory
+                >>> directory.startswith(
+                ...     abjad.abjad_configuration.abjad_output_directory)
+                True
+
+        Defaults to ``render-cache`` in the Abjad output directory.
+
+        Returns string.
+        '''
+        if self._directory is None:
+            from abjad import abjad_configuration
+            return os.path.join(
+                abjad_configuration.abjad_output_directory,
+                'render-cache',
+                )
+        return self._directory
+
+    @property
+    def maximum_size(self):
+        r'''Gets maximum total size of cached output files in bytes.
+
+        ..  container:: example
+
+            ::
+
+                >>> abjad.RenderCache().maximum_size
+                268435456
+
+        Defaults to 256 megabytes.
+
+        Returns nonnegative integer.
+        '''
+        if self._maximum_size is None:
+            return 2 ** 28
+        return self._maximum_size
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        r'''Removes all entries from render cache.
+
+        Returns none.
+        '''
+        if os.path.isdir(self.directory):
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get(self, key, base):
+        r'''Copies output files cached under `key` to paths starting with
+        `base`.
+
+        Marks entry as most recently used.
+
+        Returns tuple of output file paths on cache hit. Otherwise none.
+        '''
+        entry_path = self._get_entry_path(key)
+        if not os.path.isdir(entry_path):
+            return None
+        output_file_paths = []
+        try:
+            for file_name in sorted(os.listdir(entry_path)):
+                suffix = file_name[len(self._output_file_name):]
+                output_file_path = base + suffix
+                shutil.copyfile(
+                    os.path.join(entry_path, file_name),
+                    output_file_path,
+                    )
+                output_file_paths.append(output_file_path)
+            os.utime(entry_path, None)
+        except (IOError, OSError):
+            return None
+        if not output_file_paths:
+            return None
+        return tuple(output_file_paths)
+
+    def get_key(self, ly_file_path, flags=None, extension=None):
+        r'''Gets key of LilyPond file at `ly_file_path` rendered with
+        `flags` to output files with `extension`.
+
+        Ignores date / time comment on first line of LilyPond file.
+
+        Returns string.
+        '''
+        from abjad import abjad_configuration
+        lilypond_version = abjad_configuration.get_lilypond_version_string()
+        hash_ = hashlib.sha1()
+        for string in (lilypond_version, flags or '', extension or ''):
+            hash_.update(string.encode('utf-8'))
+            hash_.update(b'\0')
+        with open(ly_file_path, 'rb') as file_pointer:
+            contents = file_pointer.read()
+        contents = self._date_time_comment_regex.sub(b'', contents, count=1)
+        hash_.update(contents)
+        return hash_.hexdigest()
+
+    def put(self, key, base, output_file_paths):
+        r'''Caches `output_file_paths` under `key`.
+
+        Each of `output_file_paths` must start with `base`.
+
+        Evicts least recently used entries when render cache exceeds maximum
+        size.
+
+        Returns none.
+        '''
+        output_file_paths = tuple(output_file_paths)
+        assert all(_.startswith(base) for _ in output_file_paths)
+        if not output_file_paths:
+            return
+        entry_path = self._get_entry_path(key)
+        if os.path.isdir(entry_path):
+            os.utime(entry_path, None)
+            return
+        prefix_path = os.path.dirname(entry_path)
+        if not os.path.isdir(prefix_path):
+            try:
+                os.makedirs(prefix_path)
+            except OSError:
+                pass
+        temporary_path = tempfile.mkdtemp(prefix='.', dir=prefix_path)
+        try:
+            for output_file_path in output_file_paths:
+                suffix = output_file_path[len(base):]
+                file_name = self._output_file_name + suffix
+                shutil.copyfile(
+                    output_file_path,
+                    os.path.join(temporary_path, file_name),
+                    )
+            os.rename(temporary_path, entry_path)
+        except (IOError, OSError):
+            shutil.rmtree(temporary_path, ignore_errors=True)
+            return
+        self._evict()
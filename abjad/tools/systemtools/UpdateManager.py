@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import bisect
 from abjad.tools.abctools import AbjadObject
 
 
@@ -17,11 +18,46 @@ class UpdateManager(AbjadObject):
 
     ### PRIVATE METHODS ###
 
+    @staticmethod
+    def _get_offset_in_seconds(tempo_map, offset):
+        r'''Gets `offset` in seconds from `tempo_map`.
+
+        Bisects breakpoints and interpolates linearly from breakpoint
+        preceding `offset`. Memoizes result in `tempo_map`.
+
+        Returns duration or none.
+        '''
+        from abjad.tools import durationtools
+        offsets, offsets_in_seconds, marks, memo = tempo_map
+        try:
+            return memo[offset]
+        except KeyError:
+            pass
+        index = bisect.bisect(offsets, offset) - 1
+        if index < 0 or offsets_in_seconds[index] is None:
+            result = None
+        elif marks[index].is_imprecise:
+            result = None
+        elif offset == offsets[index]:
+            result = offsets_in_seconds[index]
+        else:
+            mark = marks[index]
+            duration = (
+                (offset - offsets[index]) /
+                mark.reference_duration /
+                mark.units_per_minute * 60
+                )
+            result = offsets_in_seconds[index] + \
+                durationtools.Duration(duration)
+        memo[offset] = result
+        return result
+
     @staticmethod
     def _get_score_tree_state_flags(parentage):
         offsets_are_current = True
         indicators_are_current = True
         offsets_in_seconds_are_current = True
+        measure_numbers_are_current = True
         for component in parentage:
             if offsets_are_current:
                 if not component._offsets_are_current:
@@ -32,22 +68,84 @@ class UpdateManager(AbjadObject):
             if offsets_in_seconds_are_current:
                 if not component._offsets_in_seconds_are_current:
                     offsets_in_seconds_are_current = False
+            if measure_numbers_are_current:
+                if not component._measure_numbers_are_current:
+                    measure_numbers_are_current = False
         return (
             offsets_are_current,
             indicators_are_current,
             offsets_in_seconds_are_current,
+            measure_numbers_are_current,
             )
 
-    @staticmethod
-    def _iterate_entire_score(score_root):
-        from abjad.tools.topleveltools import iterate
-        components = iterate(score_root).depth_first(
-            capped=True,
-            unique=True,
-            forbid=None,
-            direction=Left,
+    @classmethod
+    def _get_tempo_map(class_, contexts, tempo_maps, previous_tempo_maps):
+        r'''Gets tempo map compiled from metronome marks effective in
+        `contexts`.
+
+        Tempo map is a quadruple of sorted breakpoint offsets, breakpoint
+        offsets in seconds, metronome marks and offset-in-seconds memo.
+        Wrappers of contexts closer to leaves win at equal offsets.
+
+        Reuses tempo map of `previous_tempo_maps` while indicator indices of
+        `contexts` are unchanged.
+
+        Returns tempo map.
+        '''
+        from abjad.tools import durationtools
+        key = tuple(_[0] for _ in contexts)
+        if key in tempo_maps:
+            return tempo_maps[key][1]
+        indices = tuple(_[1] for _ in contexts)
+        if key in previous_tempo_maps:
+            indices_, tempo_map = previous_tempo_maps[key]
+            if all(x is y for x, y in zip(indices, indices_)):
+                tempo_maps[key] = indices, tempo_map
+                return tempo_map
+        wrappers_by_offset = {}
+        for offsets, wrappers_by_offset_ in indices:
+            wrappers_by_offset.update(wrappers_by_offset_)
+        offsets = tuple(sorted(wrappers_by_offset))
+        marks = tuple(wrappers_by_offset[_].indicator for _ in offsets)
+        offsets_in_seconds = []
+        offset_in_seconds = None
+        if offsets and offsets[0] == 0:
+            offset_in_seconds = durationtools.Offset(0)
+        for i, offset in enumerate(offsets):
+            if 0 < i and offset_in_seconds is not None:
+                mark = marks[i - 1]
+                if mark.is_imprecise:
+                    offset_in_seconds = None
+                else:
+                    duration = (
+                        (offset - offsets[i - 1]) /
+                        mark.reference_duration /
+                        mark.units_per_minute * 60
+                        )
+                    offset_in_seconds += durationtools.Duration(duration)
+            offsets_in_seconds.append(offset_in_seconds)
+        tempo_map = offsets, tuple(offsets_in_seconds), marks, {}
+        tempo_maps[key] = indices, tempo_map
+        return tempo_map
+
+    @classmethod
+    def _iterate_entire_score(class_, score_root):
+        r'''Iterates `score_root`, descendants and grace containers.
+
+        Yields components in the same order as depth-first iteration.
+        '''
+        yield score_root
+        for child in getattr(score_root, '_music', ()):
+            for component in class_._iterate_entire_score(child):
+                yield component
+        grace_containers = (
+            getattr(score_root, '_grace_container', None),
+            getattr(score_root, '_after_grace_container', None),
             )
-        return components
+        for grace_container in grace_containers:
+            if grace_container is not None:
+                for component in class_._iterate_entire_score(grace_container):
+                    yield component
 
     def _update_all_indicators(self, score_root):
         r'''Updating indicators does not update offsets.
@@ -63,10 +161,9 @@ class UpdateManager(AbjadObject):
                     indicator._update_effective_context()
             component._indicators_are_current = True
 
-    @staticmethod
-    def _update_all_leaf_indices_and_measure_numbers(score_root):
-        r'''Call only when updating offsets.
-        No separate state flags exist for leaf indices or measure numbers.
+    @classmethod
+    def _update_all_leaf_indices_and_measure_numbers(class_, score_root):
+        r'''Leaf indices and measure numbers share a single state flag.
         '''
         from abjad.tools import scoretools
         from abjad.tools.topleveltools import iterate
@@ -86,19 +183,45 @@ class UpdateManager(AbjadObject):
                 iterate(score_root).by_class(scoretools.Measure)):
                 measure_number = measure_index + 1
                 measure._measure_number = measure_number
+        for component in class_._iterate_entire_score(score_root):
+            component._measure_numbers_are_current = True
 
     def _update_all_offsets(self, score_root):
         r'''Updating offsets does not update indicators.
         Updating offsets does not update offsets in seconds.
+
+        Recomputes only stale components. Current components are skipped
+        when their start offset is unchanged and shifted otherwise.
         '''
-        for component in self._iterate_entire_score(score_root):
-            self._update_component_offsets(component)
-            component._offsets_are_current = True
+        from abjad.tools import durationtools
+        self._update_subtree_offsets(
+            score_root,
+            durationtools.Offset(0),
+            durationtools.Multiplier(1),
+            )
 
     def _update_all_offsets_in_seconds(self, score_root):
+        r'''Updating offsets in seconds first updates offsets and, when
+        necessary, indicators.
+
+        Looks up leaf offsets in seconds in tempo maps cached on score root
+        instead of getting the effective metronome mark of every leaf.
+        '''
+        self._update_all_offsets(score_root)
         for component in self._iterate_entire_score(score_root):
-            self._update_component_offsets_in_seconds(component)
-            component._offsets_in_seconds_are_current = True
+            if not component._indicators_are_current:
+                self._update_all_indicators(score_root)
+                break
+        previous_tempo_maps = score_root._tempo_map_cache or {}
+        tempo_maps = {}
+        self._update_subtree_offsets_in_seconds(
+            score_root,
+            (),
+            None,
+            tempo_maps,
+            previous_tempo_maps,
+            )
+        score_root._tempo_map_cache = tempo_maps
 
     @classmethod
     def _update_component_offsets(class_, component):
@@ -116,11 +239,168 @@ class UpdateManager(AbjadObject):
             else:
                 start_offset = abjad.Offset(0)
             stop_offset = start_offset + component._get_duration()
+        component._effective_indicator_index = None
         component._start_offset = start_offset
         component._stop_offset = stop_offset
         component._timespan._start_offset = start_offset
         component._timespan._stop_offset = stop_offset
 
+    @classmethod
+    def _update_grace_container_offsets(class_, leaf):
+        r'''Grace notes take offsets from their carrier leaf.
+        '''
+        grace_containers = (
+            leaf._grace_container,
+            leaf._after_grace_container,
+            )
+        for grace_container in grace_containers:
+            if grace_container is None:
+                continue
+            for component in class_._iterate_entire_score(grace_container):
+                class_._update_component_offsets(component)
+                component._offsets_are_current = True
+
+    @classmethod
+    def _shift_subtree_offsets(class_, component, duration):
+        r'''Shifts current offsets of `component` and its descendants.
+        '''
+        component._effective_indicator_index = None
+        component._start_offset += duration
+        component._stop_offset += duration
+        component._timespan._start_offset = component._start_offset
+        component._timespan._stop_offset = component._stop_offset
+        for child in getattr(component, '_music', ()):
+            class_._shift_subtree_offsets(child, duration)
+        if hasattr(component, '_grace_container'):
+            class_._update_grace_container_offsets(component)
+
+    @classmethod
+    def _update_subtree_offsets(
+        class_,
+        component,
+        start_offset,
+        prolation,
+        force=False,
+        ):
+        r'''Updates offsets of `component` and its descendants.
+
+        Returns stop offset of `component`.
+        '''
+        if component._offsets_are_current and not force:
+            if component._start_offset != start_offset:
+                duration = start_offset - component._start_offset
+                class_._shift_subtree_offsets(component, duration)
+            return component._stop_offset
+        if hasattr(component, '_music'):
+            # prolating containers may rescale children that are current
+            if hasattr(component, 'implied_prolation'):
+                prolation *= component.implied_prolation
+                force = True
+            stop_offset = start_offset
+            if component.is_simultaneous:
+                for child in component:
+                    stop_offset_ = class_._update_subtree_offsets(
+                        child,
+                        start_offset,
+                        prolation,
+                        force=force,
+                        )
+                    stop_offset = max(stop_offset, stop_offset_)
+            else:
+                for child in component:
+                    stop_offset = class_._update_subtree_offsets(
+                        child,
+                        stop_offset,
+                        prolation,
+                        force=force,
+                        )
+        else:
+            duration = prolation * component._get_preprolated_duration()
+            stop_offset = start_offset + duration
+        component._effective_indicator_index = None
+        component._start_offset = start_offset
+        component._stop_offset = stop_offset
+        component._timespan._start_offset = start_offset
+        component._timespan._stop_offset = stop_offset
+        component._offsets_are_current = True
+        if hasattr(component, '_grace_container'):
+            class_._update_grace_container_offsets(component)
+        return stop_offset
+
+    @classmethod
+    def _update_subtree_offsets_in_seconds(
+        class_,
+        component,
+        contexts,
+        tempo_map,
+        tempo_maps,
+        previous_tempo_maps,
+        ):
+        r'''Updates offsets in seconds of `component` and descendants.
+
+        Leaves look up their offsets in `tempo_map`, compiled from
+        metronome marks effective in `contexts`. Containers span their
+        children.
+
+        Returns pair of start offset in seconds and stop offset in seconds.
+        Both are none when an earlier component lacks a metronome mark.
+        '''
+        from abjad.tools import indicatortools
+        component._offsets_in_seconds_are_current = True
+        index = component._get_effective_indicator_index(
+            indicatortools.MetronomeMark)
+        if index[0] or tempo_map is None:
+            if index[0]:
+                contexts = contexts + ((component, index),)
+            tempo_map = class_._get_tempo_map(
+                contexts,
+                tempo_maps,
+                previous_tempo_maps,
+                )
+        start_offset, stop_offset = None, None
+        if getattr(component, '_music', None):
+            pairs = [
+                class_._update_subtree_offsets_in_seconds(
+                    child,
+                    contexts,
+                    tempo_map,
+                    tempo_maps,
+                    previous_tempo_maps,
+                    )
+                for child in component
+                ]
+            if not any(None in _ for _ in pairs):
+                start_offset = min(_[0] for _ in pairs)
+                if component.is_simultaneous:
+                    stop_offset = max(_[1] for _ in pairs)
+                else:
+                    stop_offset = pairs[-1][1]
+        else:
+            start_offset = class_._get_offset_in_seconds(
+                tempo_map,
+                component._start_offset,
+                )
+            stop_offset = class_._get_offset_in_seconds(
+                tempo_map,
+                component._stop_offset,
+                )
+            grace_containers = (
+                getattr(component, '_grace_container', None),
+                getattr(component, '_after_grace_container', None),
+                )
+            for grace_container in grace_containers:
+                if grace_container is None:
+                    continue
+                components = class_._iterate_entire_score(grace_container)
+                for component_ in components:
+                    component_._offsets_in_seconds_are_current = True
+                    class_._update_component_offsets_in_seconds(component_)
+        if start_offset is None or stop_offset is None:
+            start_offset, stop_offset = None, None
+        component._start_offset_in_seconds = start_offset
+        component._stop_offset_in_seconds = stop_offset
+        return start_offset, stop_offset
+
     @staticmethod
     def _update_component_offsets_in_seconds(component):
         from abjad.tools import durationtools
@@ -148,8 +428,9 @@ class UpdateManager(AbjadObject):
         offsets=False,
         offsets_in_seconds=False,
         indicators=False,
+        measure_numbers=False,
         ):
-        assert offsets or offsets_in_seconds or indicators
+        assert offsets or offsets_in_seconds or indicators or measure_numbers
         if component._is_forbidden_to_update:
             return
         parentage = component._get_parentage(
@@ -163,15 +444,16 @@ class UpdateManager(AbjadObject):
             offsets_are_current,
             indicators_are_current,
             offsets_in_seconds_are_current,
+            measure_numbers_are_current,
             ) = self._get_score_tree_state_flags(parentage)
         score_root = parentage.root
         if offsets and not offsets_are_current:
             self._update_all_offsets(score_root)
+        if measure_numbers and not measure_numbers_are_current:
             self._update_all_leaf_indices_and_measure_numbers(score_root)
-        if offsets_in_seconds and not offsets_in_seconds_are_current:
-            self._update_all_offsets_in_seconds(score_root)
         if indicators and not indicators_are_current:
             self._update_all_indicators(score_root)
+        if offsets_in_seconds and not offsets_in_seconds_are_current:
             self._update_all_offsets_in_seconds(score_root)
 
     ### EXPERIMENTAL ###
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import bisect
+import collections
+import multiprocessing
 from abjad.tools.abctools import AbjadObject
 
 
@@ -16,6 +19,24 @@ class WellformednessManager(AbjadObject):
             >>> abjad.WellformednessManager()
             WellformednessManager()
 
+    ..  container:: example
+
+        Splits checks of single components across staves in worker
+        processes:
+
+        ::
+
+            >>> staff_group = abjad.StaffGroup([
+            ...     abjad.Staff("c'4 d'4 e'4 f'4"),
+            ...     abjad.Staff("c'4 [ d'4 e'4 f'4 ]"),
+            ...     ])
+            >>> manager = abjad.WellformednessManager(processes=2)
+            >>> for violators, total, check_name in manager(staff_group):
+            ...     if violators:
+            ...         check_name, violators
+            ...
+            ('check_beamed_quarter_notes', [Note("c'4"), Note("d'4"), Note("e'4"), Note("f'4")])
+
     '''
 
     ### CLASS VARIABLES ###
@@ -24,17 +45,41 @@ class WellformednessManager(AbjadObject):
 
     __slots__ = (
         '_allow_percussion_clef',
+        '_processes',
+        )
+
+    _effective_instrument_check_names = (
+        'check_notes_on_wrong_clef',
+        'check_out_of_range_notes',
         )
 
     _publish_storage_format = True
 
+    _staff_local_check_names = (
+        'check_beamed_quarter_notes',
+        'check_conflicting_clefs',
+        'check_empty_containers',
+        'check_misdurated_measures',
+        'check_misfilled_measures',
+        'check_misrepresented_flags',
+        'check_nested_measures',
+        'check_notes_on_wrong_clef',
+        'check_out_of_range_notes',
+        'check_tied_rests',
+        )
+
     ### INITIALIZER ###
 
     def __init__(
         self,
         allow_percussion_clef=None,
+        processes=None,
         ):
         self._allow_percussion_clef = allow_percussion_clef
+        if processes is not None:
+            processes = int(processes)
+            assert 0 < processes, repr(processes)
+        self._processes = processes
 
     ### SPECIAL METHODS ###
 
@@ -46,14 +91,706 @@ class WellformednessManager(AbjadObject):
         if argument is None:
             return
         check_names = [x for x in dir(self) if x.startswith('check_')]
+        check_names.sort()
+        results = self._run_checks(
+            argument,
+            check_names,
+            processes=self.processes,
+            )
         triples = []
-        for current_check_name in sorted(check_names):
-            current_check = getattr(self, current_check_name)
-            current_violators, current_total = current_check(argument=argument)
-            triple = (current_violators, current_total, current_check_name)
+        for check_name, (violators, total) in zip(check_names, results):
+            triple = (violators, total, check_name)
             triples.append(triple)
         return triples
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _check_dumped_component(manager, string, check_names):
+        from abjad.tools import systemtools
+        from abjad.tools.topleveltools import iterate
+        component = systemtools.LilyPondFormatManager._load_component(string)
+        results = manager._run_checks(component, check_names)
+        indices = {}
+        for index, component_ in enumerate(iterate(component).by_class()):
+            indices[id(component_)] = index
+        return [
+            ([indices[id(_)] for _ in violators], total)
+            for violators, total in results
+            ]
+
+    @staticmethod
+    def _filter_spanners(spanners, prototype):
+        result = set()
+        for spanner in spanners:
+            if isinstance(spanner, prototype):
+                result.add(spanner)
+        return result
+
+    @staticmethod
+    def _get_effective(parentage, prototype):
+        start_offset = parentage[0]._start_offset
+        wrapper, wrapper_offset = None, None
+        for component in parentage:
+            offsets, wrappers_by_offset = \
+                component._get_effective_indicator_index(prototype)
+            if not offsets:
+                continue
+            index = bisect.bisect(offsets, start_offset) - 1
+            if index < 0:
+                continue
+            offset = offsets[index]
+            if wrapper is None or wrapper_offset < offset:
+                wrapper = wrappers_by_offset[offset]
+                wrapper_offset = offset
+        if wrapper is None:
+            return
+        return wrapper.indicator
+
+    @staticmethod
+    def _is_checkable_alone(component):
+        r'''Is true when `component` checks the same without parentage.
+
+        Component must format the same without parentage. No instrument may
+        be scoped to parentage because checks of clefs and pitch ranges get
+        effective instruments.
+        '''
+        import abjad
+        manager = abjad.LilyPondFormatManager
+        if not manager._is_formattable_alone(component):
+            return False
+        for parent in component._get_parentage(include_self=False):
+            for wrapper in parent._dependent_wrappers:
+                if isinstance(wrapper.indicator, abjad.Instrument):
+                    return False
+        return True
+
+    def _run_checks(self, argument, check_names, processes=None):
+        import abjad
+        from abjad.tools import systemtools
+        results, visitors = {}, []
+        for check_name in check_names:
+            visitor_name = '_visit_' + check_name[len('check_'):]
+            method = getattr(type(self), check_name)
+            if (method is getattr(WellformednessManager, check_name, None) and
+                hasattr(self, visitor_name)):
+                visitor = getattr(self, visitor_name)()
+                next(visitor)
+                visitors.append((check_name, visitor))
+            else:
+                results[check_name] = getattr(self, check_name)(
+                    argument=argument)
+        if isinstance(argument, abjad.Component):
+            roots = [argument]
+        else:
+            roots = [_ for _ in argument if isinstance(_, abjad.Component)]
+        for root in roots:
+            root._update_now(offsets=True, indicators=True)
+        local_check_names = [
+            _ for _, visitor in visitors
+            if _ in self._staff_local_check_names
+            ]
+        pool, pending_results, components = None, {}, None
+        if (processes is not None and
+            1 < processes and
+            local_check_names and
+            isinstance(argument, abjad.Component)):
+            manager = systemtools.LilyPondFormatManager
+            roots, contexts = manager._get_parallel_format_components(
+                argument)
+            contexts = [_ for _ in contexts if self._is_checkable_alone(_)]
+            if 1 < len(contexts):
+                pool = multiprocessing.Pool(processes)
+                for context in contexts:
+                    pending_results[id(context)] = pool.apply_async(
+                        self._check_dumped_component,
+                        (
+                            self,
+                            manager._dump_component(context),
+                            local_check_names,
+                            ),
+                        )
+                components = []
+        needs_instrument = any(
+            _ in self._effective_instrument_check_names
+            for _, visitor in visitors
+            )
+        start_indices = {}
+        try:
+            stack = []
+            for root in reversed(roots):
+                parentage = root._get_parentage(
+                    include_self=True,
+                    with_grace_notes=True,
+                    )
+                stack.append((root, tuple(parentage), False))
+            while stack:
+                component, parentage, in_worker = stack.pop()
+                if components is not None:
+                    if id(component) in pending_results:
+                        start_indices[id(component)] = len(components)
+                        in_worker = True
+                    components.append(component)
+                spanners = set(component._spanners)
+                instrument = None
+                if (needs_instrument and
+                    not in_worker and
+                    isinstance(component, abjad.Leaf)):
+                    instrument = self._get_effective(
+                        parentage,
+                        abjad.Instrument,
+                        )
+                node = (component, parentage, spanners, instrument)
+                for check_name, visitor in visitors:
+                    if in_worker and check_name in local_check_names:
+                        continue
+                    visitor.send(node)
+                if isinstance(component, abjad.Container):
+                    for child in reversed(component._music):
+                        stack.append((child, (child,) + parentage, in_worker))
+            for check_name, visitor in visitors:
+                results[check_name] = visitor.send(None)
+            if pool is not None:
+                worker_results = []
+                for id_, pending_result in pending_results.items():
+                    pair = (start_indices[id_], pending_result.get())
+                    worker_results.append(pair)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        if pool is not None:
+            indices = dict((id(_), i) for i, _ in enumerate(components))
+            for i, check_name in enumerate(local_check_names):
+                violators, total = results[check_name]
+                violator_indices = [indices[id(_)] for _ in violators]
+                for start_index, worker_result in worker_results:
+                    worker_indices, worker_total = worker_result[i]
+                    violator_indices.extend(
+                        start_index + _ for _ in worker_indices)
+                    total += worker_total
+                violator_indices.sort()
+                violators = [components[_] for _ in violator_indices]
+                results[check_name] = (violators, total)
+        return [results[_] for _ in check_names]
+
+    def _visit_beamed_quarter_notes(self):
+        import abjad
+        violators = []
+        total = 0
+        smart_beams = (
+            abjad.DuratedComplexBeam,
+            abjad.MultipartBeam,
+            )
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            total += 1
+            for component in parentage:
+                beams = [
+                    _ for _ in component._spanners
+                    if isinstance(_, abjad.Beam) and
+                    not isinstance(_, smart_beams)
+                    ]
+                if beams:
+                    flag_count = leaf.written_duration.flag_count
+                    if flag_count < 1:
+                        violators.append(leaf)
+                    break
+        yield violators, total
+
+    def _visit_conflicting_clefs(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            container = node[0]
+            if not isinstance(container, abjad.Container):
+                continue
+            total += 1
+            if not abjad.inspect(container).has_indicator(abjad.Clef):
+                continue
+            current_component = container
+            while (isinstance(current_component, abjad.Container) and
+                0 < len(current_component)):
+                first_child = current_component[0]
+                if abjad.inspect(first_child).has_indicator(abjad.Clef):
+                    violators.append(container)
+                    break
+                current_component = first_child
+        yield violators, total
+
+    def _visit_discontiguous_spanners(self):
+        import abjad
+        violators = []
+        total = 0
+        all_spanners = set()
+        while True:
+            node = yield
+            if node is None:
+                break
+            spanners = self._filter_spanners(node[2], abjad.Spanner)
+            all_spanners.update(spanners)
+        for spanner in all_spanners:
+            if spanner._contiguity_constraint == 'logical voice':
+                if not abjad.Selection._all_in_same_logical_voice(
+                    spanner[:],
+                    contiguous=True,
+                    ):
+                    violators.append(spanner)
+            total += 1
+        yield violators, total
+
+    def _visit_duplicate_ids(self):
+        components = []
+        while True:
+            node = yield
+            if node is None:
+                break
+            components.append(node[0])
+        counts = collections.Counter(id(_) for _ in components)
+        violators = [_ for _ in components if 1 < counts[id(_)]]
+        yield violators, len(components)
+
+    def _visit_empty_containers(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            container = node[0]
+            if not isinstance(container, abjad.Container):
+                continue
+            total += 1
+            if len(container) == 0:
+                violators.append(container)
+        yield violators, total
+
+    def _visit_intermarked_hairpins(self):
+        import abjad
+        violators = []
+        total = 0
+        hairpins = set()
+        while True:
+            node = yield
+            if node is None:
+                break
+            hairpins.update(self._filter_spanners(node[2], abjad.Hairpin))
+        for hairpin in hairpins:
+            if 2 < len(hairpin._get_leaves()):
+                for leaf in hairpin._get_leaves()[1:-1]:
+                    if abjad.inspect(leaf).get_indicators(abjad.Dynamic):
+                        violators.append(hairpin)
+                        break
+            total += 1
+        yield violators, total
+
+    def _visit_misdurated_measures(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            measure = node[0]
+            if not isinstance(measure, abjad.Measure):
+                continue
+            time_signature = measure.time_signature
+            if time_signature is not None:
+                if measure._get_preprolated_duration() != \
+                    time_signature.duration:
+                    violators.append(measure)
+            total += 1
+        yield violators, total
+
+    def _visit_misfilled_measures(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            measure = node[0]
+            if not isinstance(measure, abjad.Measure):
+                continue
+            if measure.is_misfilled:
+                violators.append(measure)
+            total += 1
+        yield violators, total
+
+    def _visit_mismatched_enchained_hairpins(self):
+        import abjad
+        violators = []
+        all_hairpins = set()
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            hairpins = self._filter_spanners(spanners, abjad.Hairpin)
+            hairpins = list(hairpins)
+            all_hairpins.update(hairpins)
+            if len(hairpins) <= 1:
+                continue
+            if 2 < len(hairpins):
+                raise Exception('too many hairpins')
+            assert len(hairpins) == 2
+            hairpins_are_enchained = False
+            if (hairpins[0]._is_my_last_leaf(leaf) and
+                hairpins[-1]._is_my_first_leaf(leaf)):
+                hairpins_are_enchained = True
+            if (hairpins[-1]._is_my_last_leaf(leaf) and
+                hairpins[0]._is_my_first_leaf(leaf)):
+                hairpins_are_enchained = True
+            if not hairpins_are_enchained:
+                continue
+            if hairpins[0]._is_my_first_leaf(leaf):
+                first_hairpin = hairpins[-1]
+                second_hairpin = hairpins[0]
+            else:
+                first_hairpin = hairpins[0]
+                second_hairpin = hairpins[-1]
+            if first_hairpin.stop_dynamic == second_hairpin.start_dynamic:
+                continue
+            else:
+                violators.append(first_hairpin)
+                violators.append(second_hairpin)
+        total = len(all_hairpins)
+        yield violators, total
+
+    def _visit_mispitched_ties(self):
+        import abjad
+        violators = set()
+        all_spanners = set()
+        prototype = (abjad.Note, abjad.Chord)
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, prototype):
+                continue
+            spanners = self._filter_spanners(spanners, abjad.Tie)
+            if not spanners:
+                continue
+            all_spanners.update(spanners)
+            spanner = spanners.pop()
+            written_pitches = []
+            for leaf in spanner:
+                if isinstance(leaf, abjad.Note):
+                    written_pitches.append(leaf.written_pitch)
+                elif isinstance(leaf, abjad.Chord):
+                    written_pitches.append(leaf.written_pitches)
+                else:
+                    raise TypeError(leaf)
+            if not abjad.mathtools.all_are_equal(written_pitches):
+                violators.add(spanner)
+        violators = list(violators)
+        total = len(all_spanners)
+        yield violators, total
+
+    def _visit_misrepresented_flags(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf = node[0]
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            total += 1
+            flags = leaf.written_duration.flag_count
+            left = getattr(abjad.setting(leaf), 'stem_left_beam_count', None)
+            right = getattr(abjad.setting(leaf), 'stem_right_beam_count', None)
+            is_violator = False
+            if left is not None:
+                if (flags < left or
+                    (left < flags and right not in (flags, None))):
+                    is_violator = True
+            if right is not None:
+                if (flags < right or
+                    (right < flags and left not in (flags, None))):
+                    is_violator = True
+            if is_violator:
+                violators.append(leaf)
+        yield violators, total
+
+    def _visit_missing_parents(self):
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            component = node[0]
+            if 0 < total:
+                if component._parent is None:
+                    violators.append(component)
+            total += 1
+        yield violators, total
+
+    def _visit_nested_measures(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            measure, parentage = node[:2]
+            if not isinstance(measure, abjad.Measure):
+                continue
+            if any(isinstance(_, abjad.Measure) for _ in parentage[1:]):
+                violators.append(measure)
+            total += 1
+        yield violators, total
+
+    def _visit_notes_on_wrong_clef(self):
+        import abjad
+        violators = []
+        total = 0
+        clef_is_allowable = {}
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            total += 1
+            if instrument is None:
+                continue
+            clef = self._get_effective(parentage, abjad.Clef)
+            if clef is None:
+                continue
+            key = (id(instrument), id(clef))
+            if key not in clef_is_allowable:
+                allowable_clefs = list(instrument.allowable_clefs)
+                if self.allow_percussion_clef:
+                    allowable_clefs.append(abjad.Clef('percussion'))
+                clef_is_allowable[key] = clef in allowable_clefs
+            if not clef_is_allowable[key]:
+                violators.append(leaf)
+        yield violators, total
+
+    def _visit_out_of_range_notes(self):
+        import abjad
+        violators = []
+        total = 0
+        prototype = (abjad.Note, abjad.Chord)
+        middle_c = abjad.NamedPitch('C4')
+        pitch_is_in_range = {}
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, prototype):
+                continue
+            total += 1
+            if instrument is None:
+                continue
+            indicators = leaf._get_indicators(str)
+            if 'unpitched' in indicators:
+                continue
+            if isinstance(leaf, abjad.Note):
+                written_pitches = (leaf.written_pitch,)
+            else:
+                written_pitches = leaf.written_pitches
+            is_transposed = 'sounding pitch' not in indicators
+            for written_pitch in written_pitches:
+                key = (id(instrument), is_transposed, written_pitch)
+                if key not in pitch_is_in_range:
+                    pitch = written_pitch
+                    if is_transposed:
+                        sounding_pitch = \
+                            instrument.sounding_pitch_of_written_middle_c
+                        interval = middle_c - sounding_pitch
+                        pitch = interval.transpose(pitch)
+                    pitch_range = instrument.pitch_range
+                    pitch_is_in_range[key] = pitch_range._contains_pitch(pitch)
+                if not pitch_is_in_range[key]:
+                    violators.append(leaf)
+                    break
+        yield violators, total
+
+    def _visit_overlapping_beams(self):
+        import abjad
+        violators = []
+        all_beams = set()
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            beams = self._filter_spanners(spanners, abjad.Beam)
+            all_beams.update(beams)
+            if 1 < len(beams):
+                for beam in beams:
+                    if beam not in violators:
+                        violators.append(beam)
+        total = len(all_beams)
+        yield violators, total
+
+    def _visit_overlapping_glissandi(self):
+        import abjad
+        violators = []
+        all_spanners = set()
+        is_stopped = False
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if is_stopped or not isinstance(leaf, abjad.Leaf):
+                continue
+            glissandi = self._filter_spanners(spanners, abjad.Glissando)
+            glissandi = list(glissandi)
+            all_spanners.update(glissandi)
+            if 1 < len(glissandi):
+                if len(glissandi) == 2:
+                    common_leaves = set(glissandi[0]._get_leaves())
+                    common_leaves &= set(glissandi[1]._get_leaves())
+                    if len(common_leaves) == 1:
+                        x = list(common_leaves)[0]
+                        if (
+                            (glissandi[0]._is_my_first_leaf(x) and
+                            glissandi[1]._is_my_last_leaf(x))
+                            or
+                            (glissandi[1]._is_my_first_leaf(x) and
+                            glissandi[0]._is_my_last_leaf(x))
+                            ):
+                            is_stopped = True
+                            continue
+                for glissando in glissandi:
+                    if glissando not in violators:
+                        violators.append(glissando)
+        total = len(all_spanners)
+        yield violators, total
+
+    def _visit_overlapping_hairpins(self):
+        import abjad
+        violators = []
+        all_hairpins = set()
+        is_stopped = False
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if is_stopped or not isinstance(leaf, abjad.Leaf):
+                continue
+            hairpins = self._filter_spanners(spanners, abjad.Hairpin)
+            hairpins = list(hairpins)
+            all_hairpins.update(hairpins)
+            if 1 < len(hairpins):
+                if len(hairpins) == 2:
+                    common_leaves = set(hairpins[0]._get_leaves())
+                    common_leaves &= set(hairpins[1]._get_leaves())
+                    if len(common_leaves) == 1:
+                        x = list(common_leaves)[0]
+                        if (
+                            (hairpins[0]._is_my_first_leaf(x) and
+                            hairpins[1]._is_my_last_leaf(x))
+                            or
+                            (hairpins[1]._is_my_first_leaf(x) and
+                            hairpins[0]._is_my_last_leaf(x))
+                            ):
+                            is_stopped = True
+                            continue
+                for hairpin in hairpins:
+                    if hairpin not in violators:
+                        violators.append(hairpin)
+        total = len(all_hairpins)
+        yield violators, total
+
+    def _visit_overlapping_octavation_spanners(self):
+        import abjad
+        violators = []
+        all_spanners = set()
+        prototype = abjad.OctavationSpanner
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            spanners = self._filter_spanners(spanners, prototype)
+            all_spanners.update(spanners)
+            if 1 < len(spanners):
+                for spanner in spanners:
+                    if spanner not in violators:
+                        violators.append(spanner)
+        total = len(all_spanners)
+        yield violators, total
+
+    def _visit_overlapping_ties(self):
+        import abjad
+        total = set()
+        violators = set()
+        while True:
+            node = yield
+            if node is None:
+                break
+            leaf, parentage, spanners, instrument = node
+            if not isinstance(leaf, abjad.Leaf):
+                continue
+            spanners = self._filter_spanners(spanners, abjad.Tie)
+            total.update(spanners)
+            if 1 < len(spanners):
+                violators.update(spanners)
+        yield violators, len(total)
+
+    def _visit_short_hairpins(self):
+        import abjad
+        violators = []
+        total = 0
+        hairpins = set()
+        while True:
+            node = yield
+            if node is None:
+                break
+            hairpins.update(self._filter_spanners(node[2], abjad.Hairpin))
+        for hairpin in hairpins:
+            if len(hairpin._get_leaves()) <= 1:
+                violators.append(hairpin)
+            total += 1
+        yield violators, total
+
+    def _visit_tied_rests(self):
+        import abjad
+        violators = []
+        total = 0
+        while True:
+            node = yield
+            if node is None:
+                break
+            rest, parentage, spanners, instrument = node
+            if not isinstance(rest, abjad.Rest):
+                continue
+            if any(isinstance(_, abjad.Tie) for _ in spanners):
+                violators.append(rest)
+            total += 1
+        yield violators, total
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -64,6 +801,29 @@ class WellformednessManager(AbjadObject):
         '''
         return self._allow_percussion_clef
 
+    @property
+    def processes(self):
+        r'''Gets number of worker processes.
+
+        ..  container:: example
+
+            ::
+
+                >>> abjad.WellformednessManager(processes=4).processes
+                4
+
+        Defaults to none.
+
+        Set to positive integer or none.
+
+        Splits checks of single components across staves in worker
+        processes when greater than 1. Checks spanners and component
+        identity in the calling process.
+
+        Returns positive integer or none.
+        '''
+        return self._processes
+
     ### PUBLIC METHODS ###
 
     def check_beamed_quarter_notes(self, argument=None):
@@ -71,24 +831,7 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        smart_beams = (
-            abjad.DuratedComplexBeam,
-            abjad.MultipartBeam,
-            )
-        for leaf in abjad.iterate(argument).by_leaf():
-            total += 1
-            parentage = abjad.inspect(leaf).get_parentage(include_self=True)
-            beams = parentage._get_spanners(abjad.Beam)
-            for beam in beams:
-                if not isinstance(beam, smart_beams):
-                    flag_count = leaf.written_duration.flag_count
-                    if flag_count < 1:
-                        violators.append(leaf)
-                        break
-        return violators, total
+        return self._run_checks(argument, ['check_beamed_quarter_notes'])[0]
 
     def check_conflicting_clefs(self, argument=None):
         r'''Checks for conflicting clefs.
@@ -106,23 +849,7 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        containers = abjad.iterate(argument).by_class(abjad.Container)
-        total = 0
-        for container in containers:
-            total += 1
-            if not abjad.inspect(container).has_indicator(abjad.Clef):
-                continue
-            current_component = container
-            while (isinstance(current_component, abjad.Container) and
-                0 < len(current_component)):
-                first_child = current_component[0]
-                if abjad.inspect(first_child).has_indicator(abjad.Clef):
-                    violators.append(container)
-                    break
-                current_component = first_child
-        return violators, total
+        return self._run_checks(argument, ['check_conflicting_clefs'])[0]
 
     def check_discontiguous_spanners(self, argument=None):
         r'''Checks for discontiguous spanners.
@@ -134,50 +861,21 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        for spanner in argument._get_descendants()._get_spanners():
-            if spanner._contiguity_constraint == 'logical voice':
-                if not abjad.Selection._all_in_same_logical_voice(
-                    spanner[:],
-                    contiguous=True,
-                    ):
-                    violators.append(spanner)
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_discontiguous_spanners'])[0]
 
     def check_duplicate_ids(self, argument=None):
         r'''Checks to make sure there are no components with duplicated IDs.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        components = abjad.iterate(argument).by_class()
-        total_ids = [id(x) for x in components]
-        unique_ids = abjad.Sequence(total_ids).remove_repeats()
-        if len(unique_ids) < len(total_ids):
-            for current_id in unique_ids:
-                if 1 < total_ids.count(current_id):
-                    violators.extend([x for x in components
-                        if id(x) == current_id])
-        return violators, len(total_ids)
+        return self._run_checks(argument, ['check_duplicate_ids'])[0]
 
     def check_empty_containers(self, argument=None):
         r'''Checks to make sure there are no empty containers in score.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        bad, total = 0, 0
-        for container in abjad.iterate(argument).by_class(abjad.Container):
-            total += 1
-            if len(container) == 0:
-                violators.append(container)
-                bad += 1
-        return violators, total
+        return self._run_checks(argument, ['check_empty_containers'])[0]
 
     def check_intermarked_hairpins(self, argument=None):
         r'''Checks to make sure there are no hairpins in score with intervening
@@ -185,37 +883,14 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total, bad = 0, 0
-        hairpins = argument._get_descendants()._get_spanners(abjad.Hairpin)
-        for hairpin in hairpins:
-            if 2 < len(hairpin._get_leaves()):
-                for leaf in hairpin._get_leaves()[1:-1]:
-                    if abjad.inspect(leaf).get_indicators(abjad.Dynamic):
-                        violators.append(hairpin)
-                        bad += 1
-                        break
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_intermarked_hairpins'])[0]
 
     def check_misdurated_measures(self, argument=None):
         r'''Checks to make sure there are no misdurated measures in score.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total, bad = 0, 0
-        for measure in abjad.iterate(argument).by_class(abjad.Measure):
-            time_signature = measure.time_signature
-            if time_signature is not None:
-                if measure._get_preprolated_duration() != \
-                    time_signature.duration:
-                    violators.append(measure)
-                    bad += 1
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_misdurated_measures'])[0]
 
     def check_misfilled_measures(self, argument=None):
         r'''Checks that time signature duration equals measure contents
@@ -223,15 +898,7 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total, bad = 0, 0
-        for measure in abjad.iterate(argument).by_class(abjad.Measure):
-            if measure.is_misfilled:
-                violators.append(measure)
-                bad += 1
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_misfilled_measures'])[0]
 
     def check_mismatched_enchained_hairpins(self, argument=None):
         r'''Checks mismatched enchained hairpins.
@@ -277,40 +944,7 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        all_hairpins = set()
-        for leaf in abjad.iterate(argument).by_leaf():
-            hairpins = abjad.inspect(leaf).get_spanners(abjad.Hairpin)
-            hairpins = list(hairpins)
-            all_hairpins.update(hairpins)
-            if len(hairpins) <= 1:
-                continue
-            if 2 < len(hairpins):
-                raise Exception('too many hairpins')
-            assert len(hairpins) == 2
-            hairpins_are_enchained = False
-            if (hairpins[0]._is_my_last_leaf(leaf) and 
-                hairpins[-1]._is_my_first_leaf(leaf)):
-                hairpins_are_enchained = True
-            if (hairpins[-1]._is_my_last_leaf(leaf) and 
-                hairpins[0]._is_my_first_leaf(leaf)):
-                hairpins_are_enchained = True
-            if not hairpins_are_enchained:
-                continue
-            if hairpins[0]._is_my_first_leaf(leaf):
-                first_hairpin = hairpins[-1]
-                second_hairpin = hairpins[0]
-            else:
-                first_hairpin = hairpins[0]
-                second_hairpin = hairpins[-1]
-            if first_hairpin.stop_dynamic == second_hairpin.start_dynamic:
-                continue
-            else:
-                violators.append(first_hairpin)
-                violators.append(second_hairpin)
-        total = len(all_hairpins)
-        return violators, total
+        return self._run_checks(argument, ['check_mismatched_enchained_hairpins'])[0]
 
     def check_mispitched_ties(self, argument=None):
         r'''Checks for mispitched notes.
@@ -391,53 +1025,14 @@ class WellformednessManager(AbjadObject):
 
         Returns violator ties together with total number of ties.
         '''
-        import abjad
-        violators = set()
-        all_spanners = set()
-        for leaf in abjad.iterate(argument).by_leaf(pitched=True):
-            spanners = abjad.inspect(leaf).get_spanners(abjad.Tie)
-            if not spanners:
-                continue
-            all_spanners.update(spanners)
-            spanner = spanners.pop()
-            written_pitches = []
-            for leaf in spanner:
-                if isinstance(leaf, abjad.Note):
-                    written_pitches.append(leaf.written_pitch)
-                elif isinstance(leaf, abjad.Chord):
-                    written_pitches.append(leaf.written_pitches)
-                else:
-                    raise TypeError(leaf)
-            if not abjad.mathtools.all_are_equal(written_pitches):
-                violators.add(spanner)
-        violators = list(violators)
-        total = len(all_spanners)
-        return violators, total
+        return self._run_checks(argument, ['check_mispitched_ties'])[0]
 
     def check_misrepresented_flags(self, argument=None):
         r'''Checks to make sure there are no misrepresented flags in score.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        for leaf in abjad.iterate(argument).by_leaf():
-            total += 1
-            flags = leaf.written_duration.flag_count
-            left = getattr(abjad.setting(leaf), 'stem_left_beam_count', None)
-            right = getattr(abjad.setting(leaf), 'stem_right_beam_count', None)
-            if left is not None:
-                if (flags < left or
-                    (left < flags and right not in (flags, None))):
-                    if leaf not in violators:
-                        violators.append(leaf)
-            if right is not None:
-                if (flags < right or
-                    (right < flags and left not in (flags, None))):
-                    if leaf not in violators:
-                        violators.append(leaf)
-        return violators, total
+        return self._run_checks(argument, ['check_misrepresented_flags'])[0]
 
     def check_missing_parents(self, argument=None):
         r'''Checks to make sure there are no components in score with missing
@@ -445,31 +1040,14 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        components = abjad.iterate(argument).by_class()
-        for i, component in enumerate(components):
-            if 0 < i:
-                if component._parent is None:
-                    violators.append(component)
-        total = i + 1
-        return violators, total
+        return self._run_checks(argument, ['check_missing_parents'])[0]
 
     def check_nested_measures(self, argument=None):
         r'''Checks to make sure there are no nested measures in score.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        for measure in abjad.iterate(argument).by_class(abjad.Measure):
-            parentage = abjad.inspect(measure).get_parentage(include_self=False)
-            if parentage.get_first(abjad.Measure):
-                violators.append(measure)
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_nested_measures'])[0]
 
     def check_notes_on_wrong_clef(self, argument=None):
         r'''Checks notes and chords on wrong clef.
@@ -615,23 +1193,7 @@ class WellformednessManager(AbjadObject):
 
         Returns true or false.
         '''
-        import abjad
-        violators = []
-        total = 0
-        for leaf in abjad.iterate(argument).by_leaf():
-            total += 1
-            instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
-            if instrument is None:
-                continue
-            clef = abjad.inspect(leaf).get_effective(abjad.Clef)
-            if clef is None:
-                continue
-            allowable_clefs = list(instrument.allowable_clefs)
-            if self.allow_percussion_clef:
-                allowable_clefs.append(abjad.Clef('percussion'))
-            if clef not in allowable_clefs:
-                violators.append(leaf)
-        return violators, total
+        return self._run_checks(argument, ['check_notes_on_wrong_clef'])[0]
 
     def check_out_of_range_notes(self, argument=None):
         r'''Checks to make sure notes and chords are within traditional
@@ -689,68 +1251,21 @@ class WellformednessManager(AbjadObject):
 
         Returns true or false.
         '''
-        import abjad
-        violators = []
-        all_pitched_leaves = []
-        for leaf in abjad.iterate(argument).by_leaf(pitched=True):
-            all_pitched_leaves.append(leaf)
-            instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
-            if instrument is None:
-                continue
-            if leaf not in instrument.pitch_range:
-                violators.append(leaf)
-        total = len(all_pitched_leaves)
-        return violators, total
+        return self._run_checks(argument, ['check_out_of_range_notes'])[0]
 
     def check_overlapping_beams(self, argument=None):
         r'''Checks to make sure there are no overlapping beams in score.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        all_beams = set()
-        for leaf in abjad.iterate(argument).by_leaf():
-            beams = abjad.inspect(leaf).get_spanners(abjad.Beam)
-            all_beams.update(beams)
-            if 1 < len(beams):
-                for beam in beams:
-                    if beam not in violators:
-                        violators.append(beam)
-        total = len(all_beams)
-        return violators, total
+        return self._run_checks(argument, ['check_overlapping_beams'])[0]
 
     def check_overlapping_glissandi(self, argument=None):
         r'''Checks to make sure there are no overlapping glissandi in score.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        all_spanners = set()
-        for leaf in abjad.iterate(argument).by_leaf():
-            glissandi = abjad.inspect(leaf).get_spanners(abjad.Glissando)
-            glissandi = list(glissandi)
-            all_spanners.update(glissandi)
-            if 1 < len(glissandi):
-                if len(glissandi) == 2:
-                    common_leaves = set(glissandi[0]._get_leaves())
-                    common_leaves &= set(glissandi[1]._get_leaves())
-                    if len(common_leaves) == 1:
-                        x = list(common_leaves)[0]
-                        if (
-                            (glissandi[0]._is_my_first_leaf(x) and
-                            glissandi[1]._is_my_last_leaf(x))
-                            or
-                            (glissandi[1]._is_my_first_leaf(x) and
-                            glissandi[0]._is_my_last_leaf(x))
-                            ):
-                            break
-                for glissando in glissandi:
-                    if glissando not in violators:
-                        violators.append(glissando)
-        total = len(all_spanners)
-        return violators, total
+        return self._run_checks(argument, ['check_overlapping_glissandi'])[0]
 
     def check_overlapping_hairpins(self, argument=None):
         r'''Checks to make sure there are no overlapping hairpins in score.
@@ -796,32 +1311,7 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        all_hairpins = set()
-        for leaf in abjad.iterate(argument).by_leaf():
-            hairpins = abjad.inspect(leaf).get_spanners(abjad.Hairpin)
-            hairpins = list(hairpins)
-            all_hairpins.update(hairpins)
-            if 1 < len(hairpins):
-                if len(hairpins) == 2:
-                    common_leaves = set(hairpins[0]._get_leaves())
-                    common_leaves &= set(hairpins[1]._get_leaves())
-                    if len(common_leaves) == 1:
-                        x = list(common_leaves)[0]
-                        if (
-                            (hairpins[0]._is_my_first_leaf(x) and
-                            hairpins[1]._is_my_last_leaf(x))
-                            or
-                            (hairpins[1]._is_my_first_leaf(x) and
-                            hairpins[0]._is_my_last_leaf(x))
-                            ):
-                            break
-                for hairpin in hairpins:
-                    if hairpin not in violators:
-                        violators.append(hairpin)
-        total = len(all_hairpins)
-        return violators, total
+        return self._run_checks(argument, ['check_overlapping_hairpins'])[0]
 
     def check_overlapping_octavation_spanners(self, argument=None):
         r'''Checks to make sure there are no overlapping octavation spanners in
@@ -829,19 +1319,7 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        all_spanners = set()
-        prototype = abjad.OctavationSpanner
-        for leaf in abjad.iterate(argument).by_leaf():
-            spanners = abjad.inspect(leaf).get_spanners(prototype)
-            all_spanners.update(spanners)
-            if 1 < len(spanners):
-                for spanner in spanners:
-                    if spanner not in violators:
-                        violators.append(spanner)
-        total = len(all_spanners)
-        return violators, total
+        return self._run_checks(argument, ['check_overlapping_octavation_spanners'])[0]
 
     def check_overlapping_ties(self, argument=None):
         r'''Checks to make sure there are no overlapping ties in score.
@@ -887,41 +1365,18 @@ class WellformednessManager(AbjadObject):
 
         Returns violators and count of total ties.
         '''
-        import abjad
-        total = set()
-        violators = set()
-        for leaf in abjad.iterate(argument).by_leaf():
-            spanners = leaf._get_spanners(abjad.Tie)
-            total.update(spanners)
-            if 1 < len(spanners):
-                violators.update(spanners)
-        return violators, len(total)
+        return self._run_checks(argument, ['check_overlapping_ties'])[0]
 
     def check_short_hairpins(self, argument=None):
         r'''Checks to make sure that hairpins span at least two leaves.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        hairpins = argument._get_descendants()._get_spanners(abjad.Hairpin)
-        for hairpin in hairpins:
-            if len(hairpin._get_leaves()) <= 1:
-                violators.append(hairpin)
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_short_hairpins'])[0]
 
     def check_tied_rests(self, argument=None):
         r'''Checks to make sure there are no tied rests.
 
         Returns violators and total.
         '''
-        import abjad
-        violators = []
-        total = 0
-        for rest in abjad.iterate(argument).by_leaf(abjad.Rest):
-            if abjad.inspect(rest).has_spanner(abjad.Tie):
-                violators.append(rest)
-            total += 1
-        return violators, total
+        return self._run_checks(argument, ['check_tied_rests'])[0]
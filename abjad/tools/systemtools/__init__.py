@@ -1,28 +1,12 @@
 # -*- coding: utf-8 -*-
-from .AbjadConfiguration import AbjadConfiguration
-from .BenchmarkScoreMaker import BenchmarkScoreMaker
-from .Configuration import Configuration
-from .FilesystemState import FilesystemState
-from .ForbidUpdate import ForbidUpdate
-from .FormatSpecification import FormatSpecification
-from .IOManager import IOManager
 from .ImportManager import ImportManager
-from .IndicatorWrapper import IndicatorWrapper
-from .LilyPondFormatBundle import LilyPondFormatBundle
-from .LilyPondFormatManager import LilyPondFormatManager
-from .NullContextManager import NullContextManager
-from .ProgressIndicator import ProgressIndicator
-from .RedirectedStreams import RedirectedStreams
-from .Signature import Signature
-from .SlotContributions import SlotContributions
-from .StorageFormatAgent import StorageFormatAgent
-from .StorageFormatSpecification import StorageFormatSpecification
-from .TemporaryDirectory import TemporaryDirectory
-from .TemporaryDirectoryChange import TemporaryDirectoryChange
-from .TestManager import TestManager
-from .TestCase import TestCase
-from .Timer import Timer
-from .UpdateManager import UpdateManager
-from .WellformednessManager import WellformednessManager
+
+
+ImportManager.import_structured_package(
+    __path__[0],
+    globals(),
+    ignored_names=['run_abjad.py'],
+    lazy=True,
+    )
 
 _documentation_section = 'internals'
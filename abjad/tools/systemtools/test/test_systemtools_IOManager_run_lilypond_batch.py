@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import abjad
+import os
+import stat
+import sys
+configuration = abjad.AbjadConfiguration()
+directory = os.path.join(
+    configuration.abjad_directory,
+    'test_run_lilypond_batch',
+    )
+fake_lilypond_path = os.path.join(directory, 'lilypond')
+fake_lilypond = r'''#! {python}
+# -*- coding: utf-8 -*-
+import sys
+import time
+base, ly_path = sys.argv[-2], sys.argv[-1]
+with open(ly_path, 'r') as file_pointer:
+    contents = file_pointer.read()
+print('Processing `{{}}\'.'.format(ly_path))
+time.sleep(0.5)
+if 'error' in contents:
+    print('fatal error: failed files: {{}}'.format(ly_path))
+    sys.exit(1)
+with open(base + '.pdf', 'w') as file_pointer:
+    file_pointer.write(contents)
+print('Success: compilation successfully completed')
+'''.format(python=sys.executable)
+
+
+def _make_fake_lilypond():
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(fake_lilypond_path, 'w') as file_pointer:
+        file_pointer.write(fake_lilypond)
+    mode = os.stat(fake_lilypond_path).st_mode
+    os.chmod(fake_lilypond_path, mode | stat.S_IXUSR)
+
+
+def _make_ly_paths(count, contents='\\version "2.19.0"'):
+    ly_paths = []
+    for i in range(count):
+        ly_path = os.path.join(directory, 'part-{}.ly'.format(i))
+        with open(ly_path, 'w') as file_pointer:
+            file_pointer.write(contents)
+        ly_paths.append(ly_path)
+    return ly_paths
+
+
+def test_systemtools_IOManager_run_lilypond_batch_01():
+    r'''Renders LilyPond files concurrently and returns results in order.
+    '''
+
+    with abjad.FilesystemState(remove=[directory]):
+        _make_fake_lilypond()
+        ly_paths = _make_ly_paths(4)
+        results = abjad.IOManager.run_lilypond_batch(
+            ly_paths,
+            lilypond_path=fake_lilypond_path,
+            processes=4,
+            )
+        assert [_[0] for _ in results] == ly_paths
+        for ly_path, success, log, elapsed_time in results:
+            base = os.path.splitext(ly_path)[0]
+            assert success
+            assert 'Success' in log
+            assert 0.5 <= elapsed_time
+            assert os.path.isfile(base + '.pdf')
+            with open(base + '.log', 'r') as file_pointer:
+                assert file_pointer.read() == log
+
+
+def test_systemtools_IOManager_run_lilypond_batch_02():
+    r'''Reports failed jobs without stopping other jobs.
+    '''
+
+    with abjad.FilesystemState(remove=[directory]):
+        _make_fake_lilypond()
+        ly_paths = _make_ly_paths(3)
+        with open(ly_paths[1], 'w') as file_pointer:
+            file_pointer.write('error')
+        results = abjad.IOManager.run_lilypond_batch(
+            ly_paths,
+            lilypond_path=fake_lilypond_path,
+            processes=2,
+            )
+        assert [_[1] for _ in results] == [True, False, True]
+        assert 'fatal error' in results[1][2]
+        assert not os.path.exists(os.path.join(directory, 'part-1.pdf'))
+        assert os.path.exists(os.path.join(directory, 'part-2.pdf'))
+
+
+def test_systemtools_IOManager_run_lilypond_batch_03():
+    r'''Persists illustratable objects before rendering.
+    '''
+
+    notes = [abjad.Note(_, (1, 4)) for _ in range(3)]
+    with abjad.FilesystemState(remove=[directory]):
+        _make_fake_lilypond()
+        results = abjad.IOManager.run_lilypond_batch(
+            notes,
+            lilypond_path=fake_lilypond_path,
+            )
+        paths = []
+        for ly_path, success, log, elapsed_time in results:
+            base = os.path.splitext(ly_path)[0]
+            paths.extend([ly_path, base + '.log', base + '.pdf'])
+        try:
+            assert len(results) == 3
+            assert all(_[1] for _ in results)
+            for note, path in zip(notes, paths[2::3]):
+                with open(path, 'r') as file_pointer:
+                    assert format(note) in file_pointer.read()
+        finally:
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
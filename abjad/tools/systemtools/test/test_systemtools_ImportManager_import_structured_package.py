@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import abjad
+import importlib
+import os
+import platform
+import pytest
+import subprocess
+import sys
+from abjad.tools import systemtools
+
+
+requires_lazy_import = pytest.mark.skipif(
+    sys.version_info < (3, 5),
+    reason='Lazy import requires module class assignment.',
+    )
+
+
+def _run_python(code):
+    environment = os.environ.copy()
+    abjad_path = os.path.dirname(os.path.dirname(abjad.__file__))
+    python_path = environment.get('PYTHONPATH')
+    if python_path:
+        abjad_path = os.pathsep.join((abjad_path, python_path))
+    environment['PYTHONPATH'] = abjad_path
+    output = subprocess.check_output(
+        [sys.executable, '-c', code],
+        env=environment,
+        )
+    return output.decode('utf-8').strip()
+
+
+@requires_lazy_import
+def test_systemtools_ImportManager_import_structured_package_01():
+    r'''Importing Abjad defers import of tools package modules.
+    '''
+
+    code = '\n'.join((
+        'import sys',
+        'import abjad',
+        'names = (',
+        '    "abjad.ly",',
+        '    "abjad.tools.lilypondparsertools",',
+        '    "abjad.tools.scoretools.Note",',
+        '    "ply.yacc",',
+        '    )',
+        'print(any(_ in sys.modules for _ in names))',
+        'print(format(abjad.Note("c\'4")))',
+        'print("abjad.tools.scoretools.Note" in sys.modules)',
+        'print(abjad.scoretools.Note is abjad.Note)',
+        ))
+    assert _run_python(code).split() == ['False', "c'4", 'True', 'True']
+
+
+@requires_lazy_import
+def test_systemtools_ImportManager_import_structured_package_02():
+    r'''Lazy tools packages expose the same public names as eagerly imported
+    tools packages.
+    '''
+
+    tools_path = os.path.join(os.path.dirname(abjad.__file__), 'tools')
+    for name in sorted(os.listdir(tools_path)):
+        initializer_path = os.path.join(tools_path, name, '__init__.py')
+        if not os.path.exists(initializer_path):
+            continue
+        with open(initializer_path, 'r') as file_pointer:
+            if 'lazy=True' not in file_pointer.read():
+                continue
+        package = importlib.import_module('abjad.tools.' + name)
+        namespace = {}
+        systemtools.ImportManager.import_public_names_from_path_into_namespace(
+            os.path.join(tools_path, name),
+            namespace,
+            delete_systemtools=name != 'systemtools',
+            ignored_names=['run_abjad.py'],
+            )
+        eager_names = set(_ for _ in namespace if not _.startswith('_'))
+        lazy_names = set(package.__all__)
+        assert eager_names <= lazy_names, name
+        for public_name in eager_names:
+            value = namespace[public_name]
+            if isinstance(value, type):
+                assert getattr(package, public_name) is value
+
+
+@requires_lazy_import
+def test_systemtools_ImportManager_import_structured_package_03():
+    r'''Importing Abjad imports less than half of the modules imported when
+    getting the namespace of Abjad.
+    '''
+
+    code = '\n'.join((
+        'import sys',
+        'import abjad',
+        'def get_module_names():',
+        '    return set(_ for _ in sys.modules if _.startswith("abjad."))',
+        'lazy_names = get_module_names()',
+        'abjad.systemtools.ImportManager.get_namespace(abjad)',
+        'eager_names = get_module_names()',
+        'print(lazy_names < eager_names)',
+        'print(2 * len(lazy_names) < len(eager_names))',
+        'print("abjad.tools.lilypondparsertools" in lazy_names)',
+        'print("abjad.tools.lilypondparsertools" in eager_names)',
+        ))
+    assert _run_python(code).split() == ['True', 'True', 'False', 'True']
+
+
+def test_systemtools_ImportManager_import_structured_package_04():
+    r'''Parsers parse in a fresh interpreter.
+    '''
+
+    pairs = [
+        ("abjad.parse(\"{ c'4 d'4 }\")", 'Container("c\'4 d\'4")'),
+        ("abjad.Container(\"abj: c'8 d'8\")", 'Container("c\'8 d\'8")'),
+        (
+            'abjad.parse("rtm: (1 (1 1 1))")',
+            'Tuplet(Multiplier(2, 3), "c\'8 c\'8 c\'8")',
+            ),
+        (
+            'abjad.lilypondparsertools.SchemeParser()',
+            'SchemeParser(debug=False)',
+            ),
+        ]
+    for string, expected in pairs:
+        code = '\n'.join((
+            'import abjad',
+            'print(repr({}))'.format(string),
+            ))
+        assert _run_python(code) == expected
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+@requires_lazy_import
+def test_systemtools_ImportManager_import_structured_package_05():
+    r'''Benchmarks import of Abjad against getting the namespace of Abjad.
+    '''
+
+    code = '\n'.join((
+        'import time',
+        'start_time = time.time()',
+        'import abjad',
+        'lazy_time = time.time() - start_time',
+        'start_time = time.time()',
+        'abjad.systemtools.ImportManager.get_namespace(abjad)',
+        'eager_time = time.time() - start_time + lazy_time',
+        'print(lazy_time)',
+        'print(eager_time)',
+        ))
+    lazy_time, eager_time = _run_python(code).split()
+    print('Lazy import of Abjad:', lazy_time)
+    print('Eager import of Abjad:', eager_time)
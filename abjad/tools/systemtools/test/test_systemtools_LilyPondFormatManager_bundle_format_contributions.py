@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_01():
+    r'''Reuses cached bundle when nothing changes.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    abjad.attach(abjad.Articulation('accent'), staff[0])
+    manager = abjad.LilyPondFormatManager
+    bundle = manager.bundle_format_contributions(staff[0])
+
+    assert manager.bundle_format_contributions(staff[0]) is bundle
+    assert bundle.right.articulations == ('-\\accent',)
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_02():
+    r'''Attach and detach clear cached bundle.
+    '''
+
+    staff = abjad.Staff("c'4 d'4")
+    format(staff)
+    articulation = abjad.Articulation('accent')
+    abjad.attach(articulation, staff[0])
+
+    assert format(staff[0]) == "c'4 -\\accent"
+
+    abjad.detach(articulation, staff[0])
+
+    assert format(staff[0]) == "c'4"
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_03():
+    r'''Attach to container clears cached bundles of descendants. Parent
+    change clears cached bundle of component.
+    '''
+
+    container = abjad.Container("c'4 d'4")
+    note = container[0]
+
+    assert format(note) == "c'4"
+
+    abjad.attach(abjad.Markup('text'), container)
+
+    assert format(note) == "c'4 - \\markup { text }"
+
+    staff = abjad.Staff()
+    staff.append(note)
+
+    assert format(note) == "c'4"
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_04():
+    r'''Overrides and settings apply after cached bundle exists.
+    '''
+
+    staff = abjad.Staff("c'4 d'4")
+    format(staff)
+    abjad.override(staff[0]).note_head.color = 'red'
+    abjad.setting(staff[1]).staff.tuplet_full_length = True
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            \once \override NoteHead.color = #red
+            c'4
+            \set Staff.tupletFullLength = ##t
+            d'4
+        }
+        '''
+        )
+
+
+def test_systemtools_LilyPondFormatManager_bundle_format_contributions_05():
+    r'''Spanner contributions update when spanner changes.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    beam = abjad.Beam()
+    abjad.attach(beam, staff[:2])
+    format(staff)
+    beam._append(staff[2])
+
+    assert format(staff) == abjad.String.normalize(
+        r'''
+        \new Staff {
+            c'8 [
+            d'8
+            e'8 ]
+            f'8
+        }
+        '''
+        )
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import abjad
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+def test_systemtools_LilyPondFormatManager_write_lilypond_format_01():
+    r'''Writes same format as format() for components.
+    '''
+
+    staff = abjad.Staff(r"c'8 [ d'8 ] \times 2/3 { e'8 f'8 g'8 } a'4")
+    abjad.attach(abjad.Clef('bass'), staff[0])
+    abjad.attach(abjad.Markup('text'), staff[1])
+    measure = abjad.Measure((3, 12), "c'8 d'8 e'8", implicit_scaling=True)
+    note = abjad.Note("c'4")
+
+    for component in (staff, measure, note):
+        file_pointer = StringIO()
+        abjad.LilyPondFormatManager.write_lilypond_format(
+            component,
+            file_pointer,
+            )
+        assert file_pointer.getvalue() == format(component)
+
+
+def test_systemtools_LilyPondFormatManager_write_lilypond_format_02():
+    r'''Writes same format as format() for LilyPond files.
+    '''
+
+    score = abjad.Score([abjad.Staff("c'4 d'4 e'4 f'4")])
+    lilypond_file = abjad.LilyPondFile.new(score)
+    file_pointer = StringIO()
+    abjad.LilyPondFormatManager.write_lilypond_format(
+        lilypond_file,
+        file_pointer,
+        )
+
+    assert file_pointer.getvalue() == format(lilypond_file)
+
+
+def test_systemtools_LilyPondFormatManager_write_lilypond_format_03():
+    r'''Formats contexts in parallel and writes them in score order.
+    '''
+
+    staves = [abjad.Staff("c'8 d'8 e'8 f'8") for _ in range(4)]
+    for i, staff in enumerate(staves):
+        staff.name = 'Staff {}'.format(i)
+        abjad.attach(abjad.Markup(str(i)), staff[0])
+    piano_staff = abjad.StaffGroup(staves[2:], context_name='PianoStaff')
+    staff_group = abjad.StaffGroup(staves[:2] + [piano_staff])
+    score = abjad.Score([staff_group])
+    file_pointer = StringIO()
+    abjad.LilyPondFormatManager.write_lilypond_format(
+        score,
+        file_pointer,
+        processes=2,
+        )
+
+    assert file_pointer.getvalue() == format(score)
+
+
+def test_systemtools_LilyPondFormatManager_write_lilypond_format_04():
+    r'''Formats contexts in parallel when indicators outside contexts take
+    effect in contexts.
+
+    Formats contexts in calling process when clefs or dynamics are scoped
+    to parentage.
+    '''
+
+    staves = [abjad.Staff("c'8 d'8 e'8 f'8") for _ in range(5)]
+    staff_group = abjad.StaffGroup(staves[2:4])
+    score = abjad.Score(staves[:2] + [staff_group] + staves[4:])
+    abjad.attach(abjad.TimeSignature((2, 4)), staves[0][0], scope=abjad.Score)
+    abjad.attach(abjad.MetronomeMark((1, 4), 60), staves[0][0])
+    abjad.attach(abjad.Dynamic('f'), staves[1][0])
+    abjad.attach(abjad.Hairpin('<'), staves[1][:])
+    clef = abjad.Clef('bass')
+    abjad.attach(clef, staves[2][0], scope=abjad.StaffGroup)
+    abjad.attach(abjad.ClefSpanner('percussion'), staves[3][1:3])
+    manager = abjad.LilyPondFormatManager
+    roots, components = manager._get_parallel_format_components(score)
+
+    assert components == staves[:2] + staves[4:]
+
+    file_pointer = StringIO()
+    manager.write_lilypond_format(score, file_pointer, processes=2)
+
+    assert file_pointer.getvalue() == format(score)
+    assert r'%%%' not in file_pointer.getvalue()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import abjad
+import os
+import time
+configuration = abjad.AbjadConfiguration()
+directory = os.path.join(
+    configuration.abjad_directory,
+    'test_render_cache',
+    )
+cache_directory = os.path.join(directory, 'cache')
+
+
+def _write(path, contents):
+    with open(path, 'w') as file_pointer:
+        file_pointer.write(contents)
+
+
+def _read(path):
+    with open(path, 'r') as file_pointer:
+        return file_pointer.read()
+
+
+def test_systemtools_RenderCache_get_01():
+    r'''Restores cached output files under new base path.
+    '''
+
+    with abjad.FilesystemState(remove=[directory]):
+        os.makedirs(directory)
+        cache = abjad.RenderCache(directory=cache_directory)
+        ly_path = os.path.join(directory, 'score.ly')
+        _write(ly_path, "{ c'4 }")
+        key = cache.get_key(ly_path, flags='--png', extension='png')
+        assert cache.get(key, os.path.join(directory, 'copy')) is None
+
+        base = os.path.join(directory, 'score')
+        output_paths = [base + '-page1.png', base + '-page2.png']
+        _write(output_paths[0], 'page one')
+        _write(output_paths[1], 'page two')
+        cache.put(key, base, output_paths)
+
+        new_base = os.path.join(directory, 'copy')
+        restored_paths = cache.get(key, new_base)
+        assert restored_paths == (
+            new_base + '-page1.png',
+            new_base + '-page2.png',
+            )
+        assert _read(restored_paths[0]) == 'page one'
+        assert _read(restored_paths[1]) == 'page two'
+
+
+def test_systemtools_RenderCache_get_02():
+    r'''Keys differ by LilyPond source, flags and extension.
+    '''
+
+    with abjad.FilesystemState(remove=[directory]):
+        os.makedirs(directory)
+        cache = abjad.RenderCache(directory=cache_directory)
+        ly_path = os.path.join(directory, 'score.ly')
+        _write(ly_path, "{ c'4 }")
+        keys = set([
+            cache.get_key(ly_path),
+            cache.get_key(ly_path, flags='--png'),
+            cache.get_key(ly_path, extension='pdf'),
+            ])
+        assert len(keys) == 3
+        key = cache.get_key(ly_path, extension='pdf')
+        other_ly_path = os.path.join(directory, 'other.ly')
+        _write(other_ly_path, "{ c'4 }")
+        assert cache.get_key(other_ly_path, extension='pdf') == key
+        _write(other_ly_path, "{ d'4 }")
+        assert cache.get_key(other_ly_path, extension='pdf') != key
+
+
+def test_systemtools_RenderCache_get_03():
+    r'''Evicts least recently used entries beyond maximum size.
+    '''
+
+    with abjad.FilesystemState(remove=[directory]):
+        os.makedirs(directory)
+        cache = abjad.RenderCache(directory=cache_directory, maximum_size=25)
+        base = os.path.join(directory, 'score')
+        keys = []
+        for i in range(3):
+            ly_path = os.path.join(directory, 'score.ly')
+            _write(ly_path, str(i))
+            key = cache.get_key(ly_path, extension='pdf')
+            _write(base + '.pdf', str(i) * 10)
+            cache.put(key, base, [base + '.pdf'])
+            keys.append(key)
+            if i == 1:
+                now = time.time()
+                entry_path = cache._get_entry_path(keys[0])
+                os.utime(entry_path, (now - 20, now - 20))
+                entry_path = cache._get_entry_path(keys[1])
+                os.utime(entry_path, (now - 30, now - 30))
+                assert cache.get(keys[0], base) is not None
+        assert cache.get(keys[0], base) is not None
+        assert cache.get(keys[1], base) is None
+        assert cache.get(keys[2], base) is not None
+        cache.clear()
+        assert cache.get(keys[2], base) is None
+
+
+def test_systemtools_RenderCache_get_04():
+    r'''Keys ignore date / time comment of LilyPond files.
+    '''
+
+    note = abjad.Note("c'4")
+    with abjad.FilesystemState(remove=[directory]):
+        os.makedirs(directory)
+        cache = abjad.RenderCache(directory=cache_directory)
+        keys = []
+        for date_string in ('2017-01-01 12:00', '2017-01-02 13:01'):
+            lilypond_file = abjad.LilyPondFile.new(note)
+            token = abjad.DateTimeToken(date_string=date_string)
+            lilypond_file._date_time_token = token
+            ly_path = os.path.join(directory, 'score.ly')
+            _write(ly_path, format(lilypond_file))
+            assert date_string in _read(ly_path)
+            keys.append(cache.get_key(ly_path, extension='pdf'))
+        assert keys[0] == keys[1]
+        _write(ly_path, '% 2017-01-01 12:00\n' + "{ d'4 }")
+        assert cache.get_key(ly_path, extension='pdf') != keys[0]
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import abjad
+import platform
+import pytest
+
+
+def _get_timespans(score):
+    return [
+        abjad.inspect(_).get_timespan()
+        for _ in abjad.iterate(score).depth_first()
+        ]
+
+
+def _get_timespans_of_fresh_copy(score):
+    return _get_timespans(abjad.mutate(score).copy())
+
+
+def test_systemtools_UpdateManager__update_all_offsets_01():
+    r'''Incremental update repairs following siblings after local edit.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8")
+    assert abjad.inspect(staff[-1]).get_timespan() == abjad.Timespan(
+        (5, 8), (6, 8))
+    staff[1] = abjad.Note("d'4")
+
+    assert _get_timespans(staff) == _get_timespans_of_fresh_copy(staff)
+    assert abjad.inspect(staff[-1]).get_timespan() == abjad.Timespan(
+        (6, 8), (7, 8))
+
+
+def test_systemtools_UpdateManager__update_all_offsets_02():
+    r'''Incremental update recomputes children of rescaled tuplets.
+    '''
+
+    staff = abjad.Staff(r"c'4 \times 2/3 { c'8 d'8 e'8 } f'4")
+    assert abjad.inspect(staff[-1]).get_timespan() == abjad.Timespan(
+        (2, 4), (3, 4))
+    staff[1].multiplier = abjad.Multiplier(4, 5)
+    staff[1].append("f'8")
+
+    assert _get_timespans(staff) == _get_timespans_of_fresh_copy(staff)
+    assert abjad.inspect(staff[1][-1]).get_timespan() == abjad.Timespan(
+        (11, 20), (13, 20))
+
+
+def test_systemtools_UpdateManager__update_all_offsets_03():
+    r'''Incremental update recomputes components moved between prolations.
+    '''
+
+    staff = abjad.Staff(r"\times 2/3 { { c'8 d'8 } e'8 } f'4")
+    abjad.inspect(staff[-1]).get_timespan()
+    container = staff[0][0]
+    staff.append(container)
+
+    assert _get_timespans(staff) == _get_timespans_of_fresh_copy(staff)
+    assert abjad.inspect(container[-1]).get_timespan() == abjad.Timespan(
+        (11, 24), (7, 12))
+
+
+def test_systemtools_UpdateManager__update_all_offsets_04():
+    r'''Incremental update notices written durations and multipliers.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    abjad.inspect(staff[-1]).get_timespan()
+    staff[0].written_duration = abjad.Duration(1, 4)
+    abjad.attach(abjad.Multiplier(1, 2), staff[1])
+
+    assert _get_timespans(staff) == _get_timespans_of_fresh_copy(staff)
+    assert abjad.inspect(staff[-1]).get_timespan() == abjad.Timespan(
+        (7, 16), (9, 16))
+
+
+def test_systemtools_UpdateManager__update_all_offsets_05():
+    r'''Incremental update repairs grace notes of shifted carriers.
+    '''
+
+    staff = abjad.Staff("c'8 d'8 e'8 f'8")
+    grace_container = abjad.GraceContainer("g'16")
+    abjad.attach(grace_container, staff[2])
+    assert abjad.inspect(grace_container[0]).get_timespan() == \
+        abjad.Timespan(
+            abjad.Offset((1, 4), grace_displacement=(-1, 16)),
+            abjad.Offset((1, 4)),
+            )
+    staff.insert(0, abjad.Note("b4"))
+
+    assert abjad.inspect(grace_container[0]).get_timespan() == \
+        abjad.Timespan(
+            abjad.Offset((1, 2), grace_displacement=(-1, 16)),
+            abjad.Offset((1, 2)),
+            )
+
+
+def test_systemtools_UpdateManager__update_all_offsets_06():
+    r'''Incremental update matches full update after many local edits.
+    '''
+
+    maker = abjad.BenchmarkScoreMaker()
+    score = maker.make_score_with_measures_01()
+    abjad.inspect(score).get_timespan()
+    for i, staff in enumerate(score):
+        staff[10 * i][0] = abjad.Note("c'4")
+        del(staff[-1 - i])
+        staff.insert(5 * i, abjad.Measure((1, 8), "d'8"))
+        abjad.inspect(staff[-1]).get_timespan()
+
+    assert _get_timespans(score) == _get_timespans_of_fresh_copy(score)
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != 'CPython',
+    reason='Benchmarking is only for CPython.',
+    )
+def test_systemtools_UpdateManager__update_all_offsets_07():
+    r'''Offset update after local edit costs far less than full update.
+    '''
+
+    maker = abjad.BenchmarkScoreMaker()
+    score = maker.make_score_with_measures_01()
+    leaf = abjad.inspect(score[-1]).get_leaf(-1)
+    abjad.inspect(leaf).get_timespan()
+
+    def local_edit():
+        score[0][25][0] = abjad.Note("c'8")
+        abjad.inspect(leaf).get_timespan()
+
+    def global_edit():
+        score._update_later(offsets=True)
+        abjad.inspect(leaf).get_timespan()
+
+    local_count = abjad.IOManager.count_function_calls(
+        'local_edit()',
+        locals(),
+        fixed_point=False,
+        )
+    global_count = abjad.IOManager.count_function_calls(
+        'global_edit()',
+        locals(),
+        fixed_point=False,
+        )
+
+    assert local_count * 5 < global_count
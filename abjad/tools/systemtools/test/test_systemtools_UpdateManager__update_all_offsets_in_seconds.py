@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import abjad
+import pytest
+
+
+def _sum_leaf_durations_in_seconds(leaves):
+    start_offset = abjad.Offset(0)
+    timespans = []
+    for leaf in leaves:
+        duration = abjad.inspect(leaf).get_duration(in_seconds=True)
+        stop_offset = start_offset + duration
+        timespans.append(abjad.Timespan(start_offset, stop_offset))
+        start_offset = stop_offset
+    return timespans
+
+
+def test_systemtools_UpdateManager__update_all_offsets_in_seconds_01():
+    r'''Tempo map elects staff-scoped metronome marks per staff.
+    '''
+
+    score = abjad.Score([
+        abjad.Staff("c'4 d'4 e'4 f'4"),
+        abjad.Staff("c'8 d'8 e'8 f'8 g'8 a'8 b'8 c''8"),
+        ])
+    mark = abjad.MetronomeMark((1, 4), 60)
+    abjad.attach(mark, score[0][0])
+    mark = abjad.MetronomeMark((1, 4), 90)
+    abjad.attach(mark, score[0][2])
+    mark = abjad.MetronomeMark((1, 8), 72)
+    abjad.attach(mark, score[1][3], scope=abjad.Staff)
+
+    for staff in score:
+        timespans = [
+            abjad.inspect(_).get_timespan(in_seconds=True)
+            for _ in staff
+            ]
+        assert timespans == _sum_leaf_durations_in_seconds(staff[:])
+
+    assert abjad.inspect(score[1][4]).get_timespan(in_seconds=True) == \
+        abjad.Timespan((7, 3), (8, 3))
+    assert abjad.inspect(score).get_timespan(in_seconds=True) == \
+        abjad.Timespan(0, (11, 3))
+
+
+def test_systemtools_UpdateManager__update_all_offsets_in_seconds_02():
+    r'''Offsets in seconds update when durations change.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    mark = abjad.MetronomeMark((1, 4), 60)
+    abjad.attach(mark, staff[0], scope=abjad.Staff)
+
+    assert abjad.inspect(staff[-1]).get_timespan(in_seconds=True) == \
+        abjad.Timespan(3, 4)
+
+    staff[0].written_duration = abjad.Duration(1, 2)
+
+    assert abjad.inspect(staff[-1]).get_timespan(in_seconds=True) == \
+        abjad.Timespan(4, 5)
+
+
+def test_systemtools_UpdateManager__update_all_offsets_in_seconds_03():
+    r'''Offsets in seconds update when metronome marks detach.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    mark = abjad.MetronomeMark((1, 4), 60)
+    abjad.attach(mark, staff[0], scope=abjad.Staff)
+
+    assert abjad.inspect(staff[-1]).get_timespan(in_seconds=True) == \
+        abjad.Timespan(3, 4)
+
+    abjad.detach(mark, staff[0])
+
+    statement = 'abjad.inspect(staff[-1]).get_timespan(in_seconds=True)'
+    assert pytest.raises(MissingMetronomeMarkError, statement)
+
+
+def test_systemtools_UpdateManager__update_all_offsets_in_seconds_04():
+    r'''Formatting does not update offsets in seconds.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    mark = abjad.MetronomeMark((1, 4), 60)
+    abjad.attach(mark, staff[0], scope=abjad.Staff)
+    format(staff)
+
+    assert not staff._offsets_in_seconds_are_current
+    assert abjad.inspect(staff).get_timespan(in_seconds=True) == \
+        abjad.Timespan(0, 4)
+    assert staff._offsets_in_seconds_are_current
+
+
+def test_systemtools_UpdateManager__update_all_offsets_in_seconds_05():
+    r'''Offsets in seconds interpolate tempo changes inside leaves.
+    '''
+
+    score = abjad.Score([
+        abjad.Staff("c'4 d'4 e'2"),
+        abjad.Staff("c'2 d'2"),
+        ])
+    mark = abjad.MetronomeMark((1, 4), 60)
+    abjad.attach(mark, score[0][0])
+    mark = abjad.MetronomeMark((1, 4), 120)
+    abjad.attach(mark, score[0][1])
+
+    assert abjad.inspect(score[1][0]).get_timespan(in_seconds=True) == \
+        abjad.Timespan(0, (3, 2))
+    assert abjad.inspect(score[1][1]).get_timespan(in_seconds=True) == \
+        abjad.inspect(score[0][2]).get_timespan(in_seconds=True)
+    assert abjad.inspect(score).get_timespan(in_seconds=True) == \
+        abjad.Timespan(0, (5, 2))
+
+
+def test_systemtools_UpdateManager__update_all_offsets_in_seconds_06():
+    r'''Tempo maps cached on score root survive updates that leave
+    metronome marks unchanged.
+    '''
+
+    staff = abjad.Staff("c'4 d'4 e'4 f'4")
+    mark = abjad.MetronomeMark((1, 4), 60)
+    abjad.attach(mark, staff[0], scope=abjad.Staff)
+    abjad.inspect(staff[-1]).get_timespan(in_seconds=True)
+    tempo_maps = [_[1] for _ in staff._tempo_map_cache.values()]
+
+    staff[-1].written_pitch = "g'"
+    staff._update_later(offsets_in_seconds=True)
+
+    assert abjad.inspect(staff[-1]).get_timespan(in_seconds=True) == \
+        abjad.Timespan(3, 4)
+    assert all(
+        x is y for x, y in
+        zip([_[1] for _ in staff._tempo_map_cache.values()], tempo_maps)
+        )
+
+    mark = abjad.MetronomeMark((1, 4), 120)
+    abjad.attach(mark, staff[2], scope=abjad.Staff)
+
+    assert abjad.inspect(staff[-1]).get_timespan(in_seconds=True) == \
+        abjad.Timespan((5, 2), 3)
+    assert not any(
+        x is y for x, y in
+        zip([_[1] for _ in staff._tempo_map_cache.values()], tempo_maps)
+        )
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import abjad
+
+
+def _make_score(staff_count, measure_count):
+    staves = []
+    for i in range(staff_count):
+        staff = abjad.Staff()
+        for j in range(measure_count):
+            measure = abjad.Measure((4, 4), "c'8 d'8 e'8 f'8 g'4 ~ g'8 r8")
+            staff.append(measure)
+        leaves = abjad.select(staff).by_leaf()
+        for j in range(0, len(leaves) - 4, 7):
+            abjad.attach(abjad.Beam(), leaves[j:j + 4])
+            if j % 14 == 0:
+                abjad.attach(abjad.Hairpin('p < f'), leaves[j:j + 3])
+        if i % 2 == 0:
+            abjad.attach(abjad.instrumenttools.Violin(), leaves[0])
+            abjad.attach(abjad.Clef('treble'), leaves[0])
+            abjad.attach(abjad.Clef('bass'), leaves[16])
+        else:
+            abjad.attach(abjad.instrumenttools.Cello(), leaves[0])
+            abjad.attach(abjad.Clef('bass'), leaves[0])
+            leaves[1].written_pitch = 'c,,,'
+        staves.append(staff)
+    return abjad.Score(staves)
+
+
+def _check_leaves_by_inspection(score):
+    wrong_clef_violators, out_of_range_violators = [], []
+    for leaf in abjad.iterate(score).by_leaf():
+        instrument = abjad.inspect(leaf).get_effective(abjad.Instrument)
+        if instrument is None:
+            continue
+        clef = abjad.inspect(leaf).get_effective(abjad.Clef)
+        if clef is not None and clef not in instrument.allowable_clefs:
+            wrong_clef_violators.append(leaf)
+        if isinstance(leaf, (abjad.Note, abjad.Chord)):
+            if leaf not in instrument.pitch_range:
+                out_of_range_violators.append(leaf)
+    return wrong_clef_violators, out_of_range_violators
+
+
+def test_systemtools_WellformednessManager___call___01():
+    r'''Checks share one traversal and keep violators in score order.
+    '''
+
+    score = _make_score(2, 4)
+    staff = score[1]
+    staff[0][5].written_pitch = "a'"
+    abjad.attach(abjad.Beam(), staff[2][4:5])
+    staff[3].append(abjad.Container())
+    triples = abjad.WellformednessManager()(score)
+    violators = dict((_[-1], _[0]) for _ in triples)
+    leaves = list(abjad.iterate(score[0]).by_leaf())
+    assert violators['check_beamed_quarter_notes'] == [staff[2][4]]
+    assert violators['check_empty_containers'] == [staff[3][-1]]
+    assert violators['check_misfilled_measures'] == []
+    assert violators['check_mispitched_ties'] == [
+        abjad.inspect(staff[0][5]).get_spanner(abjad.Tie)]
+    assert violators['check_notes_on_wrong_clef'] == leaves[16:]
+    assert violators['check_out_of_range_notes'] == [staff[0][1]]
+    assert violators['check_tied_rests'] == []
+    for violators, total, check_name in triples:
+        check = getattr(abjad.WellformednessManager(), check_name)
+        assert check(score) == (violators, total)
+
+    note = abjad.Note("c'4")
+    triples = abjad.WellformednessManager()([note, note])
+    violators = dict((_[-1], _[0]) for _ in triples)
+    assert violators['check_duplicate_ids'] == [note, note]
+
+
+def test_systemtools_WellformednessManager___call___02():
+    r'''Worker processes find the same violators as calling process.
+    '''
+
+    score = _make_score(4, 4)
+    score[2][1][5].written_pitch = "a'"
+    abjad.attach(abjad.Beam(), score[3][1][4:5])
+    score[0].append(abjad.Measure((3, 4), "c'4"))
+    expected = abjad.WellformednessManager()(score)
+    manager = abjad.WellformednessManager(processes=2)
+    assert manager.processes == 2
+    assert manager(score) == expected
+    assert abjad.WellformednessManager(processes=2)(score[0]) == \
+        abjad.WellformednessManager()(score[0])
+
+
+def test_systemtools_WellformednessManager___call___03():
+    r'''Checks match effective indicator inspection of each leaf.
+    '''
+
+    score = _make_score(4, 20)
+    manager = abjad.WellformednessManager()
+    wrong_clef_violators, out_of_range_violators = \
+        _check_leaves_by_inspection(score)
+    triples = manager(score)
+    violators = dict((_[-1], _[0]) for _ in triples)
+    assert violators['check_notes_on_wrong_clef'] == wrong_clef_violators
+    assert violators['check_out_of_range_notes'] == out_of_range_violators
+
+
+def test_systemtools_WellformednessManager___call___04():
+    r'''Worker processes check only staves that check the same without
+    parentage.
+    '''
+
+    score = _make_score(4, 3)
+    staves = score[:]
+    del(score[2:])
+    score.append(abjad.StaffGroup(staves[2:]))
+    leaf = abjad.select(staves[2]).by_leaf()[0]
+    abjad.detach(abjad.Instrument, leaf)
+    abjad.attach(abjad.instrumenttools.Viola(), leaf, scope=abjad.StaffGroup)
+    manager = abjad.WellformednessManager(processes=2)
+    contexts = abjad.LilyPondFormatManager._get_parallel_format_components(
+        score)[1]
+    contexts = [_ for _ in contexts if manager._is_checkable_alone(_)]
+
+    assert contexts == staves[:2]
+    assert manager(score) == abjad.WellformednessManager()(score)
@@ -803,7 +803,7 @@ class Timespan(BoundedObject):
         return False
 
     def _initialize_offset(self, offset):
-        if offset in (NegativeInfinity, Infinity):
+        if isinstance(offset, mathtools.Infinity):
             return offset
         return durationtools.Offset(offset)
 
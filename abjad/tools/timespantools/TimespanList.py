@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import bisect
 import collections
 from abjad.tools import datastructuretools
 from abjad.tools import durationtools
@@ -139,8 +140,11 @@ class TimespanList(TypedList):
     __documentation_section__ = 'Timespans'
 
     __slots__ = (
+        '_index',
         )
 
+    _index_threshold = 32
+
     ### SPECIAL METHODS ###
 
     def __and__(self, timespan):
@@ -194,6 +198,17 @@ class TimespanList(TypedList):
         self[:] = sorted(new_timespans)
         return self
 
+    def __getstate__(self):
+        r'''Gets state of timespan list.
+
+        Excludes timespan index.
+
+        Returns dictionary.
+        '''
+        state = TypedList.__getstate__(self)
+        state['_index'] = None
+        return state
+
     def __illustrate__(self, key=None, range_=None, sortkey=None, scale=None):
         r'''Illustrates timespans.
 
@@ -412,6 +427,222 @@ class TimespanList(TypedList):
 
     ### PRIVATE METHODS ###
 
+    def _get_index(self):
+        index = getattr(self, '_index', None)
+        if index is not None and index['count'] == len(self):
+            return index
+        if len(self) < self._index_threshold:
+            return None
+        from abjad.tools import timespantools
+        if index is not None:
+            # catch up with timespans appended since index was built
+            for position in range(index['count'], len(self)):
+                timespan = self[position]
+                if (
+                    not isinstance(timespan, timespantools.Timespan) or
+                    index['count'] == index['capacity']
+                    ):
+                    index = None
+                    break
+                start_key = float(timespan.start_offset)
+                if start_key < index['start_keys'][-1]:
+                    index = None
+                    break
+                stop_key = float(timespan.stop_offset)
+                index['positions'].append(position)
+                index['start_keys'].append(start_key)
+                node = index['capacity'] + index['count']
+                index['count'] += 1
+                maximum_stop_keys = index['maximum_stop_keys']
+                minimum_stop_keys = index['minimum_stop_keys']
+                while node:
+                    maximum_stop_keys[node] = max(
+                        maximum_stop_keys[node], stop_key)
+                    minimum_stop_keys[node] = min(
+                        minimum_stop_keys[node], stop_key)
+                    node //= 2
+        if index is None:
+            if not all(isinstance(_, timespantools.Timespan) for _ in self):
+                return None
+            entries = [
+                (float(_.start_offset), position, float(_.stop_offset))
+                for position, _ in enumerate(self)
+                ]
+            entries.sort()
+            capacity = 1
+            while capacity < 2 * len(entries):
+                capacity *= 2
+            maximum_stop_keys = [float('-inf')] * (2 * capacity)
+            minimum_stop_keys = [float('inf')] * (2 * capacity)
+            for i, entry in enumerate(entries):
+                maximum_stop_keys[capacity + i] = entry[2]
+                minimum_stop_keys[capacity + i] = entry[2]
+            for node in reversed(range(1, capacity)):
+                maximum_stop_keys[node] = max(
+                    maximum_stop_keys[2 * node],
+                    maximum_stop_keys[2 * node + 1],
+                    )
+                minimum_stop_keys[node] = min(
+                    minimum_stop_keys[2 * node],
+                    minimum_stop_keys[2 * node + 1],
+                    )
+            index = {
+                'capacity': capacity,
+                'count': len(entries),
+                'maximum_stop_keys': maximum_stop_keys,
+                'minimum_stop_keys': minimum_stop_keys,
+                'positions': [_[1] for _ in entries],
+                'start_keys': [_[0] for _ in entries],
+                }
+        self._index = index
+        return index
+
+    @staticmethod
+    def _get_index_bounds(inequality, keys):
+        r'''Gets bounds on start and stop offsets of timespans that can
+        satisfy `inequality`.
+
+        Bounds are inclusive and may admit timespans that do not satisfy
+        `inequality`. Bounds never exclude timespans that satisfy
+        `inequality`.
+
+        Returns list of (start minimum, start maximum, stop minimum, stop
+        maximum) tuples.
+        '''
+        from abjad.tools import timespantools
+        infinity = float('inf')
+        if isinstance(inequality, timespantools.TimespanInequality):
+            left, operator, right = inequality.template.split()
+            if left in keys:
+                left, right = right, left
+                operator = {'<': '>', '<=': '>=', '==': '=='}[operator]
+            minimum, maximum = -infinity, infinity
+            if operator in ('>', '>=', '=='):
+                minimum = keys[right]
+            if operator in ('<', '<=', '=='):
+                maximum = keys[right]
+            if left in ('timespan.start', 'timespan_2.start_offset'):
+                return [(minimum, maximum, -infinity, infinity)]
+            return [(-infinity, infinity, minimum, maximum)]
+        bounds = [
+            TimespanList._get_index_bounds(_, keys)
+            for _ in inequality
+            ]
+        if inequality.logical_operator != 'and':
+            return [_ for bounds_ in bounds for _ in bounds_]
+        result = [(-infinity, infinity, -infinity, infinity)]
+        for bounds_ in bounds:
+            result = [
+                (
+                    max(x[0], y[0]),
+                    min(x[1], y[1]),
+                    max(x[2], y[2]),
+                    min(x[3], y[3]),
+                    )
+                for x in result
+                for y in bounds_
+                ]
+            result = [_ for _ in result if _[0] <= _[1] and _[2] <= _[3]]
+        return result
+
+    def _get_index_positions(self, time_relation):
+        r'''Gets positions of timespans that may satisfy `time_relation`.
+
+        Queries timespan index in O(log n + k) time for each bounding box
+        derived from `time_relation`.
+
+        Returns sorted list of positions. Returns none when timespan list
+        is not indexed.
+        '''
+        from abjad.tools import timespantools
+        if isinstance(
+            time_relation,
+            timespantools.TimespanTimespanTimeRelation,
+            ):
+            timespan_1 = time_relation.timespan_1
+            if timespan_1 is None:
+                return None
+            if not isinstance(timespan_1, timespantools.Timespan):
+                timespan_1 = timespantools.Timespan()._get_timespan(timespan_1)
+            keys = {
+                'timespan_1.start_offset': float(timespan_1.start_offset),
+                'timespan_1.stop_offset': float(timespan_1.stop_offset),
+                }
+        elif isinstance(
+            time_relation,
+            timespantools.OffsetTimespanTimeRelation,
+            ):
+            if time_relation.offset is None:
+                return None
+            offset = durationtools.Offset(time_relation.offset)
+            keys = {'offset': float(offset)}
+        else:
+            return None
+        index = self._get_index()
+        if index is None:
+            return None
+        bounds = self._get_index_bounds(time_relation.inequality, keys)
+        capacity = index['capacity']
+        maximum_stop_keys = index['maximum_stop_keys']
+        minimum_stop_keys = index['minimum_stop_keys']
+        start_keys = index['start_keys']
+        positions = set()
+        for start_minimum, start_maximum, stop_minimum, stop_maximum in bounds:
+            start = bisect.bisect_left(start_keys, start_minimum)
+            stop = bisect.bisect_right(start_keys, start_maximum)
+            nodes = [(1, 0, capacity)]
+            while nodes:
+                node, node_start, node_stop = nodes.pop()
+                if node_stop <= start or stop <= node_start:
+                    continue
+                if (
+                    maximum_stop_keys[node] < stop_minimum or
+                    stop_maximum < minimum_stop_keys[node]
+                    ):
+                    continue
+                if capacity <= node:
+                    positions.add(index['positions'][node_start])
+                    continue
+                middle = (node_start + node_stop) // 2
+                nodes.append((2 * node + 1, middle, node_stop))
+                nodes.append((2 * node, node_start, middle))
+        return sorted(positions)
+
+    def _get_offset_keys(self):
+        r'''Gets sort keys of start and stop offsets of timespans.
+
+        Keys are integers when all offsets are offsets without grace
+        displacement. Otherwise keys are offsets.
+
+        Returns start keys, stop keys and dictionary of offsets by key.
+        '''
+        from abjad.tools import mathtools
+        start_offsets, stop_offsets = [], []
+        for timespan in self:
+            start_offset, stop_offset = self._get_offsets(timespan)
+            start_offsets.append(start_offset)
+            stop_offsets.append(stop_offset)
+        offsets = start_offsets + stop_offsets
+        denominators = set()
+        for offset in offsets:
+            if (
+                type(offset) is not durationtools.Offset or
+                offset.grace_displacement is not None
+                ):
+                break
+            denominators.add(offset.denominator)
+        else:
+            if denominators:
+                denominator = mathtools.least_common_multiple(*denominators)
+                keys = [
+                    _.numerator * (denominator // _.denominator)
+                    for _ in offsets
+                    ]
+                offsets = dict(zip(keys, offsets))
+                return keys[:len(self)], keys[len(self):], offsets
+        offsets = dict((_, _) for _ in offsets)
+        return start_offsets, stop_offsets, offsets
+
     def _get_offsets(self, argument):
         try:
             return argument.start_offset, argument.stop_offset
@@ -428,6 +659,27 @@ class TimespanList(TypedList):
         start_offset, stop_offset = self._get_offsets(argument)
         return timespantools.Timespan(start_offset, stop_offset)
 
+    def _iterate_timespans_that_satisfy_time_relation(self, time_relation):
+        from abjad.tools import timespantools
+        positions = self._get_index_positions(time_relation)
+        if positions is None:
+            timespans = self
+        else:
+            timespans = [self[_] for _ in positions]
+        for timespan in timespans:
+            if isinstance(
+                time_relation,
+                timespantools.TimespanTimespanTimeRelation):
+                if time_relation(timespan_2=timespan):
+                    yield timespan
+            elif isinstance(
+                time_relation,
+                timespantools.OffsetTimespanTimeRelation):
+                if time_relation(timespan=timespan):
+                    yield timespan
+            else:
+                raise ValueError
+
     @staticmethod
     def _make_timespan_list_markup(
         timespans,
@@ -499,6 +751,31 @@ class TimespanList(TypedList):
         markup = markuptools.Markup.column([fraction_markup, lines_markup])
         return markup
 
+    def _on_insertion(self, item):
+        self._index = None
+
+    def _on_removal(self, item):
+        self._index = None
+
+    def _sweep_offsets(self, start_keys, stop_keys):
+        r'''Sweeps start and stop offsets of timespans in increasing order.
+
+        Yields one (key, starting positions, stopping positions) triple for
+        each distinct offset.
+        '''
+        events = {}
+        for position, key in enumerate(start_keys):
+            if key not in events:
+                events[key] = ([], [])
+            events[key][0].append(position)
+        for position, key in enumerate(stop_keys):
+            if key not in events:
+                events[key] = ([], [])
+            events[key][1].append(position)
+        for key in sorted(events):
+            starting_positions, stopping_positions = events[key]
+            yield key, starting_positions, stopping_positions
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1042,6 +1319,28 @@ class TimespanList(TypedList):
 
     ### PUBLIC METHODS ###
 
+    def append(self, item):
+        r'''Appends `item` to timespan list.
+
+        ..  container:: example
+
+            ::
+
+                >>> timespans = abjad.TimespanList()
+                >>> timespans.append((0, 3))
+                >>> timespans
+                TimespanList([Timespan(start_offset=Offset(0, 1), stop_offset=Offset(3, 1))])
+
+        Extends timespan index on next query when `item` starts no earlier
+        than other timespans in timespan list.
+
+        Returns none.
+        '''
+        index = getattr(self, '_index', None)
+        TypedList.append(self, item)
+        if index is not None and not self.keep_sorted:
+            self._index = index
+
     def clip_timespan_durations(self, minimum=None, maximum=None, anchor=Left):
         r'''Clips timespan durations.
 
@@ -1319,15 +1618,23 @@ class TimespanList(TypedList):
         Operates in place and returns timespan list.
         '''
         if 1 < len(self):
-            result = self[0]
-            for timespan in self:
-                if not timespan.intersects_timespan(result):
+            start_keys, stop_keys, offsets = self._get_offset_keys()
+            start_key, stop_key = start_keys[0], stop_keys[0]
+            for start_key_, stop_key_ in zip(start_keys, stop_keys):
+                if not (
+                    (start_key_ <= start_key < stop_key_) or
+                    (start_key <= start_key_ < stop_key)
+                    ):
                     self[:] = []
                     return self
-                else:
-                    timespans = result & timespan
-                    result = timespans[0]
-            self[:] = [result]
+                start_key = max(start_key, start_key_)
+                stop_key = min(stop_key, stop_key_)
+            timespan = new(
+                self[0],
+                start_offset=offsets[start_key],
+                stop_offset=offsets[stop_key],
+                )
+            self[:] = [timespan]
         return self
 
     def compute_logical_or(self):
@@ -1469,15 +1776,34 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         '''
+        if not self:
+            return self
+        start_keys, stop_keys, offsets = self._get_offset_keys()
         timespans = []
-        if self:
-            timespans = [self[0]]
-            for timespan in self[1:]:
-                if timespans[-1]._can_fuse(timespan):
-                    timespans_ = timespans[-1] | timespan
-                    timespans[-1:] = timespans_[:]
-                else:
-                    timespans.append(timespan)
+        run = [self[0], start_keys[0], stop_keys[0], 1]
+        for timespan, start_key, stop_key in zip(
+            self[1:], start_keys[1:], stop_keys[1:]):
+            first_timespan, run_start_key, run_stop_key, count = run
+            if isinstance(timespan, type(first_timespan)) and (
+                (start_key <= run_start_key < stop_key) or
+                (run_start_key <= start_key < run_stop_key) or
+                run_stop_key == start_key
+                ):
+                run[1] = min(run_start_key, start_key)
+                run[2] = max(run_stop_key, stop_key)
+                run[3] += 1
+            else:
+                timespans.append(run)
+                run = [timespan, start_key, stop_key, 1]
+        timespans.append(run)
+        for i, (timespan, start_key, stop_key, count) in enumerate(timespans):
+            if 1 < count:
+                timespan = new(
+                    timespan,
+                    start_offset=offsets[start_key],
+                    stop_offset=offsets[stop_key],
+                    )
+            timespans[i] = timespan
         self[:] = timespans
         return self
 
@@ -1687,24 +2013,57 @@ class TimespanList(TypedList):
 
         Operates in place and returns timespan list.
         '''
-        all_fragments = []
-        for i, timespan_1 in enumerate(self):
-            timespan_1_fragments = [timespan_1]
-            for j, timespan_2 in enumerate(self):
-                if i == j:
+        if not self:
+            return self
+        start_keys, stop_keys, offsets = self._get_offset_keys()
+        pieces = [[] for _ in self]
+        point_keys = []
+        active_positions = set()
+        previous_key = None
+        for key, starting_positions, stopping_positions in \
+            self._sweep_offsets(start_keys, stop_keys):
+            if len(active_positions) == 1:
+                position = next(iter(active_positions))
+                pieces_ = pieces[position]
+                if pieces_ and pieces_[-1][1] == previous_key:
+                    pieces_[-1][1] = key
+                else:
+                    pieces_.append([previous_key, key])
+            active_positions.difference_update(stopping_positions)
+            for position in starting_positions:
+                if start_keys[position] < stop_keys[position]:
+                    active_positions.add(position)
+            for position in starting_positions:
+                if start_keys[position] == stop_keys[position]:
+                    point_keys.append(key)
+                    if not active_positions:
+                        pieces[position].append([key, key])
+            previous_key = key
+        point_keys.sort()
+        fragments = []
+        for position, timespan in enumerate(self):
+            keys = (start_keys[position], stop_keys[position])
+            if pieces[position] == [list(keys)]:
+                i = bisect.bisect_right(point_keys, keys[0])
+                j = bisect.bisect_left(point_keys, keys[1])
+                if j <= i:
+                    fragments.append((keys, timespan))
                     continue
-                revised_timespan_1_fragments = []
-                for timespan_1_fragment in timespan_1_fragments:
-                    if timespan_2.intersects_timespan(timespan_1_fragment):
-                        result = timespan_1_fragment - timespan_2
-                        revised_timespan_1_fragments.extend(result)
-                    else:
-                        revised_timespan_1_fragments.append(
-                            timespan_1_fragment)
-                timespan_1_fragments = revised_timespan_1_fragments
-            all_fragments.extend(timespan_1_fragments)
-        self[:] = all_fragments
-        self.sort()
+            for start_key, stop_key in pieces[position]:
+                i = bisect.bisect_right(point_keys, start_key)
+                j = bisect.bisect_left(point_keys, stop_key)
+                for key in point_keys[i:j] + [stop_key]:
+                    if key == start_key:
+                        continue
+                    fragment = new(
+                        timespan,
+                        start_offset=offsets[start_key],
+                        stop_offset=offsets[key],
+                        )
+                    fragments.append(((start_key, key), fragment))
+                    start_key = key
+        fragments.sort(key=lambda _: _[0])
+        self[:] = [_[1] for _ in fragments]
         return self
 
     def compute_overlap_factor(self, timespan=None):
@@ -1811,10 +2170,23 @@ class TimespanList(TypedList):
             timespan = self.timespan
         time_relation = timespantools.timespan_2_intersects_timespan_1(
             timespan_1=timespan)
-        timespans = self.get_timespans_that_satisfy_time_relation(
-            time_relation)
-        total_overlap = durationtools.Duration(sum(
-            x.get_overlap_with_timespan(timespan) for x in timespans))
+        positions = self._get_index_positions(time_relation)
+        if positions is not None:
+            timespans = [self[_] for _ in positions]
+        elif all(isinstance(_, timespantools.Timespan) for _ in self):
+            timespans = self
+        else:
+            timespans = self.get_timespans_that_satisfy_time_relation(
+                time_relation)
+            total_overlap = durationtools.Duration(sum(
+                x.get_overlap_with_timespan(timespan) for x in timespans))
+            return total_overlap / timespan.duration
+        total_overlap = durationtools.Duration(0)
+        for x in timespans:
+            start_offset = max(x.start_offset, timespan.start_offset)
+            stop_offset = min(x.stop_offset, timespan.stop_offset)
+            if start_offset < stop_offset:
+                total_overlap += stop_offset - start_offset
         overlap_factor = total_overlap / timespan.duration
         return overlap_factor
 
@@ -2009,7 +2381,17 @@ class TimespanList(TypedList):
         Returns counter.
         '''
         from abjad.tools import metertools
-        return metertools.OffsetCounter(self)
+        offset_counter = metertools.OffsetCounter()
+        if not self:
+            return offset_counter
+        start_keys, stop_keys, offsets = self._get_offset_keys()
+        counts = collections.OrderedDict()
+        for start_key, stop_key in zip(start_keys, stop_keys):
+            counts[start_key] = counts.get(start_key, 0) + 1
+            counts[stop_key] = counts.get(stop_key, 0) + 1
+        for key, count in counts.items():
+            offset_counter[offsets[key]] += count
+        return offset_counter
 
     def explode(self, inventory_count=None):
         r'''Explodes timespans into timespan lists, avoiding overlap, and
@@ -2406,23 +2788,14 @@ class TimespanList(TypedList):
                         ]
                     )
 
+        Queries timespan index instead of testing every timespan when
+        timespan list contains many timespans. Builds index on first query
+        and rebuilds index after timespan list changes.
+
         Returns new timespan list.
         '''
-        from abjad.tools import timespantools
-        result = []
-        for timespan in self:
-            if isinstance(
-                time_relation,
-                timespantools.TimespanTimespanTimeRelation):
-                if time_relation(timespan_2=timespan):
-                    result.append(timespan)
-            elif isinstance(
-                time_relation,
-                timespantools.OffsetTimespanTimeRelation):
-                if time_relation(timespan=timespan):
-                    result.append(timespan)
-            else:
-                raise ValueError
+        result = self._iterate_timespans_that_satisfy_time_relation(
+            time_relation)
         return type(self)(result)
 
     def has_timespan_that_satisfies_time_relation(self, time_relation):
@@ -2471,8 +2844,10 @@ class TimespanList(TypedList):
 
         Returns true or false.
         '''
-        return bool(
-            self.get_timespans_that_satisfy_time_relation(time_relation))
+        for timespan in self._iterate_timespans_that_satisfy_time_relation(
+            time_relation):
+            return True
+        return False
 
     def partition(self, include_tangent_timespans=False):
         r'''Partitions timespans into timespan_lists.
@@ -2659,24 +3034,28 @@ class TimespanList(TypedList):
         '''
         if not self:
             return []
+        start_keys, stop_keys, offsets = self._get_offset_keys()
+        positions = sorted(
+            range(len(self)),
+            key=lambda _: (start_keys[_], stop_keys[_]),
+            )
         timespan_lists = []
-        timespans = sorted(self[:])
-        current_list = type(self)([timespans[0]])
-        latest_stop_offset = current_list[0].stop_offset
-        for current_timespan in timespans[1:]:
-            if current_timespan.start_offset < latest_stop_offset:
-                current_list.append(current_timespan)
+        current_list = [self[positions[0]]]
+        latest_stop_key = stop_keys[positions[0]]
+        for position in positions[1:]:
+            start_key = start_keys[position]
+            if start_key < latest_stop_key:
+                current_list.append(self[position])
             elif (include_tangent_timespans and
-                current_timespan.start_offset == latest_stop_offset):
-                current_list.append(current_timespan)
+                start_key == latest_stop_key):
+                current_list.append(self[position])
             else:
                 timespan_lists.append(current_list)
-                current_list = type(self)([current_timespan])
-            if latest_stop_offset < current_timespan.stop_offset:
-                latest_stop_offset = current_timespan.stop_offset
-        if current_list:
-            timespan_lists.append(current_list)
-        return tuple(timespan_lists)
+                current_list = [self[position]]
+            if latest_stop_key < stop_keys[position]:
+                latest_stop_key = stop_keys[position]
+        timespan_lists.append(current_list)
+        return tuple(type(self)(_) for _ in timespan_lists)
 
     def reflect(self, axis=None):
         r'''Reflects timespans.
@@ -2878,6 +3257,14 @@ class TimespanList(TypedList):
                 self[-1] = self[-1].set_offsets(stop_offset=stop_offset)
         return self
 
+    def reverse(self):
+        r'''Reverses timespans in timespan list.
+
+        Returns none.
+        '''
+        self._index = None
+        TypedList.reverse(self)
+
     def rotate(self, count):
         r'''Rotates by `count` contiguous timespans.
 
@@ -3246,6 +3633,14 @@ class TimespanList(TypedList):
         self[:] = timespans
         return self
 
+    def sort(self, cmp=None, key=None, reverse=False):
+        r'''Sorts timespans in timespan list.
+
+        Returns none.
+        '''
+        self._index = None
+        TypedList.sort(self, cmp=cmp, key=key, reverse=reverse)
+
     def split_at_offset(self, offset):
         '''Splits timespans at `offset`.
 
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+import abjad
+from timespantools_base import get_signature
+from timespantools_base import make_timespans
+
+
+def test_timespantools_TimespanList_compute_logical_and_01():
+    r'''Sweep matches pairwise intersection.
+    '''
+
+    for seed in range(20):
+        timespans = make_timespans(12, seed=seed)
+        expected = [timespans[0]]
+        for timespan in timespans:
+            if not timespan.intersects_timespan(expected[0]):
+                expected = []
+                break
+            expected = expected[0] & timespan
+        result = abjad.TimespanList(timespans).compute_logical_and()
+        assert get_signature(result) == get_signature(expected)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+import abjad
+from timespantools_base import get_signature
+from timespantools_base import make_timespans
+
+
+def test_timespantools_TimespanList_compute_logical_or_01():
+    r'''Sweep matches pairwise fusing.
+    '''
+
+    for seed in range(20):
+        timespans = make_timespans(12, seed=seed)
+        expected = []
+        for timespan in timespans:
+            if expected and expected[-1]._can_fuse(timespan):
+                expected[-1:] = expected[-1] | timespan
+            else:
+                expected.append(timespan)
+        result = abjad.TimespanList(timespans).compute_logical_or()
+        assert get_signature(result) == get_signature(expected)
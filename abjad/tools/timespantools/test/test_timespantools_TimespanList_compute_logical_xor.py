@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import abjad
+from timespantools_base import get_signature
+from timespantools_base import make_timespans
+
+
+def _compute_logical_xor_pairwise(timespans):
+    all_fragments = []
+    for i, timespan_1 in enumerate(timespans):
+        timespan_1_fragments = [timespan_1]
+        for j, timespan_2 in enumerate(timespans):
+            if i == j:
+                continue
+            revised_timespan_1_fragments = []
+            for timespan_1_fragment in timespan_1_fragments:
+                if timespan_2.intersects_timespan(timespan_1_fragment):
+                    result = timespan_1_fragment - timespan_2
+                    revised_timespan_1_fragments.extend(result)
+                else:
+                    revised_timespan_1_fragments.append(timespan_1_fragment)
+            timespan_1_fragments = revised_timespan_1_fragments
+        all_fragments.extend(timespan_1_fragments)
+    return sorted(all_fragments)
+
+
+def test_timespantools_TimespanList_compute_logical_xor_01():
+    r'''Sweep matches pairwise fragment subtraction.
+    '''
+
+    for seed in range(20):
+        timespans = make_timespans(12, seed=seed)
+        expected = _compute_logical_xor_pairwise(timespans)
+        result = abjad.TimespanList(timespans).compute_logical_xor()
+        assert get_signature(result) == get_signature(expected)
+
+
+def test_timespantools_TimespanList_compute_logical_xor_02():
+    r'''Sweep matches pairwise fragment subtraction on many timespans.
+    '''
+
+    timespans = make_timespans(200)
+    expected = _compute_logical_xor_pairwise(timespans)
+    result = abjad.TimespanList(timespans).compute_logical_xor()
+    assert get_signature(result) == get_signature(expected)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import abjad
+import random
+from abjad.tools import timespantools
+
+
+def _make_timespans(count, seed=0):
+    random_ = random.Random(seed)
+    timespans = abjad.TimespanList()
+    for _ in range(count):
+        start_offset = random_.randint(0, count)
+        stop_offset = start_offset + random_.randint(0, 20)
+        timespans.append(abjad.Timespan(start_offset, stop_offset))
+    return timespans
+
+
+def _get_timespans_linearly(timespans, time_relation):
+    result = []
+    for timespan in timespans:
+        if isinstance(
+            time_relation,
+            timespantools.TimespanTimespanTimeRelation,
+            ):
+            if time_relation(timespan_2=timespan):
+                result.append(timespan)
+        elif time_relation(timespan=timespan):
+            result.append(timespan)
+    return result
+
+
+def _make_time_relations(seed=0):
+    random_ = random.Random(seed)
+    time_relations = []
+    for name in dir(timespantools):
+        if name.startswith('offset_happens'):
+            offset = abjad.Offset(random_.randint(-10, 210), 2)
+            time_relation = getattr(timespantools, name)(
+                offset=offset,
+                hold=True,
+                )
+        elif name.startswith('timespan_2_'):
+            start_offset = random_.randint(-10, 110)
+            stop_offset = start_offset + random_.randint(0, 20)
+            timespan = abjad.Timespan(start_offset, stop_offset)
+            time_relation = getattr(timespantools, name)(
+                timespan_1=timespan,
+                hold=True,
+                )
+        else:
+            continue
+        time_relations.append(time_relation)
+    return time_relations
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_01():
+    r'''Indexed queries match linear queries for all time relations.
+    '''
+
+    timespans = _make_timespans(100)
+    for seed in range(4):
+        for time_relation in _make_time_relations(seed):
+            expected = _get_timespans_linearly(timespans, time_relation)
+            result = timespans.get_timespans_that_satisfy_time_relation(
+                time_relation)
+            assert [id(_) for _ in result] == [id(_) for _ in expected]
+            assert timespans.has_timespan_that_satisfies_time_relation(
+                time_relation) == bool(expected)
+    assert timespans._index is not None
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_02():
+    r'''Changing timespan list updates index.
+    '''
+
+    timespans = _make_timespans(100)
+    timespans.sort()
+    timespan = abjad.Timespan(50, 60)
+    time_relation = timespantools.timespan_2_intersects_timespan_1(
+        timespan_1=timespan,
+        hold=True,
+        )
+
+    def check():
+        expected = _get_timespans_linearly(timespans, time_relation)
+        result = timespans.get_timespans_that_satisfy_time_relation(
+            time_relation)
+        assert list(result) == expected
+
+    check()
+    index = timespans._index
+    timespans.append(abjad.Timespan(110, 120))
+    timespans.append(abjad.Timespan(115, 125))
+    check()
+    assert timespans._index is index
+    timespans.append(abjad.Timespan(55, 56))
+    check()
+    assert timespans._index is not index
+    timespans.reverse()
+    check()
+    timespans.insert(0, abjad.Timespan(52, 53))
+    check()
+    del(timespans[10:20])
+    check()
+    timespans[:] = timespans[::2]
+    check()
+
+
+def test_timespantools_TimespanList_get_timespans_that_satisfy_time_relation_03():
+    r'''Indexed queries match linear queries on many timespans.
+    '''
+
+    timespans = _make_timespans(2000)
+    time_relations = []
+    for i in range(10):
+        timespan = abjad.Timespan(i * 200, i * 200 + 10)
+        time_relation = timespantools.timespan_2_intersects_timespan_1(
+            timespan_1=timespan,
+            hold=True,
+            )
+        time_relations.append(time_relation)
+
+    expected = [
+        _get_timespans_linearly(timespans, _)
+        for _ in time_relations
+        ]
+
+    result = [
+        list(timespans.get_timespans_that_satisfy_time_relation(_))
+        for _ in time_relations
+        ]
+
+    assert result == expected
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import abjad
+from timespantools_base import make_timespans
+
+
+def test_timespantools_TimespanList_partition_01():
+    r'''Partitions are sorted and separated by gaps.
+    '''
+
+    for seed in range(20):
+        timespans = make_timespans(12, seed=seed)
+        partitions = timespans.partition(include_tangent_timespans=True)
+        assert sum(len(_) for _ in partitions) == len(timespans)
+        for partition in partitions:
+            assert isinstance(partition, abjad.TimespanList)
+            assert partition.is_sorted
+        for partition_1, partition_2 in zip(partitions, partitions[1:]):
+            assert partition_1.stop_offset < partition_2.start_offset
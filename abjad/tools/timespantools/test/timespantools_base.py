@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import abjad
+import random
+
+
+def get_signature(timespans):
+    r'''Gets type, offsets and annotation of each timespan in `timespans`.
+    '''
+    return [
+        (
+            type(_).__name__,
+            _.start_offset,
+            _.stop_offset,
+            getattr(_, 'annotation', None),
+            )
+        for _ in timespans
+        ]
+
+
+def make_timespans(count, seed=0):
+    r'''Makes `count` random timespans and annotated timespans.
+    '''
+    random_ = random.Random(seed)
+    timespans = abjad.TimespanList()
+    for _ in range(count):
+        start_offset = abjad.Offset(random_.randint(0, count), 2)
+        stop_offset = start_offset + abjad.Offset(random_.randint(0, 8), 4)
+        if random_.randint(0, 3):
+            timespan = abjad.Timespan(start_offset, stop_offset)
+        else:
+            timespan = abjad.AnnotatedTimespan(
+                start_offset,
+                stop_offset,
+                annotation=random_.randint(0, 2),
+                )
+        timespans.append(timespan)
+    return timespans
@@ -76,6 +76,9 @@ def detach(prototype, component_expression=None):
                     ):
                     item._detach()
                     result.append(item.indicator)
+            if result and isinstance(component_expression, abjad.Component):
+                component_expression._effective_indicator_index = None
+                component_expression._clear_lilypond_format_bundles()
             result = tuple(result)
             return result
     else:
@@ -99,6 +102,9 @@ def detach(prototype, component_expression=None):
                     ):
                     item._detach()
                     result.append(item.indicator)
+            if result and isinstance(component_expression, abjad.Component):
+                component_expression._effective_indicator_index = None
+                component_expression._clear_lilypond_format_bundles()
             result = tuple(result)
             return result
     items = []
@@ -4,7 +4,7 @@
 _lilypond_parsers_by_language = {}
 
 
-def parse(string, language='english'):
+def parse(string, language='english', stream=False):
     r'''Parses LilyPond `string`.
 
     ::
@@ -32,10 +32,30 @@ def parse(string, language='english'):
             ...     )
             >>> show(container) # doctest: +SKIP
 
-    Returns Abjad component.
+    ..  container:: example
+
+        Parses LilyPond file one top-level statement at a time:
+
+        ::
+
+            >>> for item, seconds in abjad.parse( # doctest: +SKIP
+            ...     'score.ly',
+            ...     stream=True,
+            ...     ):
+            ...     print(type(item).__name__, seconds)
+
+        Set `stream` to true to treat `string` as the path to a LilyPond file
+        or as an open file. Items are yielded as soon as their top-level
+        statement has been read and parsed.
+
+    Returns Abjad component or, when `stream` is true, generator of item,
+    seconds pairs.
     '''
     from abjad.tools import rhythmtreetools
     from abjad.tools import lilypondparsertools
+    if stream:
+        parser = lilypondparsertools.LilyPondParser(default_language=language)
+        return parser.iterate_file(string)
     if string.startswith('abj:'):
         return lilypondparsertools.parse_reduced_ly_syntax(string[4:])
     elif string.startswith('rtm:'):
@@ -7,12 +7,16 @@ from abjad.tools import pitchtools
 from abjad.tools import rhythmmakertools
 from abjad.tools import scoretools
 from abjad.tools import templatetools
+from abjad.tools.topleveltools import attach
+from abjad.tools.topleveltools import detach
 from abjad.tools.topleveltools import iterate
 from experimental.tools.makertools.SegmentMaker import SegmentMaker
 
 
 class PianoStaffSegmentMaker(SegmentMaker):
     r'''Piano staff segment-maker.
+
+    Starts each staff in the clef of the previous segment.
     '''
 
     ### CLASS VARIABLES ###
@@ -97,6 +101,7 @@ class PianoStaffSegmentMaker(SegmentMaker):
         template = templatetools.TwoStaffPianoScoreTemplate()
         score = template()
         self._score = score
+        self._restore_persistent_clefs(score)
         self._add_time_signature_context(score)
         rh_voice = score['RH Voice']
         lh_voice = score['LH Voice']
@@ -104,6 +109,7 @@ class PianoStaffSegmentMaker(SegmentMaker):
         self._populate_rhythms(lh_voice, self.lh_rhythm_maker)
         self._populate_pitches(rh_voice, self.rh_pitch_range)
         self._populate_pitches(lh_voice, self.lh_pitch_range)
+        self._segment_metadata['measure_count'] = len(self.time_signatures)
         stylesheet_path = os.path.join(
             '..',
             '..',
@@ -144,6 +150,14 @@ class PianoStaffSegmentMaker(SegmentMaker):
         for selection in selections:
             voice.extend(selection)
 
+    def _restore_persistent_clefs(self, score):
+        for staff in iterate(score).by_class(scoretools.Staff):
+            clef = self._get_previous_persistent_indicator(staff.name, 'clef')
+            if clef is None:
+                continue
+            detach(indicatortools.Clef, staff)
+            attach(clef, staff)
+
     ### PUBLIC PROPERTIES ###
 
     @property
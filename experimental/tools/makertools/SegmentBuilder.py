@@ -0,0 +1,327 @@
+# -*- encoding: utf-8 -*-
+import multiprocessing
+import pickle
+from abjad.tools import scoretools
+from abjad.tools.abctools import AbjadObject
+
+
+class SegmentBuilder(AbjadObject):
+    r'''Segment-builder.
+
+    Builds segments in parallel and assembles segments into a single
+    LilyPond file.
+
+    ::
+
+        >>> import abjad
+        >>> from experimental.tools import makertools
+
+    ..  container:: example
+
+        ::
+
+            >>> segment_makers = [
+            ...     makertools.PianoStaffSegmentMaker(
+            ...         time_signatures=[(2, 4)],
+            ...         divisions=[(2, 4)],
+            ...         ),
+            ...     makertools.PianoStaffSegmentMaker(
+            ...         time_signatures=[(3, 4), (2, 4)],
+            ...         divisions=[(3, 4), (2, 4)],
+            ...         ),
+            ...     ]
+            >>> builder = makertools.SegmentBuilder(processes=1)
+            >>> lilypond_file, segment_metadatas = builder(segment_makers)
+            >>> for segment_metadata in segment_metadatas:
+            ...     segment_metadata['first_bar_number']
+            ...
+            1
+            2
+
+        ::
+
+            >>> segment_metadatas[-1]['persist']['LH Staff']
+            {'clef': "abjad.Clef(\n    name='bass',\n    )"}
+
+    Segment-makers read the end-state of the previous segment from the
+    ``persist`` entry of previous segment metadata. Segment-builder counts
+    first bar numbers from the time signatures of segment-makers and builds
+    every segment at once against previous segment metadata of the last
+    build. Builds without previous segment metadata first build every segment
+    at once against empty previous segment metadata. Segment-builder then
+    rebuilds at once those segments built against a stale end-state and
+    finally rebuilds, in order, those segments whose previous end-state has
+    still changed. Rebuilds with unchanged end-states therefore build each
+    segment exactly once.
+
+    Segment-makers travel to and from worker processes pickled with the
+    highest available pickle protocol.
+    '''
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        '_processes',
+        )
+
+    ### INITIALIZER ###
+
+    def __init__(self, processes=None):
+        if processes is not None:
+            processes = int(processes)
+            assert 0 < processes, repr(processes)
+        self._processes = processes
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, segment_makers, segment_metadatas=None):
+        r'''Calls segment-builder on `segment_makers`.
+
+        Reads previous segment metadata from `segment_metadatas` of last
+        build when `segment_metadatas` is not none.
+
+        Returns LilyPond file and list of segment metadata.
+        '''
+        segment_makers = list(segment_makers)
+        segment_count = len(segment_makers)
+        first_bar_numbers = self._get_first_bar_numbers(segment_makers)
+        lilypond_files = [None] * segment_count
+        previous_segment_metadatas = [None] * segment_count
+        if segment_metadatas is None:
+            segment_metadatas = [{} for _ in segment_makers]
+            pass_count = 2
+        else:
+            segment_metadatas = [dict(_ or {}) for _ in segment_metadatas]
+            pass_count = 1
+        assert len(segment_metadatas) == segment_count
+        pool = None
+        if self.processes != 1 and 1 < segment_count:
+            pool = multiprocessing.Pool(processes=self.processes)
+        try:
+            for _ in range(pass_count):
+                indices = [
+                    index for index in range(segment_count)
+                    if self._is_stale(
+                        index,
+                        lilypond_files,
+                        segment_metadatas,
+                        previous_segment_metadatas,
+                        first_bar_numbers,
+                        )
+                    ]
+                self._build_segments(
+                    segment_makers,
+                    segment_metadatas,
+                    first_bar_numbers,
+                    lilypond_files,
+                    previous_segment_metadatas,
+                    indices,
+                    pool=pool,
+                    )
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        for index in range(segment_count):
+            if self._is_stale(
+                index,
+                lilypond_files,
+                segment_metadatas,
+                previous_segment_metadatas,
+                first_bar_numbers,
+                ):
+                self._build_segments(
+                    segment_makers,
+                    segment_metadatas,
+                    first_bar_numbers,
+                    lilypond_files,
+                    previous_segment_metadatas,
+                    [index],
+                    )
+        lilypond_file = self._assemble_lilypond_files(lilypond_files)
+        return lilypond_file, segment_metadatas
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _assemble_lilypond_files(lilypond_files):
+        if not lilypond_files:
+            return
+        music = []
+        for lilypond_file in lilypond_files:
+            score_block = lilypond_file.score_block
+            if score_block is None:
+                continue
+            for item in score_block.items[:]:
+                if isinstance(item, scoretools.Component):
+                    score_block.items.remove(item)
+                    music.append(item)
+        lilypond_file = lilypond_files[0]
+        if lilypond_file.score_block is not None:
+            container = scoretools.Container(music)
+            lilypond_file.score_block.items.insert(0, container)
+        return lilypond_file
+
+    def _build_segments(
+        self,
+        segment_makers,
+        segment_metadatas,
+        first_bar_numbers,
+        lilypond_files,
+        previous_segment_metadatas,
+        indices,
+        pool=None,
+        ):
+        tasks = []
+        for index in indices:
+            task = self._make_task(
+                segment_makers,
+                segment_metadatas,
+                first_bar_numbers,
+                index,
+                )
+            previous_segment_metadatas[index] = task[2]
+            tasks.append(pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL))
+        if pool is None or len(tasks) < 2:
+            results = [_build_segment(_) for _ in tasks]
+        else:
+            results = pool.map(_build_segment, tasks)
+        for index, result in zip(indices, results):
+            lilypond_file, segment_metadata = pickle.loads(result)
+            lilypond_files[index] = lilypond_file
+            segment_metadatas[index] = segment_metadata
+
+    @staticmethod
+    def _get_end_state(segment_metadata, first_bar_numbers):
+        r'''Gets part of `segment_metadata` read by next segment-maker.
+
+        Next segment-maker reads only ``persist`` when first bar numbers are
+        counted from time signatures. Otherwise next segment-maker reads
+        all of `segment_metadata`.
+        '''
+        if first_bar_numbers is None:
+            return segment_metadata
+        return segment_metadata.get('persist')
+
+    @staticmethod
+    def _get_first_bar_numbers(segment_makers):
+        r'''Gets first bar number of each segment from time signatures of
+        `segment_makers`.
+
+        Returns list of positive integers or none when any segment-maker has
+        no time signatures.
+        '''
+        first_bar_numbers, first_bar_number = [], 1
+        for segment_maker in segment_makers:
+            time_signatures = getattr(segment_maker, 'time_signatures', None)
+            if time_signatures is None:
+                return None
+            first_bar_numbers.append(first_bar_number)
+            first_bar_number += len(time_signatures)
+        return first_bar_numbers
+
+    def _is_stale(
+        self,
+        index,
+        lilypond_files,
+        segment_metadatas,
+        previous_segment_metadatas,
+        first_bar_numbers,
+        ):
+        r'''Is true when segment at `index` is unbuilt or was built against
+        an end-state other than current end-state of previous segment.
+        '''
+        if lilypond_files[index] is None:
+            return True
+        previous_segment_metadata = {}
+        if 0 < index:
+            previous_segment_metadata = segment_metadatas[index - 1]
+        built_end_state = self._get_end_state(
+            previous_segment_metadatas[index],
+            first_bar_numbers,
+            )
+        end_state = self._get_end_state(
+            previous_segment_metadata,
+            first_bar_numbers,
+            )
+        return built_end_state != end_state
+
+    @staticmethod
+    def _make_segment_metadata(
+        segment_metadata,
+        previous_segment_metadata,
+        index,
+        segment_count,
+        first_bar_number=None,
+        ):
+        segment_metadata = dict(segment_metadata)
+        segment_metadata['segment_count'] = segment_count
+        segment_metadata['segment_number'] = index + 1
+        if first_bar_number is None:
+            first_bar_number = (
+                previous_segment_metadata.get('measure_count', 0) +
+                previous_segment_metadata.get('first_bar_number', 1)
+                )
+        segment_metadata['first_bar_number'] = first_bar_number
+        return segment_metadata
+
+    def _make_task(
+        self,
+        segment_makers,
+        segment_metadatas,
+        first_bar_numbers,
+        index,
+        ):
+        previous_segment_metadata = {}
+        if 0 < index:
+            previous_segment_metadata = segment_metadatas[index - 1]
+        first_bar_number = None
+        if first_bar_numbers is not None:
+            first_bar_number = first_bar_numbers[index]
+        segment_metadata = self._make_segment_metadata(
+            segment_metadatas[index],
+            previous_segment_metadata,
+            index,
+            len(segment_makers),
+            first_bar_number=first_bar_number,
+            )
+        return (
+            segment_makers[index],
+            segment_metadata,
+            previous_segment_metadata,
+            )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def processes(self):
+        r'''Gets number of worker processes.
+
+        ..  container:: example
+
+            ::
+
+                >>> makertools.SegmentBuilder(processes=4).processes
+                4
+
+        Defaults to none.
+
+        Set to positive integer or none.
+
+        Uses one worker process per CPU when none. Builds segments in the
+        calling process when 1.
+
+        Returns positive integer or none.
+        '''
+        return self._processes
+
+
+def _build_segment(pickled_task):
+    segment_maker, segment_metadata, previous_segment_metadata = \
+        pickle.loads(pickled_task)
+    lilypond_file, segment_metadata = segment_maker(
+        segment_metadata=segment_metadata,
+        previous_segment_metadata=previous_segment_metadata,
+        )
+    result = (lilypond_file, dict(segment_metadata))
+    return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
@@ -43,6 +43,8 @@ class SegmentMaker(AbjadObject):
         lilypond_file = self._make_lilypond_file()
         assert isinstance(lilypond_file, lilypondfiletools.LilyPondFile)
         self._lilypond_file = lilypond_file
+        persist = self._collect_persistent_indicators()
+        self._segment_metadata['persist'] = persist
         return self._lilypond_file, self._segment_metadata
 
     def __eq__(self, expr):
@@ -65,3 +67,55 @@ class SegmentMaker(AbjadObject):
         '''
         lilypond_file, metadata = self(**kwargs)
         return lilypond_file
+
+    ### PRIVATE METHODS ###
+
+    def _collect_persistent_indicators(self):
+        from abjad.tools import indicatortools
+        from abjad.tools import instrumenttools
+        from abjad.tools import scoretools
+        from abjad.tools.topleveltools import inspect
+        from abjad.tools.topleveltools import iterate
+        prototypes = (
+            ('clef', indicatortools.Clef),
+            ('instrument', instrumenttools.Instrument),
+            ('metronome_mark', indicatortools.MetronomeMark),
+            )
+        persist = {}
+        score_block = self._lilypond_file.score_block
+        if score_block is None:
+            return persist
+        for item in score_block.items:
+            if not isinstance(item, scoretools.Component):
+                continue
+            for context in iterate(item).by_class(scoretools.Context):
+                if context.name is None:
+                    continue
+                leaves = iterate(context).by_leaf(reverse=True)
+                last_leaf = next(leaves, None)
+                if last_leaf is None:
+                    continue
+                indicators = {}
+                for key, prototype in prototypes:
+                    wrapper = inspect(last_leaf).get_effective(
+                        prototype,
+                        unwrap=False,
+                        )
+                    if wrapper is None:
+                        continue
+                    if wrapper._get_effective_context() is not context:
+                        continue
+                    indicators[key] = format(wrapper.indicator)
+                if indicators:
+                    persist[context.name] = indicators
+        return persist
+
+    def _get_previous_persistent_indicator(self, context_name, key):
+        import abjad
+        persist = self._previous_segment_metadata.get('persist', {})
+        string = persist.get(context_name, {}).get(key)
+        if string is None:
+            return
+        namespace = abjad.__dict__.copy()
+        namespace['abjad'] = abjad
+        return eval(string, namespace, namespace)
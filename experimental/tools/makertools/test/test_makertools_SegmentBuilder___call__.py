@@ -0,0 +1,184 @@
+# -*- encoding: utf-8 -*-
+import abjad
+from experimental.tools import makertools
+
+
+class _ClefSegmentMaker(makertools.PianoStaffSegmentMaker):
+
+    __slots__ = ()
+
+    call_count = 0
+
+    def _make_lilypond_file(self):
+        _ClefSegmentMaker.call_count += 1
+        lilypond_file = makertools.PianoStaffSegmentMaker._make_lilypond_file(
+            self)
+        clef = self._get_previous_persistent_indicator('RH Staff', 'clef')
+        if clef is not None and clef.name == 'treble':
+            clef = abjad.Clef('alto')
+        else:
+            clef = abjad.Clef('treble')
+        staff = self._score['RH Staff']
+        abjad.detach(abjad.Clef, staff)
+        abjad.attach(clef, staff)
+        return lilypond_file
+
+
+class _CountingSegmentMaker(makertools.PianoStaffSegmentMaker):
+
+    __slots__ = ()
+
+    call_count = 0
+
+    def _make_lilypond_file(self):
+        _CountingSegmentMaker.call_count += 1
+        return makertools.PianoStaffSegmentMaker._make_lilypond_file(self)
+
+
+def _make_segment_makers(segment_count):
+    segment_makers = []
+    for i in range(segment_count):
+        time_signatures = [(3, 4)] * (i % 3 + 1)
+        segment_maker = _ClefSegmentMaker(
+            time_signatures=time_signatures,
+            divisions=[(1, 8)] * 6 * len(time_signatures),
+            )
+        segment_makers.append(segment_maker)
+    return segment_makers
+
+
+def test_makertools_SegmentBuilder___call___01():
+    r'''Parallel build equals sequential build.
+    '''
+
+    segment_makers = _make_segment_makers(5)
+    expected_metadatas, scores = [], []
+    previous_segment_metadata = {}
+    for i, segment_maker in enumerate(segment_makers):
+        segment_metadata = {
+            'segment_count': 5,
+            'segment_number': i + 1,
+            'first_bar_number': (
+                previous_segment_metadata.get('measure_count', 0) +
+                previous_segment_metadata.get('first_bar_number', 1)
+                ),
+            }
+        lilypond_file, segment_metadata = segment_maker(
+            segment_metadata=segment_metadata,
+            previous_segment_metadata=previous_segment_metadata,
+            )
+        previous_segment_metadata = dict(segment_metadata)
+        expected_metadatas.append(previous_segment_metadata)
+        scores.append(lilypond_file.score_block.items[0])
+    clefs = [
+        _['persist']['RH Staff']['clef'] for _ in expected_metadatas]
+    assert [_.count("'treble'") for _ in clefs] == [1, 0, 1, 0, 1]
+    assert [_['first_bar_number'] for _ in expected_metadatas] == \
+        [1, 2, 4, 7, 8]
+    expected_format = format(abjad.Container(scores))
+
+    for processes in (1, 2):
+        builder = makertools.SegmentBuilder(processes=processes)
+        lilypond_file, segment_metadatas = builder(segment_makers)
+        assert segment_metadatas == expected_metadatas
+        assert format(lilypond_file.score_block.items[0]) == expected_format
+        lilypond_file, segment_metadatas = builder(
+            segment_makers,
+            segment_metadatas,
+            )
+        assert segment_metadatas == expected_metadatas
+        assert format(lilypond_file.score_block.items[0]) == expected_format
+
+
+def test_makertools_SegmentBuilder___call___02():
+    r'''Rebuilds with unchanged end-states build each segment once.
+    '''
+
+    segment_makers = _make_segment_makers(6)
+    builder = makertools.SegmentBuilder(processes=1)
+    _ClefSegmentMaker.call_count = 0
+    lilypond_file, segment_metadatas = builder(segment_makers)
+    assert _ClefSegmentMaker.call_count == 13
+    _ClefSegmentMaker.call_count = 0
+    lilypond_file, segment_metadatas = builder(
+        segment_makers,
+        segment_metadatas,
+        )
+    assert _ClefSegmentMaker.call_count == 6
+    _ClefSegmentMaker.call_count = 0
+    segment_metadatas[3]['persist'] = {}
+    lilypond_file, segment_metadatas = builder(
+        segment_makers,
+        segment_metadatas,
+        )
+    assert _ClefSegmentMaker.call_count == 7
+    assert makertools.SegmentBuilder(processes=1)([]) == (None, [])
+
+
+def test_makertools_SegmentBuilder___call___03():
+    r'''Rebuilds after measure counts change build each segment once.
+    '''
+
+    segment_makers = _make_segment_makers(5)
+    builder = makertools.SegmentBuilder(processes=1)
+    lilypond_file, segment_metadatas = builder(segment_makers)
+    assert [_['first_bar_number'] for _ in segment_metadatas] == \
+        [1, 2, 4, 7, 8]
+
+    segment_makers[1] = _ClefSegmentMaker(
+        time_signatures=[(3, 4)] * 4,
+        divisions=[(1, 8)] * 24,
+        )
+    _ClefSegmentMaker.call_count = 0
+    lilypond_file, segment_metadatas = builder(
+        segment_makers,
+        segment_metadatas,
+        )
+    assert _ClefSegmentMaker.call_count == 5
+    assert [_['first_bar_number'] for _ in segment_metadatas] == \
+        [1, 2, 6, 9, 10]
+    assert segment_metadatas == builder(segment_makers)[1]
+
+
+def test_makertools_SegmentBuilder___call___04():
+    r'''Piano staff segment-makers start in clefs of previous segment.
+    '''
+
+    segment_makers = _make_segment_makers(2)
+    for _ in range(2):
+        segment_maker = makertools.PianoStaffSegmentMaker(
+            time_signatures=[(3, 4)],
+            divisions=[(3, 4)],
+            )
+        segment_makers.append(segment_maker)
+    for processes in (1, 2):
+        builder = makertools.SegmentBuilder(processes=processes)
+        lilypond_file, segment_metadatas = builder(segment_makers)
+        persists = [_['persist'] for _ in segment_metadatas]
+        clefs = [_['RH Staff']['clef'] for _ in persists]
+        assert [_.count("'alto'") for _ in clefs] == [0, 1, 1, 1]
+        clefs = [_['LH Staff']['clef'] for _ in persists]
+        assert [_.count("'bass'") for _ in clefs] == [1, 1, 1, 1]
+        assert format(lilypond_file).count(r'\clef "alto"') == 3
+
+
+def test_makertools_SegmentBuilder___call___05():
+    r'''Builds without previous segment metadata rebuild once those segments
+    built against a stale end-state.
+    '''
+
+    segment_makers = []
+    for i in range(6):
+        time_signatures = [(2, 4)] * (i % 3 + 1)
+        segment_maker = _CountingSegmentMaker(
+            time_signatures=time_signatures,
+            divisions=time_signatures,
+            )
+        segment_makers.append(segment_maker)
+    builder = makertools.SegmentBuilder(processes=1)
+    _CountingSegmentMaker.call_count = 0
+    lilypond_file, segment_metadatas = builder(segment_makers)
+    assert _CountingSegmentMaker.call_count == 11
+    _CountingSegmentMaker.call_count = 0
+    assert builder(segment_makers, segment_metadatas)[1] == segment_metadatas
+    assert _CountingSegmentMaker.call_count == 6